@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compares the dedicated lock file reader and writer
+with the poetry.lock template and the generic TOML parser.
+
+    python benchmarks/lock_file.py [number of packages]
+"""
+
+import hashlib
+import os
+import sys
+import timeit
+import toml
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from poet import lock_file
+from poet.utils.helpers import template
+
+
+def packages(count):
+    packages = []
+    for i in range(count):
+        packages.append({
+            'name': 'package-{}'.format(i),
+            'version': '1.{}.0'.format(i),
+            'category': 'main' if i % 3 else 'dev',
+            'optional': i % 5 == 0,
+            'checksum': [
+                'sha256:{}'.format(
+                    hashlib.sha256('{}-{}'.format(i, j).encode()).hexdigest()
+                )
+                for j in range(8)
+            ],
+            'python': ['*'],
+            'dependencies': [
+                'package-{}'.format(d) for d in range(max(0, i - 3), i)
+            ]
+        })
+
+    return packages
+
+
+def bench(name, func, number):
+    duration = min(timeit.repeat(func, number=number, repeat=3)) / number
+
+    print('{:<20} {:>10.2f} ms'.format(name, duration * 1000))
+
+
+def main(count):
+    lock_packages = packages(count)
+    features = {'extra': ['package-0', 'package-1']}
+    lock_template = template('poetry.lock')
+
+    content = lock_file.dumps('project', '1.0.0', lock_packages, features)
+    number = max(1, 2000 // count)
+
+    print('{} packages, {} bytes'.format(count, len(content)))
+    print('')
+
+    bench(
+        'template',
+        lambda: lock_template.render(
+            name='project', version='1.0.0',
+            packages=lock_packages, features=features
+        ),
+        number
+    )
+    bench(
+        'lock_file.dumps',
+        lambda: lock_file.dumps('project', '1.0.0', lock_packages, features),
+        number
+    )
+    bench('toml.loads', lambda: toml.loads(content), number)
+    bench('lock_file.loads', lambda: lock_file.loads(content), number)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -7,6 +7,11 @@ try:
 except ImportError:
     from pathlib2 import Path
 
+try:
+    from queue import Queue
+except ImportError:
+    from Queue import Queue
+
 PY2 = sys.version_info[0] == 2
 PY3K = sys.version_info[0] >= 3
 
@@ -4,6 +4,7 @@ from cleo import Application as BaseApplication
 
 from .commands import (
     AboutCommand,
+    CacheCommand,
     CheckCommand,
     InitCommand,
     InstallCommand,
@@ -27,6 +28,7 @@ class Application(BaseApplication):
 
         return default_commands + [
             AboutCommand(),
+            CacheCommand(),
             CheckCommand(),
             InitCommand(),
             InstallCommand(),
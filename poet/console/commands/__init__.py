@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from .about import AboutCommand
+from .cache import CacheCommand
 from .check import CheckCommand
 from .init import InitCommand
 from .install import InstallCommand
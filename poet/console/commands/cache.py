@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+import os
+
+from ...vcs import MirrorCache
+from ...wheel_cache import WheelCache
+
+from .command import Command
+
+
+class CacheCommand(Command):
+    """
+    Inspect and prune the shared wheel and git caches.
+
+    cache
+        { --prune : Remove the least recently used archives exceeding the maximum size and the unused git mirrors. }
+        { --clear : Remove every cached archive and git mirror. }
+        { --max-size= : Maximum size of the cache, in megabytes. }
+    """
+
+    help = """The <info>cache</info> command shows the archives stored
+in the wheel cache shared by every project,
+and the mirrors of git dependencies.
+
+<info>poet cache --prune --max-size 500</info>
+"""
+
+    def __init__(self):
+        super(CacheCommand, self).__init__()
+
+        self._cache = WheelCache()
+        self._mirrors = MirrorCache()
+
+    def handle(self):
+        removed = []
+        removed_mirrors = []
+
+        if self.option('clear'):
+            removed = self._cache.clear()
+            removed_mirrors = self._mirrors.clear()
+        elif self.option('prune'):
+            max_size = self.option('max-size')
+            if max_size is not None:
+                max_size = int(float(max_size) * 1024 * 1024)
+
+            removed = self._cache.prune(max_size)
+            removed_mirrors = self._mirrors.evict()
+
+        for _, archive, size, _ in removed:
+            self.line(
+                ' - Removed <info>{}</> (<comment>{}</>)'
+                .format(os.path.basename(archive), self._format_size(size))
+            )
+
+        entries = self._cache.entries()
+        if self.output.is_verbose():
+            for checksum, archive, size, _ in reversed(entries):
+                self.line(
+                    ' - <info>{}</> (<comment>{}</>) {}'
+                    .format(os.path.basename(archive), self._format_size(size), checksum)
+                )
+
+        self.line(
+            '<info>{}</> archives (<comment>{}</>) in <comment>{}</>'
+            .format(
+                len(entries),
+                self._format_size(sum(e[2] for e in entries)),
+                self._cache.path
+            )
+        )
+
+        if removed_mirrors:
+            self.line(
+                ' - Removed <comment>{}</> git mirrors'
+                .format(len(removed_mirrors))
+            )
+
+        self.line(
+            '<info>{}</> git mirrors in <comment>{}</>'
+            .format(len(self._mirrors.entries()), self._mirrors.path)
+        )
+
+    def _format_size(self, size):
+        if size < 1024:
+            return '{} B'.format(size)
+
+        for unit in ['KB', 'MB', 'GB']:
+            size /= 1024.0
+            if size < 1024 or unit == 'GB':
+                return '{:.1f} {}'.format(size, unit)
@@ -16,3 +16,17 @@ class CheckCommand(Command):
         self.poet.check()
 
         self.info('The <comment>poetry.toml</> file is valid!')
+
+        if not self.has_lock():
+            return
+
+        if not self.poet.is_lock_fresh():
+            self.line(
+                '<warning>The <comment>poetry.lock</> file is not up to date '
+                'with the <comment>poetry.toml</> file. '
+                'Run <comment>poet lock</> to update it.</>'
+            )
+
+            return 1
+
+        self.info('The <comment>poetry.lock</> file is up to date.')
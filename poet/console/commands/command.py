@@ -4,11 +4,13 @@ import os
 import sys
 import glob
 import distutils
+import distutils.sysconfig
 import re
 
 from cleo import Command as BaseCommand
 from semantic_version import Version
 
+from ...parse_cache import ParseCache
 from ...poet import Poet
 from ...utils.helpers import call
 
@@ -35,7 +37,10 @@ class Command(BaseCommand):
         :rtype: poet.poet.Poet
         """
         if self._poet is None:
-            self._poet = Poet(self.poet_file)
+            self._poet = Poet(
+                self.poet_file,
+                parse_cache=ParseCache(ParseCache.DEFAULT_SNAPSHOT_PATH)
+            )
 
         return self._poet
 
@@ -100,6 +105,22 @@ class Command(BaseCommand):
                 'site-packages'
             )
 
+    def site_packages(self):
+        """
+        Return the site-packages directories packages are installed to.
+
+        :rtype: list
+        """
+        if self._virtual_env:
+            return [self._virtual_env]
+
+        paths = [
+            distutils.sysconfig.get_python_lib(),
+            distutils.sysconfig.get_python_lib(plat_specific=True)
+        ]
+
+        return sorted(set(paths), key=paths.index)
+
     def pip(self):
         if not self._virtual_env:
             return distutils.spawn.find_executable('pip')
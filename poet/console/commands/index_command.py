@@ -1,8 +1,12 @@
 # -*- coding: utf-8 -*-
 
+import json
+
 from cleo import InputOption
+from cleo.outputs import Output
 
-from ...repositories import PyPiRepository
+from ...repositories import MetadataCache, PyPiRepository
+from ...resolution import Prefetcher, PyPiMetadataProvider, Resolver
 
 from .command import Command
 
@@ -24,10 +28,57 @@ class IndexCommand(Command):
             'The index to use'
         )
 
+        # Adding --offline option
+        self.add_option(
+            'offline', None,
+            InputOption.VALUE_NONE,
+            'Only use the cached metadata of packages'
+        )
+
     def execute(self, i, o):
-        super(IndexCommand, self).execute(i, o)
+        # The repository must be set up before handling the command
+        index = self.option('index') or PyPiRepository.DEFAULT_URL
+        cache = MetadataCache(offline=self.option('offline'))
+
+        self._repository = PyPiRepository(index, cache=cache)
+
+        return super(IndexCommand, self).execute(i, o)
+
+    def native_resolver(self):
+        """
+        Return the poet resolver if requested, None otherwise.
+
+        :rtype: poet.resolution.Resolver or None
+        """
+        if not self.option('native-resolver'):
+            return
 
-        index = self.option('index')
+        provider = PyPiMetadataProvider(self._repository)
+
+        return Resolver(provider, prefetcher=Prefetcher(provider))
+
+    def export_plan(self, run):
+        """
+        Run an installer operation silently
+        and output the returned plan as JSON.
+
+        :param run: The operation, returning a plan
+        :type run: callable
+
+        :rtype: poet.plan.Plan
+        """
+        verbosity = self.output.get_verbosity()
+        self.output.set_verbosity(Output.VERBOSITY_QUIET)
+
+        try:
+            plan = run()
+        finally:
+            self.output.set_verbosity(verbosity)
+
+        self.output.write(
+            json.dumps(plan.as_dict(), indent=4, sort_keys=True),
+            newline=True,
+            type=Output.OUTPUT_RAW
+        )
 
-        if index:
-            self._repository = PyPiRepository(index)
+        return plan
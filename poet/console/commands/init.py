@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 
 import os
-import re
 
 from collections import OrderedDict
 from pygments import highlight
@@ -11,8 +10,9 @@ from .index_command import IndexCommand
 from ...version_parser import VersionParser
 from ...version_selector import VersionSelector
 from ...utils.lexers import TOMLLexer
-from ...utils.helpers import call, template
+from ...utils.helpers import template
 from ...build import Builder
+from ...vcs import GitConfig
 
 
 class InitCommand(IndexCommand):
@@ -76,7 +76,6 @@ in the current directory.
         ])
 
         poet_file = self.poet_file
-        git_config = self.git_config()
 
         name = self.option('name')
         if not name:
@@ -107,8 +106,11 @@ in the current directory.
 
         author = self.option('author')
 
-        if not author and git_config.get('user.name') and git_config.get('user.email'):
-            author = '{} <{}>'.format(git_config['user.name'], git_config['user.email'])
+        if not author:
+            git_config = self.git_config()
+
+            if git_config.get('user.name') and git_config.get('user.email'):
+                author = '{} <{}>'.format(git_config['user.name'], git_config['user.email'])
 
         question = self.create_question(
             'Author [<comment>{}</comment>, n to skip]: '
@@ -310,13 +312,7 @@ in the current directory.
         return parser.parse_name_version_pairs(requirements)
 
     def git_config(self):
-        config_list = call(['git', 'config', '-l'])
-
-        git_config = {}
-
-        m = re.findall('(?ms)^([^=]+)=(.*?)$', config_list)
-        if m:
-            for group in m:
-                git_config[group[0]] = group[1]
+        if self._git_config is None:
+            self._git_config = GitConfig()
 
-        return git_config
+        return self._git_config
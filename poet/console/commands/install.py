@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from ...installer import Installer
+from ...wheel_cache import WheelCache
 
 from .index_command import IndexCommand
 
@@ -13,6 +14,13 @@ class InstallCommand(IndexCommand):
         { --f|features=* : Features to install. }
         { --no-dev : Do not install dev dependencies. }
         { --no-progress : Do not output download progress. }
+        { --j|jobs=1 : Number of packages to install in parallel. }
+        { --batch : Install packages with a single pip invocation. }
+        { --require-hashes : Verify packages against the locked checksums. }
+        { --wheel-cache : Install packages from the shared wheel cache. }
+        { --native-resolver : Resolve dependencies with the experimental poet resolver. }
+        { --dry-run : Only display the packages to install, without installing them. }
+        { --json : Output the packages to install as JSON. Implies --dry-run. }
     """
 
     def handle(self):
@@ -25,9 +33,44 @@ class InstallCommand(IndexCommand):
 
         dev = not self.option('no-dev')
 
+        try:
+            jobs = int(self.option('jobs'))
+        except ValueError:
+            jobs = 0
+
+        if jobs < 1:
+            self.line(
+                '<error>The --jobs option must be a positive integer, '
+                'got [{}]</>'.format(self.option('jobs'))
+            )
+
+            return 1
+
+        if jobs > 1 and (
+            self.option('batch')
+            or self.option('require-hashes')
+            or self.option('wheel-cache')
+        ):
+            self.line(
+                '<warning>The --jobs option is ignored with the --batch, '
+                '--require-hashes and --wheel-cache options.</>'
+            )
+
         installer = Installer(
             self, self._repository,
-            with_progress=not self.option('no-progress')
+            with_progress=not self.option('no-progress'),
+            jobs=jobs,
+            batch=self.option('batch'),
+            require_hashes=self.option('require-hashes'),
+            cache=WheelCache() if self.option('wheel-cache') else None,
+            resolver=self.native_resolver()
         )
 
-        installer.install(features=features, dev=dev)
+        if self.option('json'):
+            self.export_plan(
+                lambda: installer.install(features=features, dev=dev, dry_run=True)
+            )
+
+            return
+
+        installer.install(features=features, dev=dev, dry_run=self.option('dry-run'))
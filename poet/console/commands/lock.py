@@ -11,16 +11,24 @@ class LockCommand(IndexCommand):
 
     lock
         {--f|force : Force locking}
+        { --incremental : Keep the locked versions still satisfying the requirements. }
         { --no-progress : Do not output download progress. }
+        { --native-resolver : Resolve dependencies with the experimental poet resolver. }
     """
 
     def handle(self):
-        if self.has_lock() and not self.option('force'):
+        incremental = self.option('incremental')
+
+        if not self.option('force') and not incremental and self.poet.is_lock_fresh():
+            self.line('')
+            self.info('The <comment>poetry.lock</> file is up to date.')
+
             return
 
         installer = Installer(
             self, self._repository,
-            with_progress=not self.option('no-progress')
+            with_progress=not self.option('no-progress'),
+            resolver=self.native_resolver()
         )
 
-        installer.lock(self.poet)
+        installer.lock(incremental=incremental)
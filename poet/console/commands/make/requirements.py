@@ -16,15 +16,21 @@ class MakeRequirementsCommand(IndexCommand):
     """
 
     def handle(self):
-        installer = Installer(self, self._repository)
+        self.line('')
 
-        deps = self.poet.pip_dependencies
+        if self.poet.is_lock_fresh():
+            # The lock reflects the poetry.toml file, no need to resolve
+            self.line(' - Using the <comment>poetry.lock</> file')
+            packages = self._locked_packages()
+        else:
+            installer = Installer(self, self._repository)
 
-        if not self.option('no-dev'):
-            deps += self.poet.pip_dev_dependencies
+            deps = self.poet.pip_dependencies
 
-        self.line('')
-        packages = installer.resolve(deps)
+            if not self.option('no-dev'):
+                deps = deps + self.poet.pip_dev_dependencies
+
+            packages = installer.resolve(deps)
 
         requirements = os.path.join(self.poet.base_dir, 'requirements.txt')
 
@@ -39,3 +45,12 @@ class MakeRequirementsCommand(IndexCommand):
                 f.write(version + '\n')
 
         self.line(' - Created <info>requirements.txt</> file')
+
+    def _locked_packages(self):
+        lock = self.poet.lock
+
+        deps = lock.pip_dependencies
+        if not self.option('no-dev'):
+            deps = deps + lock.pip_dev_dependencies
+
+        return [{'name': dep.name, 'version': dep.constraint} for dep in deps]
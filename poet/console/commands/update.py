@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from ...installer import Installer
+from ...wheel_cache import WheelCache
 
 from .index_command import IndexCommand
 
@@ -13,13 +14,23 @@ class UpdateCommand(IndexCommand):
         { packages?* : The packages to update }
         { --f|features=* : Features to install }
         { --no-progress : Do not output download progress. }
+        { --batch : Install packages with a single pip invocation. }
+        { --require-hashes : Verify packages against the locked checksums. }
+        { --wheel-cache : Install packages from the shared wheel cache. }
+        { --native-resolver : Resolve dependencies with the experimental poet resolver. }
+        { --dry-run : Only display the actions to execute, without executing them. }
+        { --json : Output the actions to execute as JSON. Implies --dry-run. }
     """
 
     def handle(self):
         if not self.has_lock():
             # We do not have a lock file
             # Assuming installation
-            return self.call('install', [('--features', self.option('features'))])
+            return self.call('install', [
+                ('--features', self.option('features')),
+                ('--dry-run', self.option('dry-run')),
+                ('--json', self.option('json'))
+            ])
 
         features = []
         for feature in self.option('features'):
@@ -30,7 +41,26 @@ class UpdateCommand(IndexCommand):
 
         installer = Installer(
             self, self._repository,
-            with_progress=not self.option('no-progress')
+            with_progress=not self.option('no-progress'),
+            batch=self.option('batch'),
+            require_hashes=self.option('require-hashes'),
+            cache=WheelCache() if self.option('wheel-cache') else None,
+            resolver=self.native_resolver()
         )
 
-        installer.update(packages=self.argument('packages'), features=features)
+        packages = self.argument('packages')
+
+        if self.option('json'):
+            self.export_plan(
+                lambda: installer.update(
+                    packages=packages, features=features, dry_run=True
+                )
+            )
+
+            return
+
+        installer.update(
+            packages=packages,
+            features=features,
+            dry_run=self.option('dry-run')
+        )
@@ -0,0 +1,6 @@
+# -*- coding: utf-8 -*-
+
+
+class ResolutionError(Exception):
+
+    pass
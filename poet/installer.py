@@ -1,36 +1,64 @@
 # -*- coding: utf-8 -*-
 
+import contextlib
+import functools
 import tempfile
+import time
 
 import os
 import shutil
 import subprocess
 
+from collections import deque, OrderedDict
 from packaging.utils import canonicalize_name
-from pip.download import unpack_url
-from pip.index import Link
 from piptools.resolver import Resolver
 from piptools.repositories import PyPIRepository
 from piptools.scripts.compile import get_pip_command
 from piptools.cache import DependencyCache
 from piptools.utils import is_pinned_requirement, key_from_req
 
+from . import lock_file
+from ._compat import Path
 from .locations import CACHE_DIR
-from .package.pip_dependency import PipDependency
-from .utils.helpers import call, template
+from .lock import Lock
+from .package import PipDependency, PythonFilter
+from .plan import Action, diff
+from .pool import Pool
+from .repositories import InstalledRepository, LockedRepository
+from .utils.helpers import call
+from .vcs import Git, MirrorCache
 
 
 class Installer(object):
 
     UNSAFE = ['setuptools']
 
-    def __init__(self, command, repository, with_progress=False):
+    def __init__(self, command, repository, with_progress=False, jobs=1,
+                 batch=False, require_hashes=False, cache=None,
+                 resolver=None):
         self._command = command
         self._poet = command.poet
         self._repository = repository
         self._with_progress = with_progress
+        self._jobs = jobs
+        self._batch = batch
+        self._require_hashes = require_hashes
+        self._cache = cache
+        self._resolver = resolver
+        self._mirrors = MirrorCache()
+        self._git = Git(mirrors=self._mirrors)
+        self._timings = OrderedDict()
+
+    @property
+    def timings(self):
+        """
+        The time spent in each phase, in seconds.
+
+        :rtype: OrderedDict
+        """
+        return self._timings
 
-    def install(self, features=None, dev=True):
+    def install(self, features=None, dev=True, dry_run=False):
         """
         Install packages defined in configuration files.
         
@@ -42,8 +70,12 @@ class Installer(object):
         
         :param dev: Whether to install dev dependencies or not
         :type dev: bool
+
+        :param dry_run: Whether to only display the actions
+                        without executing them nor writing the lock file.
+        :type dry_run: bool
         
-        :rtype: None 
+        :rtype: poet.plan.Plan or None
         """
         if not os.path.exists(self._poet.lock_file):
             if features:
@@ -54,11 +86,30 @@ class Installer(object):
                             .format(feature)
                         )
 
-            self.lock(dev=dev)
+            if not dry_run:
+                self.lock(dev=dev)
 
-            return self.install(features=features, dev=dev)
+                return self.install(features=features, dev=dev)
+
+            deps = self._poet.pip_dependencies
+            if dev:
+                deps = deps + self._poet.pip_dev_dependencies
+
+            # Locking in memory only
+            lock = self._load_lock(
+                self.resolve(deps), self._get_features(), complete=dev
+            )
+        else:
+            lock = self._poet.lock
+
+            if lock.fingerprint not in (None, self._poet.fingerprint):
+                self._command.line('')
+                self._command.line(
+                    '<warning>The <comment>poetry.lock</> file is not up to date '
+                    'with the <comment>poetry.toml</> file. '
+                    'Run <comment>poet lock</> to update it.</>'
+                )
 
-        lock = self._poet.lock
         if features:
             for feature in features:
                 if feature not in lock.features:
@@ -74,7 +125,7 @@ class Installer(object):
         deps = lock.pip_dependencies
 
         if dev:
-            deps += lock.pip_dev_dependencies
+            deps = deps + lock.pip_dev_dependencies
 
         featured_packages = set()
         for feature, packages in lock.features.items():
@@ -82,52 +133,215 @@ class Installer(object):
                 for package in packages:
                     featured_packages.add(canonicalize_name(package))
 
-        for dep in deps:
-            name = dep.name
+        with self._timed('scan'):
+            installed = InstalledRepository(self._command.site_packages())
 
-            # Package is optional but is not featured
-            if dep.optional and name not in featured_packages:
-                continue
+            # Optional packages are only installed if featured
+            deps = [
+                dep for dep in deps
+                if not dep.optional or dep.name in featured_packages
+            ]
 
-            # Checking Python version
-            if dep.is_python_restricted():
+            if any(dep.is_python_restricted() for dep in deps):
                 python_version = self._command.python_version
-                if not any([python_version in python for python in dep.python]):
-                    # If the package is not compatible
-                    # with the current Python version
-                    # we do not install
-                    if self._command.output.is_verbose():
+                deps, incompatible = PythonFilter(python_version).partition(deps)
+
+                # Packages not compatible with
+                # the current Python version are not installed
+                if self._command.output.is_verbose():
+                    for dep in incompatible:
                         self._command.line(
                             ' - Skipping <info>{}</> '
                             '(Specifies Python <comment>{}</> and current Python is <comment>{}</>)'
-                            .format(name, ','.join([str(p) for p in dep.python]), python_version)
+                            .format(dep.name, ','.join([str(p) for p in dep.python]), python_version)
+                        )
+
+            installs = []
+            for dep in deps:
+                name = dep.name
+
+                # Package is already installed
+                if not dep.is_vcs_dependency() and installed.is_installed(name, dep.constraint):
+                    if self._command.output.is_verbose():
+                        self._command.line(
+                            ' - Skipping <info>{}</> (<comment>{}</>) '
+                            '(Already installed)'
+                            .format(name, self._pretty_constraint(dep))
                         )
                     continue
 
+                installs.append(dep)
+
+        with self._timed('diff'):
+            plan = diff(installs, self._get_installed_deps(installs, installed), delete=False)
+
+        plan.timings.update(self._timings)
+
+        if not installs:
+            self._command.line(' - <info>Dependencies already installed!</info>')
+
+            return plan
+
+        if dry_run:
+            self._render_plan(plan)
 
-            cmd = [self._command.pip(), 'install', dep.normalized_name]
+            return plan
+
+        if self._is_batched():
+            self._execute_batch([('install', None, dep) for dep in installs])
+        elif self._jobs > 1:
+            self._install_parallel(installs)
+        else:
+            for dep in installs:
+                cmd = [self._command.pip(), 'install', self._requirement(dep)]
+
+                if dep.is_vcs_dependency():
+                    # VCS must be updated to be installed
+                    cmd.append('-U')
+
+                name = dep.name
+                constraint = self._pretty_constraint(dep)
+
+                message = (
+                    ' - Installing <info>{}</> (<comment>{}</>)'
+                    .format(name, constraint)
+                )
+                end_message  = (
+                    'Installed <info>{}</> (<comment>{}</>)'
+                    .format(name, constraint)
+                )
+                error_message = 'Error while installing [{}]'.format(name)
+
+                self._progress(cmd, message[3:], end_message, message, error_message)
+
+        return plan
+
+    def _install_parallel(self, deps):
+        """
+        Install locked dependencies using a pool of workers.
+
+        A package is only installed once all its locked
+        dependencies have been installed. Since the lock file
+        holds the whole dependency set, pip is told not to
+        install dependencies by itself so that workers
+        do not step on each other's toes.
+
+        The dependencies of VCS packages are not locked,
+        so they are installed one by one, with their dependencies,
+        once every other package has been installed.
+
+        :param deps: The dependencies to install
+        :type deps: list[poet.package.PipDependency]
+
+        :rtype: None
+        """
+        tasks = {}
+        by_name = {}
+        vcs_deps = []
+        for dep in deps:
+            by_name[dep.name] = dep
 
             if dep.is_vcs_dependency():
-                constraint = dep.pretty_constraint
+                vcs_deps.append(dep)
 
-                # VCS must be updated to be installed
-                cmd.append('-U')
-            else:
-                constraint = dep.constraint.replace('==', '')
+                continue
 
-            message = (
-                ' - Installing <info>{}</> (<comment>{}</>)'
-                .format(name, constraint)
-            )
-            end_message  = (
-                'Installed <info>{}</> (<comment>{}</>)'
-                .format(name, constraint)
+            cmd = [self._command.pip(), 'install', self._requirement(dep), '--no-deps']
+
+            error_message = 'Error while installing [{}]'.format(dep.name)
+
+            tasks[dep.name] = (
+                dep.dependencies,
+                lambda cmd=cmd, error_message=error_message: self._call(cmd, error_message)
             )
-            error_message = 'Error while installing [{}]'.format(name)
 
-            self._progress(cmd, message[3:], end_message, message, error_message)
+        def report(name, _, error):
+            dep = by_name[name]
+            if error is None:
+                self._command.line(
+                    ' - Installed <info>{}</> (<comment>{}</>)'
+                    .format(name, self._pretty_constraint(dep))
+                )
+            else:
+                self._command.line(
+                    ' - <error>Failed</> installing <info>{}</> (<comment>{}</>)'
+                    .format(name, self._pretty_constraint(dep))
+                )
+
+        pool = Pool(self._jobs)
+        failures, skipped = pool.run(tasks, callback=report)
+
+        if failures:
+            summary = ['Error while installing {} package(s):'.format(len(failures))]
+            for name, error in failures:
+                summary.append(' - {}'.format(error))
+
+            if skipped:
+                summary.append(
+                    'The following packages have not been installed: {}'
+                    .format(', '.join(skipped))
+                )
+
+            raise Exception('\n'.join(summary))
+
+        for dep in vcs_deps:
+            # VCS must be updated to be installed,
+            # without upgrading the locked packages
+            cmd = [
+                self._command.pip(), 'install', self._requirement(dep),
+                '-U', '--upgrade-strategy', 'only-if-needed'
+            ]
+
+            self._call(cmd, 'Error while installing [{}]'.format(dep.name))
+            report(dep.name, None, None)
+
+    def _requirement(self, dep):
+        """
+        Return the requirement to pass to pip to install a dependency.
+
+        VCS dependencies are installed from their mirror
+        so that only new objects are fetched from the remote.
+
+        :type dep: poet.package.PipDependency
+
+        :rtype: str
+        """
+        if not dep.is_vcs_dependency():
+            return dep.normalized_name
+
+        url, specifier = dep.normalized_constraint.rsplit('@', 1)
+        mirror = self._mirrors.mirror(url)
+
+        return 'git+{}@{}'.format(Path(mirror).as_uri(), specifier)
+
+    def _is_batched(self):
+        return self._batch or self._require_hashes or self._cache is not None
+
+    def _pretty_constraint(self, dep):
+        if dep.is_vcs_dependency():
+            return dep.pretty_constraint
+
+        return dep.constraint.replace('==', '')
+
+    def update(self, packages=None, features=None, dev=True, dry_run=False):
+        """
+        Update dependencies and lock them.
+
+        :param packages: The packages to update, all if empty
+        :type packages: list or None
 
-    def update(self, packages=None, features=None, dev=True):
+        :param features: Features to install
+        :type features: list or None
+
+        :param dev: Whether to update dev dependencies or not
+        :type dev: bool
+
+        :param dry_run: Whether to only display the actions
+                        without executing them nor writing the lock file.
+        :type dry_run: bool
+
+        :rtype: poet.plan.Plan
+        """
         if self._poet.is_lock():
             raise Exception('Update is only available with a poetry.toml file.')
 
@@ -142,12 +356,12 @@ class Installer(object):
         lock = self._poet.lock
         current_deps = lock.pip_dependencies
         if dev:
-            current_deps += lock.pip_dev_dependencies
+            current_deps = current_deps + lock.pip_dev_dependencies
 
         # Resolving new dependencies and locking them
         deps = self._poet.pip_dependencies
         if dev:
-            deps += self._poet.pip_dev_dependencies
+            deps = deps + self._poet.pip_dev_dependencies
 
         featured_packages = set()
         for feature, _packages in self._poet.features.items():
@@ -156,6 +370,7 @@ class Installer(object):
                     featured_packages.add(canonicalize_name(package))
 
         # Removing optional packages unless they are featured packages
+        requested = len(deps)
         deps = [
             dep
             for dep in deps
@@ -163,29 +378,86 @@ class Installer(object):
                or dep.optional and dep.name in featured_packages
         ]
 
+        # Partial locks do not reflect the poetry.toml file
+        complete = dev and len(deps) == requested
+
+        pins = None
         if packages:
-            packages = [p for p in self.resolve(deps) if p['name'] in packages]
-        else:
-            packages = self.resolve(deps)
+            # Every package is kept at its locked version
+            # except the requested ones and their exclusive dependencies
+            unlocked = self._get_unlocked_packages(
+                [canonicalize_name(p) for p in packages], deps, current_deps
+            )
+            pins = [p for p in self._get_pins(lock) if p.name not in unlocked]
 
-        deps = [PipDependency(p['name'], p['version']) for p in packages]
+        packages = self.resolve(deps, pins=pins)
 
-        delete = not packages and not features
-        actions = self._resolve_update_actions(deps, current_deps, delete=delete)
+        deps = [
+            PipDependency.create(
+                p['name'], p['version'],
+                checksum=p['checksum'],
+                dependencies=p['dependencies']
+            )
+            for p in packages
+        ]
+
+        delete = not features
+        with self._timed('diff'):
+            plan = diff(deps, current_deps, delete=delete)
+
+        plan.timings.update(self._timings)
 
-        if not actions:
+        if not plan:
             self._command.line(' - <info>Dependencies already up-to-date!</info>')
 
-            return
+            return plan
+
+        if dry_run:
+            self._render_plan(plan)
+
+            return plan
+
+        self._render_summary(plan)
+
+        error = False
+        if self._is_batched():
+            self._execute_batch(plan.actions)
+        else:
+            for action, from_, dep in plan:
+                self._execute(action, from_, dep)
+
+        if not error:
+            # If everything went well, we write down the lock file
+            self._write_lock(packages, self._get_features(), complete=complete)
+
+        return plan
 
-        installs = len([a for a in actions if a[0] == 'install'])
-        updates = len([a for a in actions if a[0] == 'update'])
-        uninstalls = len([a for a in actions if a[0] == 'remove'])
+    def _render_plan(self, plan):
+        self._render_summary(plan)
+
+        for action in plan:
+            self._command.line(
+                ' - Would {} <info>{}</> ({})'
+                .format(
+                    action.kind,
+                    action.name,
+                    self._pretty_action_version(action.from_, action.dep)
+                )
+            )
+
+    def _render_summary(self, plan):
+        installs = plan.count(Action.INSTALL)
+        updates = plan.count(Action.UPDATE)
+        downgrades = plan.count(Action.DOWNGRADE)
+        uninstalls = plan.count(Action.REMOVE)
 
         summary = []
         if updates:
             summary.append('<comment>{}</> updates'.format(updates))
 
+        if downgrades:
+            summary.append('<comment>{}</> downgrades'.format(downgrades))
+
         if installs:
             summary.append('<comment>{}</> installations'.format(installs))
 
@@ -199,54 +471,296 @@ class Installer(object):
 
         self._command.line(' - Summary: {}'.format(summary))
 
-        error = False
+    def _execute(self, action, from_, dep):
+        cmd = [self._command.pip()]
+        description = 'Installing'
+
+        if action == 'remove':
+            description = 'Removing'
+            cmd += ['uninstall', dep.normalized_name, '-y']
+        elif action in ('update', 'downgrade'):
+            description = 'Updating' if action == 'update' else 'Downgrading'
+            cmd += ['install', self._requirement(dep), '-U']
+        else:
+            cmd += ['install', self._requirement(dep)]
+
+        name = dep.name
+        version = self._pretty_action_version(from_, dep)
+
+        message = ' - {} <info>{}</> ({})'.format(description, name, version)
+        start_message = message[3:]
+        end_message = '{} <info>{}</> ({})'.format(description.replace('ing', 'ed'), name, version)
+        error_message = 'Error while {} [{}]'.format(description.lower(), name)
+
+        self._progress(cmd, start_message, end_message, message, error_message)
+
+    def _execute_batch(self, actions):
+        """
+        Execute update actions with as few pip invocations as possible.
+
+        Removals are done by one "pip uninstall" call,
+        installations and updates by one "pip install" call
+        using a generated requirements file.
+
+        VCS dependencies must be installed with the "-U" flag,
+        so they are still installed one by one.
+
+        :param actions: The actions to execute
+        :type actions: list[tuple]
+
+        :rtype: None
+        """
+        removals = [a for a in actions if a[0] == 'remove']
+        installs = [a for a in actions if a[0] != 'remove' and not a[2].is_vcs_dependency()]
+        vcs_installs = [a for a in actions if a[0] != 'remove' and a[2].is_vcs_dependency()]
+
+        if removals:
+            cmd = [self._command.pip(), 'uninstall', '-y']
+            cmd += [dep.normalized_name for _, _, dep in removals]
+
+            self._progress(
+                cmd,
+                'Removing <comment>{}</> packages'.format(len(removals)),
+                'Removed <comment>{}</> packages'.format(len(removals)),
+                ' - Removing <comment>{}</> packages'.format(len(removals)),
+                'Error while removing packages'
+            )
+
+            for _, from_, dep in removals:
+                self._command.line(
+                    ' - Removed <info>{}</> ({})'
+                    .format(dep.name, self._pretty_action_version(from_, dep))
+                )
+
+        if installs:
+            self._install_requirements(installs)
+
+        for action, from_, dep in vcs_installs:
+            self._execute(action, from_, dep)
+
+    def _install_requirements(self, actions):
+        """
+        Install the given dependencies through a single pip call.
+
+        When hashes are required, the locked checksums are passed
+        to pip which verifies every downloaded archive. Since the lock
+        holds the whole dependency set, pip does not need
+        to resolve dependencies again.
+
+        :param actions: The install or update actions
+        :type actions: list[tuple]
+
+        :rtype: None
+        """
+        deps = [dep for _, _, dep in actions]
+        cmd = [self._command.pip(), 'install']
+
+        if self._require_hashes:
+            for dep in deps:
+                if not dep.checksum:
+                    raise Exception(
+                        'Package [{}] has no locked checksum. '
+                        'Lock your dependencies again to require hashes.'
+                        .format(dep.name)
+                    )
+
+            cmd += ['--require-hashes', '--no-deps']
+
+        if self._cache is not None and all(dep.checksum for dep in deps):
+            output = self._install_from_cache(deps)
+        else:
+            requirements = self._write_requirements(deps, hashes=self._require_hashes)
+
+            try:
+                output = self._progress(
+                    cmd + ['-r', requirements],
+                    'Installing <comment>{}</> packages'.format(len(deps)),
+                    'Installed <comment>{}</> packages'.format(len(deps)),
+                    ' - Installing <comment>{}</> packages'.format(len(deps)),
+                    'Error while installing packages'
+                )
+            finally:
+                os.unlink(requirements)
+
+        installed = self._parse_installed(output)
         for action, from_, dep in actions:
-            cmd = [self._command.pip()]
-            description = 'Installing'
+            version = self._pretty_action_version(from_, dep)
 
-            if action == 'remove':
-                description = 'Removing'
-                cmd += ['uninstall', dep.normalized_name, '-y']
+            if dep.name not in installed:
+                message = ' - <info>{}</> ({}) is already installed'
             elif action == 'update':
-                description = 'Updating'
-                cmd += ['install', dep.normalized_name, '-U']
+                message = ' - Updated <info>{}</> ({})'
+            elif action == 'downgrade':
+                message = ' - Downgraded <info>{}</> ({})'
             else:
-                cmd += ['install', dep.normalized_name]
+                message = ' - Installed <info>{}</> ({})'
 
-            name = dep.name
+            self._command.line(message.format(dep.name, version))
 
-            if dep.is_vcs_dependency():
-                constraint = dep.pretty_constraint
-            else:
-                constraint = dep.constraint.replace('==', '')
+    def _install_from_cache(self, deps):
+        """
+        Install the given dependencies from the wheel cache.
 
-            version = '<comment>{}</>'.format(constraint)
+        Archives missing from the cache are downloaded,
+        and verified, first. The installation itself
+        does not touch any index.
 
-            if from_:
-                if from_.is_vcs_dependency():
-                    constraint = from_.pretty_constraint
-                else:
-                    constraint = from_.constraint.replace('==', '')
+        :param deps: The dependencies to install
+        :type deps: list[poet.package.PipDependency]
 
-                version = '<comment>{}</> -> '.format(constraint) + version
+        :return: The output of pip
+        :rtype: str
+        """
+        misses = [dep for dep in deps if self._cache.find(dep.checksum) is None]
+        if misses:
+            self._download(misses)
 
-            message = ' - {} <info>{}</> ({})'.format(description, name, version)
-            start_message = message[3:]
-            end_message = '{} <info>{}</> ({})'.format(description.replace('ing', 'ed'), name, version)
-            error_message = 'Error while {} [{}]'.format(description.lower(), name)
+            # Pruning once the whole batch has been added,
+            # without evicting the archives of the lock
+            self._cache.prune(keep=self._locked_checksums(deps))
 
-            self._progress(cmd, start_message, end_message, message, error_message)
+        archives = []
+        for dep in deps:
+            archive = self._cache.find(dep.checksum)
+            if archive is None:
+                raise Exception(
+                    'Unable to find an archive of [{}] '
+                    'matching the locked checksums'.format(dep.name)
+                )
+
+            archives.append(archive)
+
+        return self._progress(
+            [self._command.pip(), 'install', '--no-index', '--no-deps'] + archives,
+            'Installing <comment>{}</> packages'.format(len(deps)),
+            'Installed <comment>{}</> packages'.format(len(deps)),
+            ' - Installing <comment>{}</> packages'.format(len(deps)),
+            'Error while installing packages'
+        )
 
-        if not error:
-            # If everything went well, we write down the lock file
-            features = {}
-            for name, featured_packages in self._poet.features.items():
-                name = canonicalize_name(name)
-                features[name] = [canonicalize_name(p) for p in featured_packages]
+    def _locked_checksums(self, deps):
+        """
+        Return the checksums of the given dependencies
+        and of the packages of the current lock.
+
+        :type deps: list[poet.package.PipDependency]
+
+        :rtype: set
+        """
+        if os.path.exists(self._poet.lock_file):
+            lock = self._poet.lock
+            deps = deps + lock.pip_dependencies + lock.pip_dev_dependencies
+
+        checksums = set()
+        for dep in deps:
+            checksums.update(dep.checksum or [])
+
+        return checksums
+
+    def _download(self, deps):
+        """
+        Download the given dependencies into the wheel cache.
+
+        :param deps: The dependencies to download
+        :type deps: list[poet.package.PipDependency]
+
+        :rtype: None
+        """
+        tmp_dir = tempfile.mkdtemp(prefix='poet_')
+        requirements = self._write_requirements(deps, hashes=True)
+
+        try:
+            self._progress(
+                [
+                    self._command.pip(), 'download',
+                    '--no-deps', '--require-hashes',
+                    '-d', tmp_dir,
+                    '-r', requirements
+                ],
+                'Downloading <comment>{}</> packages'.format(len(deps)),
+                'Downloaded <comment>{}</> packages'.format(len(deps)),
+                ' - Downloading <comment>{}</> packages'.format(len(deps)),
+                'Error while downloading packages'
+            )
+
+            for archive in os.listdir(tmp_dir):
+                self._cache.add(os.path.join(tmp_dir, archive))
+        finally:
+            os.unlink(requirements)
+            shutil.rmtree(tmp_dir)
+
+    def _write_requirements(self, deps, hashes=False):
+        """
+        Write the given dependencies to a temporary requirements file.
+
+        :param deps: The dependencies to write
+        :type deps: list[poet.package.PipDependency]
+
+        :param hashes: Whether to write the checksums or not
+        :type hashes: bool
+
+        :return: The path of the requirements file
+        :rtype: str
+        """
+        fd, requirements = tempfile.mkstemp(prefix='poet_', suffix='.txt')
+
+        with os.fdopen(fd, 'w') as f:
+            for dep in deps:
+                line = dep.normalized_name
+                if hashes:
+                    line += ''.join(
+                        ' --hash={}'.format(h) for h in sorted(dep.checksum)
+                    )
+
+                f.write(line + '\n')
+
+        return requirements
+
+    def _parse_installed(self, output):
+        """
+        Retrieve the names of the packages installed by pip
+        from its output.
+
+        :param output: The output of the pip install command
+        :type output: str
+
+        :rtype: set
+        """
+        installed = set()
+
+        for line in (output or '').splitlines():
+            line = line.strip()
+            if not line.startswith('Successfully installed '):
+                continue
 
-            self._write_lock(packages, features)
+            for distribution in line[len('Successfully installed '):].split():
+                name = distribution.rsplit('-', 1)[0]
 
-    def lock(self, dev=True):
+                installed.add(canonicalize_name(name))
+
+        return installed
+
+    def _pretty_action_version(self, from_, dep):
+        version = '<comment>{}</>'.format(self._pretty_constraint(dep))
+
+        if from_:
+            version = '<comment>{}</> -> '.format(self._pretty_constraint(from_)) + version
+
+        return version
+
+    def lock(self, dev=True, incremental=False):
+        """
+        Lock the dependencies.
+
+        :param dev: Whether to lock dev dependencies or not
+        :type dev: bool
+
+        :param incremental: Whether to keep the versions of the current
+                            lock file still satisfying the requirements.
+        :type incremental: bool
+
+        :rtype: None
+        """
         if self._poet.is_lock():
             return
 
@@ -257,29 +771,124 @@ class Installer(object):
         deps = self._poet.pip_dependencies
 
         if dev:
-            deps += self._poet.pip_dev_dependencies
+            deps = deps + self._poet.pip_dev_dependencies
 
-        packages = self.resolve(deps)
-        features = {}
-        for name, featured_packages in self._poet.features.items():
-            name = canonicalize_name(name)
-            features[name] = [canonicalize_name(p) for p in featured_packages]
+        pins = None
+        if incremental and os.path.exists(self._poet.lock_file):
+            pins = self._get_pins(self._poet.lock)
+
+        packages = self.resolve(deps, pins=pins)
 
-        self._write_lock(packages, features)
+        # Locks without dev dependencies do not reflect the poetry.toml file
+        self._write_lock(packages, self._get_features(), complete=dev)
 
-    def resolve(self, deps):
+    def resolve(self, deps, pins=None):
         if not self._with_progress:
             self._command.line(' - <info>Resolving dependencies</>')
 
-            return self._resolve(deps)
+            return self._resolve(deps, pins=pins)
 
         with self._spin(
             '<info>Resolving dependencies</>',
             '<info>Resolving dependencies</>'
         ):
-            return self._resolve(deps)
+            return self._resolve(deps, pins=pins)
+
+    def _get_unlocked_packages(self, packages, deps, locked):
+        """
+        Return the packages to update when updating the given packages:
+        the packages themselves and the locked dependencies
+        which are only required through them.
+
+        :param packages: The names of the packages to update
+        :type packages: list
+
+        :param deps: The top-level dependencies
+        :type deps: list[poet.package.PipDependency]
+
+        :param locked: The locked dependencies
+        :type locked: list[poet.package.PipDependency]
+
+        :rtype: set
+        """
+        graph = dict((dep.name, dep.dependencies) for dep in locked)
+
+        def reachable(roots, excluded):
+            seen = set()
+            queue = deque(r for r in roots if r not in excluded)
+            while queue:
+                name = queue.popleft()
+                if name in seen:
+                    continue
 
-    def _resolve(self, deps):
+                seen.add(name)
+                for child in graph.get(name, []):
+                    if child not in excluded and child not in seen:
+                        queue.append(child)
+
+            return seen
+
+        packages = set(packages)
+        shared = reachable([dep.name for dep in deps], packages)
+
+        return packages | (reachable(packages, set()) - shared)
+
+    def _get_installed_deps(self, deps, installed):
+        """
+        Return the installed versions of the given dependencies.
+
+        :type deps: list[poet.package.PipDependency]
+
+        :type installed: poet.repositories.InstalledRepository
+
+        :rtype: list[poet.package.PipDependency]
+        """
+        installed_deps = []
+        for dep in deps:
+            version = installed.version(dep.name)
+            if version is None:
+                continue
+
+            try:
+                installed_deps.append(PipDependency.create(dep.name, version))
+            except ValueError:
+                # Version not understood by the version parser
+                continue
+
+        return installed_deps
+
+    def _get_pins(self, lock):
+        """
+        Return the locked dependencies which can be reused
+        when resolving again.
+
+        VCS dependencies are not reused since their revision
+        is always resolved again.
+
+        :type lock: poet.lock.Lock
+
+        :rtype: list[poet.package.PipDependency]
+        """
+        return [
+            dep
+            for dep in lock.pip_dependencies + lock.pip_dev_dependencies
+            if not dep.is_vcs_dependency()
+        ]
+
+    def _resolve(self, deps, pins=None):
+        """
+        Resolve the given dependencies.
+
+        :param deps: The top-level dependencies
+        :type deps: list[poet.package.PipDependency]
+
+        :param pins: Locked dependencies whose version
+                     and checksums are reused if they still
+                     satisfy the requirements.
+        :type pins: list[poet.package.PipDependency] or None
+
+        :rtype: list[dict]
+        """
         # Checking if we should active prereleases
         prereleases = False
         for dep in deps:
@@ -287,20 +896,29 @@ class Installer(object):
                 prereleases = True
                 break
 
+        if self._resolver is not None:
+            return self._resolve_native(deps, prereleases, pins=pins)
+
         constraints = [dep.as_requirement() for dep in deps]
 
         command = get_pip_command()
         opts, _ = command.parse_args([])
 
+        repository = PyPIRepository(opts, command._build_session(opts))
+        if pins:
+            repository = LockedRepository(pins, repository)
+
         resolver = Resolver(
-            constraints, PyPIRepository(opts, command._build_session(opts)),
+            constraints, repository,
             cache=DependencyCache(CACHE_DIR),
             prereleases=prereleases
         )
-        matches = resolver.resolve()
+        with self._timed('resolve'):
+            matches = resolver.resolve()
+            reversed_dependencies = resolver.reverse_dependencies(matches)
+
         pinned = [m for m in matches if not m.editable and is_pinned_requirement(m)]
         unpinned = [m for m in matches if m.editable or not is_pinned_requirement(m)]
-        reversed_dependencies = resolver.reverse_dependencies(matches)
 
         # Complete reversed dependencies with cache
         cache = resolver.dependency_cache.cache
@@ -317,7 +935,35 @@ class Installer(object):
 
                 reversed_dependencies[dep].add(canonicalize_name(name))
 
-        hashes = resolver.resolve_hashes(pinned)
+        # Direct dependencies of each package
+        dependencies = {}
+        for child, parents in reversed_dependencies.items():
+            child = canonicalize_name(child)
+            if child in self.UNSAFE:
+                continue
+
+            for parent in parents:
+                parent = canonicalize_name(parent)
+                if parent not in dependencies:
+                    dependencies[parent] = set()
+
+                dependencies[parent].add(child)
+
+        attributes = self._get_packages_attributes(dependencies, deps)
+
+        with self._timed('hash'):
+            hashes = resolver.resolve_hashes(pinned)
+
+        sources = {}
+        for m in unpinned:
+            url, specifier = m.link.url.split('@')
+            rev, _ = specifier.split('#')
+
+            sources[key_from_req(m.req)] = (url, rev)
+
+        with self._timed('resolve'):
+            vcs_versions = self._get_vcs_versions(sources)
+
         packages = []
         for m in matches:
             name = key_from_req(m.req)
@@ -326,86 +972,122 @@ class Installer(object):
 
             version = str(m.req.specifier)
             if m in unpinned:
-                url, specifier = m.link.url.split('@')
-                rev, _ = specifier.split('#')
-
-                version = self._get_vcs_version(url, rev)
+                version = vcs_versions[name]
                 checksum = 'sha1:{}'.format(version['rev'])
             else:
                 version = version.replace('==', '')
                 checksum = list(hashes[m])
 
-            # Figuring out category and optionality
-            category = None
-            optional = False
+            if not isinstance(checksum, list):
+                checksum = [checksum]
 
-            # Checking if it's a main dependency
-            for dep in deps:
-                if dep.name == name:
-                    category = dep.category
-                    optional = dep.optional
-                    break
+            category, optional, python = attributes.get(
+                canonicalize_name(name),
+                # The dependency must have come from a VCS
+                # dependency. To avoid missing packages
+                # we assume "main" category and not optional
+                ('main', False, ['*'])
+            )
 
-            if not category:
-                def _category(child):
-                    opt = False
-                    cat = None
-                    parents = reversed_dependencies.get(child, set())
-                    for parent in parents:
-                        for dep in deps:
-                            if dep.name != parent:
-                                continue
+            package = {
+                'name': name,
+                'version': version,
+                'checksum': checksum,
+                'category': category,
+                'optional': optional,
+                'python': python,
+                'dependencies': sorted(dependencies.get(canonicalize_name(name), []))
+            }
 
-                            opt = dep.optional
+            packages.append(package)
 
-                            if dep.category == 'main':
-                                # Dependency is given by at least one main package
-                                # We flag it as main
-                                return 'main', opt
+        return sorted(packages, key=lambda p: p['name'].lower())
 
-                            return 'dev', opt
+    def _resolve_native(self, deps, prereleases=False, pins=None):
+        """
+        Resolve dependencies with the poet resolver.
 
-                        cat, op = _category(parent)
+        VCS dependencies are locked to their current revision
+        but their own dependencies are not resolved.
 
-                        if cat is not None:
-                            return cat, opt
+        :param deps: The top-level dependencies
+        :type deps: list[poet.package.PipDependency]
 
-                    return cat, opt
+        :param prereleases: Whether to accept prereleases or not
+        :type prereleases: bool
 
-                category, optional = _category(name)
+        :param pins: Locked dependencies to prefer
+        :type pins: list[poet.package.PipDependency] or None
 
-            # If category is still None at this point
-            # The dependency must have come from a VCS
-            # dependency. To avoid missing packages
-            # we assume "main" category and not optional
-            if category is None:
-                category = 'main'
-                optional = False
+        :rtype: list[dict]
+        """
+        requirements = [
+            (dep.name, dep.normalized_constraint)
+            for dep in deps
+            if not dep.is_vcs_dependency()
+        ]
 
-            if not isinstance(checksum, list):
-                checksum = [checksum]
+        pins = dict((pin.name, pin) for pin in pins or [])
 
-            # Retrieving Python restriction if any
-            python = self._get_pythons_for_package(
-                name, reversed_dependencies, deps
+        with self._timed('resolve'):
+            resolution = self._resolver.resolve(
+                requirements,
+                prereleases=prereleases,
+                preferred=dict((name, pin.constraint) for name, pin in pins.items())
             )
-            python = list(python)
 
-            if '*' in python:
-                # If at least one parent gave a wildcard
-                # Then it should be installed for any Python version
-                python = ['*']
+        versions = dict(resolution.packages)
+        checksums = {}
+        for name, version in versions.items():
+            pin = pins.get(name)
+            if pin is not None and pin.constraint == version and pin.checksum:
+                checksums[name] = pin.checksum
+        dependencies = {}
+        for name, children in resolution.dependencies.items():
+            dependencies[name] = set(c for c in children if c not in self.UNSAFE)
+
+        sources = {}
+        for dep in deps:
+            if not dep.is_vcs_dependency():
+                continue
 
-            package = {
+            url, specifier = dep.normalized_constraint.rsplit('@', 1)
+            rev, _ = specifier.split('#')
+
+            sources[dep.name] = (url, rev)
+
+        with self._timed('resolve'):
+            vcs_versions = self._get_vcs_versions(sources)
+
+        for name, version in vcs_versions.items():
+            versions[name] = version
+            checksums[name] = ['sha1:{}'.format(version['rev'])]
+
+        with self._timed('hash'):
+            for name in versions:
+                if name not in checksums and name not in self.UNSAFE:
+                    checksums[name] = resolution.hashes(name)
+
+        attributes = self._get_packages_attributes(dependencies, deps)
+
+        packages = []
+        for name, version in versions.items():
+            if name in self.UNSAFE:
+                continue
+
+            category, optional, python = attributes.get(
+                name, ('main', False, ['*'])
+            )
+
+            packages.append({
                 'name': name,
                 'version': version,
-                'checksum': checksum,
+                'checksum': checksums[name],
                 'category': category,
                 'optional': optional,
-                'python': python
-            }
-
-            packages.append(package)
+                'python': python,
+                'dependencies': sorted(dependencies.get(name, []))
+            })
 
         return sorted(packages, key=lambda p: p['name'].lower())
 
@@ -423,132 +1105,184 @@ class Installer(object):
         :type delete: bool
         
         :return: List of actions to execute
-        :type: list[tuple]
+        :type: list[poet.plan.Action]
         """
-        actions = []
-        for dep in deps:
-            action = None
-            from_ = None
-            found = False
+        return diff(deps, current_deps, delete=delete).actions
 
-            for current_dep in current_deps:
-                name = dep.name
-                current_name = current_dep.name
-                version = dep.normalized_constraint
-                current_version = current_dep.normalized_constraint
+    def _get_vcs_version(self, url, rev):
+        return {
+            'git': url,
+            'rev': self._git.resolve(url, rev)
+        }
 
-                if name == current_name:
-                    # Existing dependency
-                    found = True
+    def _get_vcs_versions(self, sources):
+        """
+        Resolve the revisions of VCS dependencies concurrently.
 
-                    if version == current_version:
-                        break
+        :param sources: Mapping of package names to (url, rev) tuples
+        :type sources: dict
 
-                    # If version is different we mark it
-                    # as to be updated
-                    action = 'update'
-                    from_ = current_dep
-                    break
+        :return: Mapping of package names to their locked version
+        :rtype: dict
+        """
+        tasks = {}
+        for name, (url, rev) in sources.items():
+            tasks[name] = ([], functools.partial(self._get_vcs_version, url, rev))
 
-            if not found:
-                # New dependency. We mark it as to be installed.
-                action = 'install'
+        versions = {}
 
-            if action:
-                actions.append((action, from_, dep))
+        def callback(name, version, error):
+            if error is None:
+                versions[name] = version
 
-        if not delete:
-            return actions
+        failures, _ = Pool(min(len(tasks), 8)).run(tasks, callback)
+        if failures:
+            raise failures[0][1]
 
-        # We need to check if we have to remove
-        # any dependency
-        for dep in current_deps:
-            found = False
+        return versions
 
-            for new_dep in deps:
-                if dep.name == new_dep.name:
-                    found = True
+    def _load_lock(self, packages, features, complete=True):
+        """
+        Load the lock of the given packages without writing it.
 
-                    break
+        :rtype: poet.lock.Lock
+        """
+        fd, path = tempfile.mkstemp(prefix='poet_', suffix='.lock')
 
-            if not found:
-                actions.append(('remove', None, dep))
+        try:
+            with os.fdopen(fd, 'w') as f:
+                self._dump_lock(f, packages, features, complete)
 
-        return actions
+            return Lock(path)
+        finally:
+            os.unlink(path)
 
-    def _get_vcs_version(self, url, rev):
-        tmp_dir = tempfile.mkdtemp()
-        current_dir = self._poet.base_dir
+    def _get_features(self):
+        features = {}
+        for name, featured_packages in self._poet.features.items():
+            name = canonicalize_name(name)
+            features[name] = [canonicalize_name(p) for p in featured_packages]
 
-        try:
-            unpack_url(Link(url), tmp_dir, download_dir=tmp_dir, only_download=True)
+        return features
 
-            os.chdir(tmp_dir)
-            call(['git', 'checkout', rev])
+    @contextlib.contextmanager
+    def _timed(self, phase):
+        start = time.time()
 
-            revision = call(['git', 'rev-parse', rev])
-            # Getting info
-            revision = revision.strip()
-            version = {
-                'git': url,
-                'rev': revision
-            }
-        except Exception:
-            raise
+        try:
+            yield
         finally:
-            shutil.rmtree(tmp_dir)
-            # Going back to current directory
-            os.chdir(current_dir)
+            self._timings[phase] = (
+                self._timings.get(phase, 0) + time.time() - start
+            )
 
-        return version
+    def _write_lock(self, packages, features, complete=True):
+        """
+        Write the lock file.
 
-    def _write_lock(self, packages, features):
+        Only complete locks record the fingerprint of the poetry.toml file,
+        so that partial ones are never considered up to date.
+        """
         self._command.line(' - <info>Writing dependencies</>')
 
-        content = self._generate_lock_content(packages, features)
-
         with open(self._poet.lock_file, 'w') as f:
-            f.write(content)
+            self._dump_lock(f, packages, features, complete)
 
-    def _generate_lock_content(self, packages, features):
-        lock_template = template('poetry.lock')
+        self._poet.parse_cache.invalidate(self._poet.lock_file)
 
-        return lock_template.render(
-            name=self._poet.name,
-            version=self._poet.version,
-            packages=packages,
-            features=features
+    def _dump_lock(self, f, packages, features, complete=True):
+        """
+        Stream the lock to a file object,
+        without building it in memory first.
+        """
+        lock_file.dump(
+            f,
+            self._poet.name,
+            self._poet.version,
+            packages,
+            features,
+            fingerprint=self._poet.fingerprint if complete else None
         )
 
-    def _get_pythons_for_package(self, name, reversed_dependencies, deps):
-        pythons = set()
-        if name not in reversed_dependencies:
-            # Main dependency
-            for dep in deps:
-                if name == dep.name:
-                    for p in dep.python:
-                        pythons.add(str(p))
+    def _get_packages_attributes(self, dependencies, deps):
+        """
+        Compute the category, optionality and Python restrictions
+        of every package of the dependency graph at once.
 
-                    break
+        The attributes of the top-level dependencies are propagated
+        to their dependencies until nothing changes anymore,
+        so every edge is only visited again when its parent changed,
+        and cycles are supported.
 
-            if not len(pythons):
-                pythons.add('*')
+        A package is in the "main" category if at least one
+        "main" dependency requires it, and it is optional
+        only if all the dependencies requiring it are optional.
+        Its Python restrictions are the union of the restrictions
+        of the dependencies requiring it.
 
-            return pythons
+        :param dependencies: The direct dependencies of each package
+        :type dependencies: dict
 
-        parents = reversed_dependencies[name]
+        :param deps: The top-level dependencies
+        :type deps: list[poet.package.PipDependency]
 
-        for parent in parents:
-            parent_pythons = self._get_pythons_for_package(
-                parent, reversed_dependencies, deps
-            )
+        :return: Mapping of package names to (category, optional, python) tuples
+        :rtype: dict
+        """
+        categories = {}
+        required = set()
+        pythons = {}
+        queue = deque()
+
+        for dep in deps:
+            name = dep.name
+
+            if categories.get(name) != 'main':
+                categories[name] = dep.category
+
+            if not dep.optional:
+                required.add(name)
+
+            pythons.setdefault(name, set()).update(str(p) for p in dep.python)
+
+            queue.append(name)
 
-            pythons = pythons.union(parent_pythons)
+        while queue:
+            parent = queue.popleft()
+
+            for child in dependencies.get(parent, ()):
+                changed = False
+
+                category = categories.get(child)
+                if category != 'main' and category != categories[parent]:
+                    # A "main" parent always wins
+                    if category is None or categories[parent] == 'main':
+                        categories[child] = categories[parent]
+                        changed = True
+
+                if parent in required and child not in required:
+                    required.add(child)
+                    changed = True
+
+                child_pythons = pythons.setdefault(child, set())
+                if not pythons[parent].issubset(child_pythons):
+                    child_pythons.update(pythons[parent])
+                    changed = True
+
+                if changed:
+                    queue.append(child)
+
+        attributes = {}
+        for name, category in categories.items():
+            python = sorted(pythons[name]) or ['*']
+            if '*' in python:
+                # If at least one parent gave a wildcard
+                # Then it should be installed for any Python version
+                python = ['*']
 
-        if not len(pythons):
-            pythons.add('*')
+            attributes[name] = (category, name not in required, python)
 
-        return pythons
+        return attributes
 
     def _call(self, cmd, error_message):
         try:
@@ -1,20 +1,34 @@
 # -*- coding: utf-8 -*-
 
+from . import lock_file
 from .package import PipDependency, Dependency
 from .poet import Poet
 
 
 class Lock(Poet):
 
+    @property
+    def fingerprint(self):
+        """
+        The fingerprint of the poetry.toml file the lock
+        was generated from, if recorded.
+
+        :rtype: str or None
+        """
+        return self._config['root'].get('fingerprint')
+
     def is_lock(self):
         return True
 
+    def _parse(self):
+        return self._parse_cache.config(self._path, loads=lock_file.loads)
+
     def load(self):
         root = self._config['root']
         self._name = root['name']
         self._version = root['version']
 
-        packages = self._config['package']
+        packages = self._config.get('package', [])
 
         for package in packages:
             constraint = {
@@ -27,16 +41,17 @@ class Lock(Poet):
             else:
                 constraint['version'] = version
 
-            dep = Dependency(
+            dep = Dependency.create(
                 package['name'],
                 constraint,
                 category=package['category']
             )
-            pip_dep = PipDependency(
+            pip_dep = PipDependency.create(
                 package['name'],
                 constraint,
                 category=package['category'],
-                checksum=package.get('checksum')
+                checksum=package.get('checksum'),
+                dependencies=package.get('dependencies')
             )
 
             if package['category'] == 'dev':
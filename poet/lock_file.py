@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+
+"""
+Reader and writer dedicated to the poetry.lock schema.
+
+The writer produces the same content as the poetry.lock template,
+with deterministic ordering, without going through Jinja.
+The reader only understands the subset of TOML used by lock files
+and falls back to the generic TOML parser for anything else,
+like lock files edited by hand.
+"""
+
+import re
+import toml
+
+
+HEADER = [
+    '# This file is generated automatically by Poet',
+    '# from the poetry.toml configuration file.',
+    '#',
+    '# This file should not be modified directly.',
+]
+
+_KEY_RE = re.compile(r'^[A-Za-z0-9_-]+$')
+_ITEM_RE = re.compile(r'\s*"([^"\\]*)"\s*(?:,\s*|$)')
+
+
+def dumps(name, version, packages, features=None, fingerprint=None):
+    """
+    Serialize a lock.
+
+    :param name: The name of the project
+    :type name: str
+
+    :param version: The version of the project
+    :type version: str
+
+    :param packages: The locked packages, as returned by the resolver
+    :type packages: list[dict]
+
+    :param features: The packages of each feature
+    :type features: dict or None
+
+    :param fingerprint: The fingerprint of the poetry.toml file
+    :type fingerprint: str or None
+
+    :rtype: str
+    """
+    return ''.join(_lines(name, version, packages, features, fingerprint))
+
+
+def dump(fp, name, version, packages, features=None, fingerprint=None):
+    """
+    Serialize a lock to a file object, one line at a time.
+    """
+    for line in _lines(name, version, packages, features, fingerprint):
+        fp.write(line)
+
+
+def loads(content):
+    """
+    Parse the content of a lock file.
+
+    :param content: The content of the lock file
+    :type content: str
+
+    :rtype: dict
+    """
+    try:
+        return _parse(content.splitlines())
+    except (ValueError, StopIteration):
+        # Not written by Poet
+        return toml.loads(content)
+
+
+def _lines(name, version, packages, features, fingerprint):
+    for line in HEADER:
+        yield line + '\n'
+
+    yield '\n'
+    yield '[root]\n'
+    yield 'name = {}\n'.format(_string(name))
+    yield 'version = {}\n'.format(_string(version))
+
+    if fingerprint:
+        yield 'fingerprint = {}\n'.format(_string(fingerprint))
+
+    yield '\n'
+
+    if features:
+        yield '[features]\n'
+
+        for feature in sorted(features.keys()):
+            for line in _array(feature, sorted(features[feature])):
+                yield line
+
+    yield '\n'
+
+    for package in packages or []:
+        for line in _package(package):
+            yield line
+
+        yield '\n'
+
+
+def _package(package):
+    version = package['version']
+
+    yield '[[package]]\n'
+    yield 'name = {}\n'.format(_string(package['name']))
+
+    if not isinstance(version, dict):
+        yield 'version = {}\n'.format(_string(version))
+
+    yield 'category = {}\n'.format(_string(package['category']))
+    yield 'optional = {}\n'.format('true' if package['optional'] else 'false')
+
+    if 'checksum' in package:
+        for line in _array('checksum', package['checksum']):
+            yield line
+    else:
+        yield 'checksum = []\n'
+
+    for key in ['python', 'dependencies']:
+        # Missing attributes are written as empty, like the template does
+        if package.get(key):
+            for line in _array(key, package[key]):
+                yield line
+        else:
+            yield '{} = []\n'.format(key)
+
+    if isinstance(version, dict):
+        yield '[package.version]\n'
+        yield 'git = {}\n'.format(_string(version['git']))
+        yield 'rev = {}\n'.format(_string(version['rev']))
+
+
+def _array(key, values):
+    yield '{} = [\n'.format(key)
+
+    last = len(values) - 1
+    for i, value in enumerate(values):
+        yield '    {}{}\n'.format(_string(value), ',' if i != last else '')
+
+    yield ']\n'
+
+
+def _string(value):
+    if '\\' in value or '"' in value:
+        value = value.replace('\\', '\\\\').replace('"', '\\"')
+
+    return '"{}"'.format(value)
+
+
+def _parse(lines):
+    data = {}
+    table = data
+
+    lines = iter(lines)
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+
+        if line in ('[root]', '[features]'):
+            if line[1:-1] in data:
+                raise ValueError('Duplicate table {}'.format(line))
+
+            table = data[line[1:-1]] = {}
+        elif line == '[[package]]':
+            table = {}
+            data.setdefault('package', []).append(table)
+        elif line == '[package.version]':
+            if not data.get('package') or 'version' in data['package'][-1]:
+                raise ValueError('Unexpected table {}'.format(line))
+
+            table = data['package'][-1]['version'] = {}
+        elif line.startswith('['):
+            raise ValueError('Unknown table {}'.format(line))
+        else:
+            key, sep, value = line.partition('=')
+            key = key.strip()
+            value = value.strip()
+
+            if not sep or not _KEY_RE.match(key) or key in table:
+                raise ValueError('Invalid line {}'.format(line))
+
+            if value.startswith('['):
+                # Arrays may span several lines
+                while not value.endswith(']'):
+                    value += ' ' + next(lines).strip()
+
+            table[key] = _value(value)
+
+    return data
+
+
+def _value(value):
+    if value == 'true':
+        return True
+
+    if value == 'false':
+        return False
+
+    if value.startswith('[') and value.endswith(']'):
+        inner = value[1:-1].strip()
+        items = []
+
+        position = 0
+        while position < len(inner):
+            m = _ITEM_RE.match(inner, position)
+            if not m:
+                raise ValueError('Invalid array {}'.format(value))
+
+            items.append(m.group(1))
+            position = m.end()
+
+        return items
+
+    if (
+        len(value) > 1 and value.startswith('"') and value.endswith('"')
+        and '"' not in value[1:-1] and '\\' not in value
+    ):
+        return value[1:-1]
+
+    raise ValueError('Unsupported value {}'.format(value))
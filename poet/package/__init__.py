@@ -3,3 +3,4 @@
 from .dependency import Dependency
 from .package import Package
 from .pip_dependency import PipDependency
+from .python_filter import PythonFilter
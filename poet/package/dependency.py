@@ -1,11 +1,38 @@
 # -*- coding: utf-8 -*-
 
+from weakref import WeakValueDictionary
+
 from semantic_version import Spec, SpecItem, Version
 
+from ..utils.lru_cache import LRUCache
 from ..version_parser import VersionParser
 
 
+# Specs of dependencies without Python restrictions
+ANY_PYTHON = [Spec('*')]
+
+
 class Dependency(object):
+    """
+    A dependency of a project.
+
+    Dependencies are immutable: use create() to share
+    a single instance between identical dependencies.
+    """
+
+    __slots__ = (
+        '_name', '_constraint', '_optional', '_accepts_prereleases',
+        '_category', '_python', '_normalized_constraint', '__weakref__'
+    )
+
+    # Dependencies created with create(), by class and attributes
+    _interned = WeakValueDictionary()
+
+    # Normalized constraints, and whether they accept prereleases,
+    # by class and constraint
+    _normalized = LRUCache(4096)
+
+    _python_specs = LRUCache(256)
 
     def __init__(self, name, constraint, category='main'):
         self._name = name
@@ -13,7 +40,7 @@ class Dependency(object):
         self._optional = False
         self._accepts_prereleases = False
         self._category = category
-        self._python = [Spec('*')]
+        self._python = [self._python_spec('*')]
 
         if isinstance(constraint, dict):
             if 'python' in constraint:
@@ -22,7 +49,7 @@ class Dependency(object):
                 if not isinstance(python, list):
                     python = [python]
 
-                self._python = [Spec(p) for p in python]
+                self._python = [self._python_spec(p) for p in python]
 
             if 'optional' in constraint:
                 self._optional = constraint['optional']
@@ -30,7 +57,36 @@ class Dependency(object):
             if 'version' in constraint:
                 self._constraint = constraint['version']
 
-        self._normalized_constraint = self._normalize(constraint)
+        # The name is only part of the normalized constraint
+        # of VCS dependencies
+        key = (
+            self.__class__,
+            name if self.is_vcs_dependency() else None,
+            _freeze(constraint)
+        )
+        normalized = self._normalized.get(key)
+        if normalized is None:
+            normalized = (self._normalize(constraint), self._accepts_prereleases)
+            self._normalized.set(key, normalized)
+
+        self._normalized_constraint, self._accepts_prereleases = normalized
+
+    @classmethod
+    def create(cls, name, constraint, category='main', **kwargs):
+        """
+        Return a dependency, reusing the existing instance
+        of an identical dependency, if any.
+
+        :rtype: Dependency
+        """
+        key = (cls, name, _freeze(constraint), category, _freeze(kwargs))
+
+        dep = cls._interned.get(key)
+        if dep is None:
+            dep = cls(name, constraint, category=category, **kwargs)
+            cls._interned[key] = dep
+
+        return dep
 
     @property
     def name(self):
@@ -95,7 +151,7 @@ class Dependency(object):
         return self._accepts_prereleases
 
     def is_python_restricted(self):
-        return self._python != [Spec('*')]
+        return self._python != ANY_PYTHON
 
     def _normalize(self, constraint):
         """
@@ -108,9 +164,6 @@ class Dependency(object):
         :rtype: str
         """
         if self.is_vcs_dependency():
-            # Any VCS dependency is considered prerelease
-            self._is_prerelease = True
-
             return self._normalize_vcs_constraint(constraint)
 
         version = constraint
@@ -176,5 +229,27 @@ class Dependency(object):
         except ValueError:
             return Spec(str(Version.coerce(version)))
 
+    @classmethod
+    def _python_spec(cls, python):
+        spec = cls._python_specs.get(python)
+        if spec is None:
+            spec = Spec(python)
+            cls._python_specs.set(python, spec)
+
+        return spec
+
     def __repr__(self):
         return '<{} {}>'.format(self.__class__.__name__, self.normalized_name)
+
+
+def _freeze(value):
+    """
+    Return a hashable version of a constraint.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+
+    return value
@@ -7,18 +7,33 @@ from .dependency import Dependency
 
 class PipDependency(Dependency):
 
-    def __init__(self, name, constraint, category='main', checksum=None):
+    __slots__ = ('_checksum', '_dependencies')
+
+    def __init__(self, name, constraint, category='main', checksum=None,
+                 dependencies=None):
         # Normalizing name for easier dependencies resolving
         name = canonicalize_name(name)
 
         super(PipDependency, self).__init__(name, constraint, category=category)
 
         self._checksum = checksum
+        self._dependencies = [canonicalize_name(d) for d in dependencies or []]
 
     @property
     def checksum(self):
         return self._checksum
 
+    @property
+    def dependencies(self):
+        """
+        The names of the packages this dependency directly requires.
+
+        This is only known for locked dependencies.
+
+        :rtype: list
+        """
+        return self._dependencies
+
     @property
     def normalized_name(self):
         normalized_name = self._name
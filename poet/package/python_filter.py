@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+
+class PythonFilter(object):
+    """
+    Filters dependencies by their Python restrictions
+    for a given Python version.
+
+    Each distinct Python spec is only evaluated once,
+    however many dependencies share it.
+    """
+
+    def __init__(self, python_version):
+        """
+        :param python_version: The version of the target Python
+        :type python_version: semantic_version.Version
+        """
+        self._python_version = python_version
+        self._results = {}
+
+    @property
+    def python_version(self):
+        return self._python_version
+
+    def accepts(self, dep):
+        """
+        Check if a dependency can be installed for the Python version.
+
+        :type dep: poet.package.Dependency
+
+        :rtype: bool
+        """
+        if not dep.is_python_restricted():
+            return True
+
+        for spec in dep.python:
+            result = self._results.get(spec)
+            if result is None:
+                result = self._results[spec] = self._python_version in spec
+
+            if result:
+                return True
+
+        return False
+
+    def partition(self, deps):
+        """
+        Split dependencies into the ones compatible
+        with the Python version and the other ones,
+        keeping their order.
+
+        :type deps: list[poet.package.Dependency]
+
+        :rtype: tuple[list, list]
+        """
+        compatible = []
+        incompatible = []
+
+        for dep in deps:
+            if self.accepts(dep):
+                compatible.append(dep)
+            else:
+                incompatible.append(dep)
+
+        return compatible, incompatible
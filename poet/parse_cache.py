@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+import hashlib
+import os
+import pickle
+import sys
+import toml
+
+from ._compat import encode
+from .locations import CACHE_DIR
+from .utils.helpers import atomic_write
+
+
+class ParseCache(object):
+    """
+    Cache of parsed project and lock files.
+
+    Entries are keyed by the path of the file, and are only valid
+    as long as its modification time and size do not change.
+
+    Parsed files are kept in memory and, if a snapshot directory
+    is given, pickled on disk so that large files are not parsed
+    again by later processes.
+    """
+
+    DEFAULT_SNAPSHOT_PATH = os.path.join(CACHE_DIR, 'parsed')
+
+    def __init__(self, snapshot_dir=None):
+        self._snapshot_dir = snapshot_dir
+        self._configs = {}
+        self._objects = {}
+
+    @property
+    def snapshot_dir(self):
+        return self._snapshot_dir
+
+    def config(self, path, loads=None):
+        """
+        Return the parsed content of a TOML file.
+
+        The returned configuration is shared and must not be modified.
+
+        :param path: The path of the file
+        :type path: str
+
+        :param loads: The parser to use, defaults to the TOML parser
+        :type loads: callable or None
+
+        :rtype: dict
+        """
+        path = os.path.realpath(path)
+        signature = self.signature(path)
+
+        entry = self._configs.get(path)
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+
+        config = self._load_snapshot(path, signature)
+        if config is None:
+            with open(path) as f:
+                config = (loads or toml.loads)(f.read())
+
+            self._write_snapshot(path, signature, config)
+
+        self._configs[path] = (signature, config)
+
+        return config
+
+    def get(self, path, factory):
+        """
+        Return the object built from a file,
+        building it only if the file changed.
+
+        :param path: The path of the file
+        :type path: str
+
+        :param factory: Called with the path of the file
+                        to build the object.
+        :type factory: callable
+        """
+        path = os.path.realpath(path)
+        signature = self.signature(path)
+
+        entry = self._objects.get(path)
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+
+        obj = factory(path)
+        self._objects[path] = (signature, obj)
+
+        return obj
+
+    def invalidate(self, path):
+        """
+        Forget the entries of a file, for instance after writing it.
+        """
+        path = os.path.realpath(path)
+
+        self._configs.pop(path, None)
+        self._objects.pop(path, None)
+
+    @classmethod
+    def signature(cls, path):
+        stat = os.stat(path)
+
+        return (
+            getattr(stat, 'st_mtime_ns', stat.st_mtime),
+            stat.st_size,
+            stat.st_ino
+        )
+
+    def _snapshot_file(self, path):
+        h = hashlib.sha256(encode(path))
+
+        # Pickles are not portable between Python 2 and 3
+        return os.path.join(
+            self._snapshot_dir,
+            '{}.py{}.pickle'.format(h.hexdigest(), sys.version_info[0])
+        )
+
+    def _load_snapshot(self, path, signature):
+        if self._snapshot_dir is None:
+            return
+
+        snapshot = self._snapshot_file(path)
+        if not os.path.exists(snapshot):
+            return
+
+        try:
+            with open(snapshot, 'rb') as f:
+                snapshot_path, snapshot_signature, config = pickle.load(f)
+        except Exception:
+            # Corrupted or incompatible snapshot
+            return
+
+        if snapshot_path != path or snapshot_signature != signature:
+            return
+
+        return config
+
+    def _write_snapshot(self, path, signature, config):
+        if self._snapshot_dir is None:
+            return
+
+        atomic_write(
+            self._snapshot_file(path),
+            lambda f: pickle.dump(
+                (path, signature, _plain(config)), f, pickle.HIGHEST_PROTOCOL
+            ),
+            mode='wb'
+        )
+
+
+def _plain(value):
+    """
+    Convert the tables of a parsed TOML file, which may be
+    of types local to the parser, to plain dictionaries
+    so that they can be pickled.
+    """
+    if isinstance(value, dict):
+        return dict((k, _plain(v)) for k, v in value.items())
+
+    if isinstance(value, list):
+        return [_plain(v) for v in value]
+
+    return value
@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+
+import heapq
+
+from collections import namedtuple, OrderedDict
+
+from packaging.version import Version, InvalidVersion
+
+
+class Action(namedtuple('Action', ['kind', 'from_', 'dep'])):
+    """
+    An action to execute on a dependency.
+
+    The kind is one of "install", "update", "downgrade" or "remove".
+    The dependency being replaced, if any, is from_.
+    """
+
+    INSTALL = 'install'
+    UPDATE = 'update'
+    DOWNGRADE = 'downgrade'
+    REMOVE = 'remove'
+
+    __slots__ = ()
+
+    @property
+    def name(self):
+        return self.dep.name
+
+
+class Plan(object):
+    """
+    The actions needed to go from a set of dependencies to another.
+
+    Removals come last. Installations, updates and downgrades
+    are ordered so that dependencies come before the packages
+    requiring them, and removals so that packages are removed
+    before their dependencies.
+    """
+
+    KINDS = [Action.INSTALL, Action.UPDATE, Action.DOWNGRADE, Action.REMOVE]
+
+    def __init__(self, actions):
+        self._actions = list(actions)
+        self._timings = OrderedDict()
+
+    @property
+    def actions(self):
+        return self._actions
+
+    @property
+    def timings(self):
+        """
+        The time spent computing the plan, in seconds, by phase.
+
+        :rtype: OrderedDict
+        """
+        return self._timings
+
+    def count(self, kind):
+        return len([a for a in self._actions if a.kind == kind])
+
+    def summary(self):
+        """
+        Return the number of actions of each kind,
+        omitting kinds without any action.
+
+        :rtype: list[tuple]
+        """
+        summary = []
+        for kind in self.KINDS:
+            count = self.count(kind)
+            if count:
+                summary.append((kind, count))
+
+        return summary
+
+    def as_dict(self):
+        """
+        Return a serializable representation of the plan.
+
+        :rtype: dict
+        """
+        actions = []
+        for action in self._actions:
+            if action.kind == Action.REMOVE:
+                # The removed dependency is the installed one
+                from_, to = _version(action.dep), None
+            else:
+                from_, to = _version(action.from_), _version(action.dep)
+
+            actions.append({
+                'action': action.kind,
+                'name': action.name,
+                'from': from_,
+                'to': to,
+            })
+
+        return {
+            'actions': actions,
+            'summary': dict(self.summary()),
+            'timings': dict(
+                (phase, round(duration, 3))
+                for phase, duration in self._timings.items()
+            )
+        }
+
+    def __iter__(self):
+        return iter(self._actions)
+
+    def __len__(self):
+        return len(self._actions)
+
+
+def diff(deps, current_deps, delete=True):
+    """
+    Compute the plan going from the current dependencies
+    to the new ones.
+
+    Dependencies are matched by name so the diff
+    takes linear time, apart from the ordering.
+
+    :param deps: New dependencies
+    :type deps: list[poet.package.PipDependency]
+
+    :param current_deps: Current dependencies
+    :type current_deps: list[poet.package.PipDependency]
+
+    :param delete: Whether to add removal actions or not
+    :type delete: bool
+
+    :rtype: Plan
+    """
+    current = {}
+    for dep in current_deps:
+        current[dep.name] = dep
+
+    actions = []
+    names = set()
+    for dep in deps:
+        names.add(dep.name)
+        from_ = current.get(dep.name)
+
+        if from_ is None:
+            actions.append(Action(Action.INSTALL, None, dep))
+        elif dep.normalized_constraint != from_.normalized_constraint:
+            kind = Action.UPDATE
+            if _is_downgrade(from_, dep):
+                kind = Action.DOWNGRADE
+
+            actions.append(Action(kind, from_, dep))
+
+    removals = []
+    if delete:
+        removals = [
+            Action(Action.REMOVE, None, dep)
+            for dep in current_deps
+            if dep.name not in names
+        ]
+
+    return Plan(
+        _order(actions, deps)
+        + list(reversed(_order(list(reversed(removals)), current_deps)))
+    )
+
+
+def _is_downgrade(from_, dep):
+    if from_.is_vcs_dependency() or dep.is_vcs_dependency():
+        return False
+
+    try:
+        return Version(dep.constraint) < Version(from_.constraint)
+    except (InvalidVersion, TypeError):
+        # Not a pinned version
+        return False
+
+
+def _version(dep):
+    if dep is None:
+        return
+
+    if dep.is_vcs_dependency():
+        return dep.constraint.get('rev') or dep.pretty_constraint
+
+    return dep.constraint
+
+
+def _order(actions, deps):
+    """
+    Order actions so that the dependencies of a package,
+    as recorded on the given dependencies, come first.
+
+    The given order is kept whenever possible, and cycles
+    are broken by taking the first remaining action.
+    """
+    position = dict((action.name, i) for i, action in enumerate(actions))
+
+    waiting_on = {}
+    dependents = {}
+    for dep in deps:
+        if dep.name not in position:
+            continue
+
+        waiting_on[dep.name] = set(
+            d for d in dep.dependencies if d in position and d != dep.name
+        )
+        for dependency in waiting_on[dep.name]:
+            dependents.setdefault(dependency, set()).add(dep.name)
+
+    ready = [i for i, a in enumerate(actions) if not waiting_on.get(a.name)]
+    heapq.heapify(ready)
+    pending = set(range(len(actions)))
+
+    ordered = []
+    while pending:
+        if not ready:
+            # Dependency cycle
+            ready = [min(pending)]
+
+        i = heapq.heappop(ready)
+        if i not in pending:
+            continue
+
+        pending.remove(i)
+        ordered.append(actions[i])
+
+        for dependent in dependents.get(actions[i].name, set()):
+            waiting_on[dependent].discard(actions[i].name)
+            if not waiting_on[dependent]:
+                heapq.heappush(ready, position[dependent])
+
+    return ordered
@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 
+import hashlib
+import json
 import re
 import os
-import toml
 import warnings
 
 try:
@@ -13,11 +14,14 @@ except ImportError:
 from packaging.version import Version as PackageVersion
 from packaging.utils import canonicalize_name
 
+from ._compat import encode
 from .exceptions.poet import MissingElement, InvalidElement
 from .version_parser import VersionParser
 from .build import Builder
 from .package import Dependency, PipDependency
-from .utils.helpers import call
+from .parse_cache import ParseCache
+from .readme_cache import ReadmeCache
+from .vcs import GitConfig
 
 
 class Poet(object):
@@ -25,11 +29,18 @@ class Poet(object):
     EXCLUDES = ()
     INCLUDES = ()
 
-    def __init__(self, path, builder=Builder()):
+    # Sections of the poetry.toml file the lock depends on
+    LOCKED_SECTIONS = ['dependencies', 'dev-dependencies', 'features']
+
+    def __init__(self, path, builder=Builder(), readme_cache=None,
+                 parse_cache=None):
         self._path = path
         self._dir = os.path.realpath(os.path.dirname(path))
         self._builder = builder
+        self._readme_cache = readme_cache
+        self._parse_cache = parse_cache or ParseCache()
         self._git_config = None
+        self._fingerprint = None
 
         self._name = None
         self._version = None
@@ -48,12 +59,12 @@ class Poet(object):
         self._entry_points = {}
         self._license = None
         self._readme = None
+        self._readme_loaded = False
         self._include = []
         self._exclude = []
         self._extensions = {}
 
-        with open(self._path) as f:
-            self._config = toml.loads(f.read())
+        self._config = self._parse()
 
         self.load()
 
@@ -63,17 +74,13 @@ class Poet(object):
 
     @property
     def git_config(self):
-        if self._git_config is not None:
-            return self._git_config
-
-        config_list = call(['git', 'config', '-l'])
-
-        self._git_config = {}
+        """
+        The git configuration, read lazily key by key.
 
-        m = re.findall('(?ms)^([^=]+)=(.*?)$', config_list)
-        if m:
-            for group in m:
-                self._git_config[group[0]] = group[1]
+        :rtype: poet.vcs.GitConfig
+        """
+        if self._git_config is None:
+            self._git_config = GitConfig()
 
         return self._git_config
 
@@ -174,6 +181,19 @@ class Poet(object):
 
     @property
     def readme(self):
+        """
+        The content of the README, converted to reStructuredText
+        if needed.
+
+        It is only loaded on first access since converting
+        a Markdown README requires pandoc.
+
+        :rtype: str or None
+        """
+        if not self._readme_loaded:
+            self._load_readme()
+            self._readme_loaded = True
+
         return self._readme
 
     @property
@@ -192,11 +212,57 @@ class Poet(object):
     def lock_file(self):
         return os.path.join(self._dir, 'poetry.lock')
 
+    @property
+    def parse_cache(self):
+        return self._parse_cache
+
     @property
     def lock(self):
+        """
+        The lock, which is only loaded again if the lock file changed.
+
+        :rtype: poet.lock.Lock
+        """
         from .lock import Lock
 
-        return Lock(self.lock_file)
+        return self._parse_cache.get(
+            self.lock_file,
+            lambda path: Lock(path, parse_cache=self._parse_cache)
+        )
+
+    @property
+    def fingerprint(self):
+        """
+        The hash of the parts of the poetry.toml file
+        the lock depends on, recorded in the lock file.
+
+        :rtype: str
+        """
+        if self._fingerprint is None:
+            sections = dict(
+                (section, self._config.get(section, {}))
+                for section in self.LOCKED_SECTIONS
+            )
+            sections['python'] = self._config['package'].get('python', [])
+
+            content = json.dumps(sections, sort_keys=True, separators=(',', ':'))
+            self._fingerprint = 'sha256:{}'.format(
+                hashlib.sha256(encode(content)).hexdigest()
+            )
+
+        return self._fingerprint
+
+    def is_lock_fresh(self):
+        """
+        Check if the lock file exists and was generated
+        from the current state of the poetry.toml file.
+
+        :rtype: bool
+        """
+        if not os.path.exists(self.lock_file):
+            return False
+
+        return self.lock.fingerprint == self.fingerprint
 
     @property
     def path(self):
@@ -227,8 +293,6 @@ class Poet(object):
         self._scripts = self._config.get('scripts', {})
         self._entry_points = self._config.get('entry-points', {})
 
-        self._load_readme()
-
         self._include = self._config['package'].get('include', []) + list(self.INCLUDES)
         self._exclude = self._config['package'].get('exclude', []) + list(self.EXCLUDES)
 
@@ -245,7 +309,9 @@ class Poet(object):
                     'and the pypandoc package.'
                 )
             else:
-                self._readme = pypandoc.convert_file(readme_path, 'rst')
+                cache = self._readme_cache or ReadmeCache()
+
+                self._readme = cache.convert(readme_path, pypandoc.convert_file)
         else:
             with open(readme_path) as f:
                 self._readme = f.read()
@@ -261,6 +327,9 @@ class Poet(object):
 
         return ext == '.md'
 
+    def _parse(self):
+        return self._parse_cache.config(self._path)
+
     def is_lock(self):
         return False
 
@@ -360,7 +429,7 @@ class Poet(object):
         if kind == 'pip':
             klass = PipDependency
 
-        return [klass(k, dependencies[k], category=category) for k in keys]
+        return [klass.create(k, dependencies[k], category=category) for k in keys]
 
     def _get_features(self):
         return self._config.get('features', {})
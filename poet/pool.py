@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+import threading
+
+from ._compat import Queue
+
+
+class Pool(object):
+    """
+    Runs named tasks in worker threads.
+
+    A task is only started once every task it depends on
+    has successfully finished.
+    """
+
+    def __init__(self, workers=1):
+        self._workers = max(1, workers)
+
+    @property
+    def workers(self):
+        return self._workers
+
+    def run(self, tasks, callback=None):
+        """
+        Run the given tasks.
+
+        As soon as a task fails, no new task is started
+        and the pool waits for the running ones to finish.
+
+        :param tasks: Mapping of task names to (dependencies, callable) tuples
+        :type tasks: dict
+
+        :param callback: Called, in the calling thread,
+                         with the name of the task, its result
+                         and the raised exception, if any, each time
+                         a task finishes.
+        :type callback: callable or None
+
+        :return: The failed tasks with their exception,
+                 and the names of the tasks that have not been started.
+        :rtype: tuple(list, list)
+        """
+        # Dependencies outside of the given tasks
+        # are considered already satisfied.
+        waiting_on = {}
+        dependents = {}
+        for name, (dependencies, _) in tasks.items():
+            waiting_on[name] = set(d for d in dependencies if d in tasks and d != name)
+            for dependency in waiting_on[name]:
+                dependents.setdefault(dependency, set()).add(name)
+
+        pending = set(tasks.keys())
+        failures = []
+        running = 0
+
+        work = Queue()
+        results = Queue()
+
+        workers = []
+        for _ in range(min(self._workers, len(tasks))):
+            worker = threading.Thread(target=self._work, args=(work, results))
+            worker.daemon = True
+            worker.start()
+            workers.append(worker)
+
+        try:
+            while pending or running:
+                if not failures:
+                    ready = sorted(n for n in pending if not waiting_on[n])
+
+                    if not ready and not running and pending:
+                        # We have a dependency cycle,
+                        # so we break it by starting the task
+                        # with the less unfinished dependencies.
+                        ready = [
+                            sorted(pending, key=lambda n: (len(waiting_on[n]), n))[0]
+                        ]
+
+                    for name in ready:
+                        pending.remove(name)
+                        running += 1
+                        work.put((name, tasks[name][1]))
+
+                if not running:
+                    break
+
+                name, result, error = results.get()
+                running -= 1
+
+                if error is not None:
+                    failures.append((name, error))
+                else:
+                    for dependent in dependents.get(name, set()):
+                        waiting_on[dependent].discard(name)
+
+                if callback is not None:
+                    callback(name, result, error)
+        finally:
+            for _ in workers:
+                work.put(None)
+
+            for worker in workers:
+                worker.join()
+
+        return failures, sorted(pending)
+
+    def _work(self, work, results):
+        while True:
+            item = work.get()
+            if item is None:
+                return
+
+            name, func = item
+            try:
+                results.put((name, func(), None))
+            except Exception as e:
+                results.put((name, None, e))
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+import hashlib
+import io
+import os
+
+from ._compat import encode
+from .locations import CACHE_DIR
+from .utils.helpers import atomic_write
+
+
+class ReadmeCache(object):
+    """
+    On-disk cache of converted README files.
+
+    Conversions are keyed by the hash of the original content
+    and the target format, so a README is only converted
+    again when it changes.
+    """
+
+    DEFAULT_PATH = os.path.join(CACHE_DIR, 'readme')
+
+    def __init__(self, path=DEFAULT_PATH):
+        self._path = path
+
+    @property
+    def path(self):
+        return self._path
+
+    def convert(self, readme, converter, to='rst'):
+        """
+        Return the converted content of a README file.
+
+        :param readme: The path of the README file
+        :type readme: str
+
+        :param converter: Called with the path of the README
+                          and the target format if the conversion
+                          is not cached yet.
+        :type converter: callable
+
+        :param to: The target format
+        :type to: str
+
+        :rtype: str
+        """
+        with open(readme, 'rb') as f:
+            content = f.read()
+
+        cached = self._file(content, to)
+        if os.path.exists(cached):
+            with io.open(cached, encoding='utf-8') as f:
+                return f.read()
+
+        converted = converter(readme, to)
+        self._write(cached, converted)
+
+        return converted
+
+    def _file(self, content, to):
+        h = hashlib.sha256(content)
+
+        return os.path.join(self._path, '{}.{}'.format(h.hexdigest(), to))
+
+    def _write(self, path, content):
+        atomic_write(path, lambda f: f.write(encode(content)), mode='wb')
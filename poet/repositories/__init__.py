@@ -1,3 +1,6 @@
 # -*- coding: utf-8 -*-
 
+from .installed_repository import InstalledRepository
+from .locked_repository import LockedRepository
+from .metadata_cache import MetadataCache
 from .pypi_repository import PyPiRepository
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+import os
+
+from packaging.utils import canonicalize_name
+from packaging.version import parse as parse_version
+
+
+class InstalledRepository(object):
+    """
+    Packages installed in a set of site-packages directories.
+
+    Metadata are read only once, on first access.
+    """
+
+    def __init__(self, paths):
+        self._paths = [p for p in paths if p]
+        self._packages = None
+
+    @property
+    def packages(self):
+        """
+        Return the installed packages.
+
+        :return: Mapping of canonical names to versions
+        :rtype: dict
+        """
+        if self._packages is None:
+            self._packages = self._scan()
+
+        return self._packages
+
+    def version(self, name):
+        """
+        Return the installed version of a package, if any.
+
+        :param name: The name of the package
+        :type name: str
+
+        :rtype: str or None
+        """
+        return self.packages.get(canonicalize_name(name))
+
+    def is_installed(self, name, version):
+        """
+        Check if the given version of a package is installed.
+
+        :param name: The name of the package
+        :type name: str
+
+        :param version: The version of the package
+        :type version: str
+
+        :rtype: bool
+        """
+        installed = self.version(name)
+        if installed is None:
+            return False
+
+        return parse_version(installed) == parse_version(version)
+
+    def _scan(self):
+        packages = {}
+
+        for path in self._paths:
+            if not os.path.isdir(path):
+                continue
+
+            for entry in os.listdir(path):
+                if entry.endswith('.dist-info'):
+                    metadata = os.path.join(path, entry, 'METADATA')
+                elif entry.endswith('.egg-info'):
+                    metadata = os.path.join(path, entry)
+                    if os.path.isdir(metadata):
+                        metadata = os.path.join(metadata, 'PKG-INFO')
+                else:
+                    continue
+
+                name, version = self._read_metadata(metadata)
+                if name is None or version is None:
+                    continue
+
+                name = canonicalize_name(name)
+                if name not in packages:
+                    # First path wins, as it would on sys.path
+                    packages[name] = version
+
+        return packages
+
+    def _read_metadata(self, path):
+        name = None
+        version = None
+
+        try:
+            with open(path) as f:
+                for line in f:
+                    line = line.rstrip('\r\n')
+                    if not line:
+                        # End of headers
+                        break
+
+                    if line.startswith('Name:'):
+                        name = line[len('Name:'):].strip()
+                    elif line.startswith('Version:'):
+                        version = line[len('Version:'):].strip()
+
+                    if name is not None and version is not None:
+                        break
+        except (IOError, OSError, UnicodeDecodeError):
+            pass
+
+        return name, version
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+from pip.req import InstallRequirement
+from piptools.repositories import LocalRequirementsRepository
+from piptools.utils import is_pinned_requirement, key_from_req
+
+
+class LockedRepository(LocalRequirementsRepository):
+    """
+    Proxies a piptools repository, preferring the versions
+    pinned in an existing lock file.
+
+    A pinned version is used as long as it satisfies
+    the requirement, in which case its locked checksums
+    are reused instead of being computed again.
+    """
+
+    def __init__(self, pins, proxied_repository):
+        existing_pins = {}
+        self._checksums = {}
+
+        for dep in pins:
+            ireq = InstallRequirement.from_line(
+                '{}=={}'.format(dep.name, dep.constraint)
+            )
+            key = key_from_req(ireq.req)
+
+            existing_pins[key] = ireq
+            if dep.checksum:
+                self._checksums[(key, str(ireq.req.specifier))] = set(dep.checksum)
+
+        super(LockedRepository, self).__init__(existing_pins, proxied_repository)
+
+    def get_hashes(self, ireq):
+        if is_pinned_requirement(ireq):
+            key = (key_from_req(ireq.req), str(ireq.req.specifier))
+
+            if key in self._checksums:
+                return self._checksums[key]
+
+        return super(LockedRepository, self).get_hashes(ireq)
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+import hashlib
+import json
+import os
+import time
+
+import requests
+
+from .._compat import encode
+from ..locations import CACHE_DIR
+from ..utils.helpers import atomic_write
+
+
+class MetadataCache(object):
+    """
+    On-disk cache of JSON API responses.
+
+    Fresh responses are served from the disk. Stale ones are
+    revalidated with a conditional request using the ETag
+    and Last-Modified headers of the cached response.
+
+    In offline mode, responses are only served from the cache.
+
+    Entries read during the lifetime of the cache are also
+    kept in memory, so that the cache can be shared by threads
+    prefetching metadata and by the resolver.
+    """
+
+    DEFAULT_PATH = os.path.join(CACHE_DIR, 'metadata')
+
+    # 10 minutes
+    DEFAULT_TTL = 600
+
+    def __init__(self, path=DEFAULT_PATH, ttl=DEFAULT_TTL, offline=False,
+                 session=None):
+        self._path = path
+        self._ttl = ttl
+        self._offline = offline
+        self._session = session or requests.Session()
+        self._entries = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def offline(self):
+        return self._offline
+
+    def get_json(self, url):
+        """
+        Return the decoded JSON body served at the given URL.
+
+        :param url: The URL
+        :type url: str
+
+        :return: The decoded body, or None if the URL does not exist.
+        :rtype: dict or None
+        """
+        entry = self._read(url)
+
+        if entry is not None:
+            if self._offline or time.time() - entry['fetched_at'] < self._ttl:
+                self.hits += 1
+
+                return entry['body']
+
+        if self._offline:
+            raise Exception(
+                'Unable to get [{}] from the cache in offline mode'.format(url)
+            )
+
+        headers = {}
+        if entry is not None:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        response = self._session.get(url, headers=headers)
+
+        if response.status_code == 304 and entry is not None:
+            self.revalidations += 1
+            entry['fetched_at'] = time.time()
+            self._write(url, entry)
+
+            return entry['body']
+
+        self.misses += 1
+
+        if response.status_code == 404:
+            return
+
+        response.raise_for_status()
+
+        entry = {
+            'url': url,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'fetched_at': time.time(),
+            'body': response.json()
+        }
+        self._write(url, entry)
+
+        return entry['body']
+
+    def _file(self, url):
+        return os.path.join(
+            self._path, hashlib.sha256(encode(url)).hexdigest() + '.json'
+        )
+
+    def _read(self, url):
+        if url in self._entries:
+            return self._entries[url]
+
+        try:
+            with open(self._file(url)) as f:
+                entry = json.load(f)
+        except (IOError, OSError, ValueError):
+            return
+
+        if entry.get('url') != url:
+            return
+
+        self._entries[url] = entry
+
+        return entry
+
+    def _write(self, url, entry):
+        self._entries[url] = entry
+
+        atomic_write(self._file(url), lambda f: json.dump(entry, f))
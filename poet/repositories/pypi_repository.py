@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 
-import requests
 from pip.models import PyPI
 
 try:
@@ -8,10 +7,12 @@ try:
 except ImportError:
     from xmlrpclib import ServerProxy
 
-from semantic_version import Version
+from semantic_version import Spec
 
+from ..version_index_cache import VersionIndexCache
 from ..version_parser import VersionParser
 from ..package import Package
+from .metadata_cache import MetadataCache
 
 
 class PyPiRepository(object):
@@ -21,21 +22,27 @@ class PyPiRepository(object):
     SEARCH_FULLTEXT = 0
     SEARCH_NAME = 1
 
-    def __init__(self, url=DEFAULT_URL):
+    def __init__(self, url=DEFAULT_URL, cache=None, index_cache=None):
         self._url = url
+        self._cache = cache or MetadataCache()
+        self._index_cache = index_cache or VersionIndexCache()
+
+    @property
+    def url(self):
+        return self._url
+
+    @property
+    def cache(self):
+        return self._cache
 
     def find_packages(self, name, constraint=None):
         packages = []
 
-        if constraint is not None:
+        if constraint is not None and not isinstance(constraint, Spec):
             version_parser = VersionParser()
             constraint = version_parser.parse_constraints(constraint)
 
-        with ServerProxy(self._url) as client:
-            versions = client.package_releases(name, True)
-
-        if constraint:
-            versions = constraint.select([Version.coerce(v) for v in versions])
+        versions = self.version_index(name).filter(constraint)
 
         for version in versions:
             try:
@@ -67,16 +74,57 @@ class PyPiRepository(object):
 
         return results
 
-    def package_name(self, name):
-        url = 'https://pypi.python.org/pypi/{}/json'.format(name)
+    def releases(self, name):
+        """
+        Return the released versions of a package.
+
+        :param name: The name of the package
+        :type name: str
+
+        :rtype: list[str]
+        """
+        info = self._cache.get_json(self.json_url(name))
+
+        if info is None:
+            return []
+
+        return list(info.get('releases', {}).keys())
 
-        response = requests.get(url)
+    def version_index(self, name):
+        """
+        Return the sorted index of the releases of a package.
 
-        if response.status_code == 404:
+        The index is cached, and only built again
+        if the releases changed.
+
+        :param name: The name of the package
+        :type name: str
+
+        :rtype: poet.version_index.VersionIndex
+        """
+        return self._index_cache.get(name, self.releases(name))
+
+    def package_name(self, name):
+        info = self._cache.get_json(self.json_url(name))
+
+        if info is None:
             raise Exception('Package [{}] not found'.format(name))
 
-        response.raise_for_status()
+        return info['info']['name']
+
+    def json_url(self, name, version=None):
+        """
+        Return the URL of the JSON API for a package.
+
+        :param name: The name of the package
+        :type name: str
+
+        :param version: A specific version of the package
+        :type version: str or None
 
-        info = response.json()['info']
+        :rtype: str
+        """
+        if version is None:
+            return '{}/{}/json'.format(self._url.rstrip('/'), name)
 
-        return info['name']
+        return '{}/{}/{}/json'.format(self._url.rstrip('/'), name, version)
@@ -0,0 +1,6 @@
+# -*- coding: utf-8 -*-
+
+from .metadata_provider import MetadataProvider
+from .prefetcher import Prefetcher
+from .pypi_metadata_provider import PyPiMetadataProvider
+from .resolver import Resolution, Resolver
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+
+class MetadataProvider(object):
+    """
+    Provides the metadata the resolver needs about packages.
+
+    Names passed to the provider are canonical names.
+    """
+
+    def versions(self, name):
+        """
+        Return the available versions of a package.
+
+        :param name: The name of the package
+        :type name: str
+
+        :rtype: list[str]
+        """
+        raise NotImplementedError()
+
+    def dependencies(self, name, version):
+        """
+        Return the requirements of a specific version of a package.
+
+        :param name: The name of the package
+        :type name: str
+
+        :param version: The version of the package
+        :type version: str
+
+        :return: PEP 508 requirement strings
+        :rtype: list[str]
+        """
+        raise NotImplementedError()
+
+    def hashes(self, name, version):
+        """
+        Return the checksums of the archives
+        of a specific version of a package.
+
+        :param name: The name of the package
+        :type name: str
+
+        :param version: The version of the package
+        :type version: str
+
+        :return: Checksums in the <algorithm>:<hash> form
+        :rtype: list[str]
+        """
+        return []
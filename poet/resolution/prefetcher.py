@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+
+import threading
+
+from packaging.requirements import Requirement
+from packaging.specifiers import SpecifierSet
+from packaging.utils import canonicalize_name
+from packaging.version import Version, InvalidVersion
+
+from .._compat import Queue
+
+
+class Prefetcher(object):
+    """
+    Fetches the metadata of a whole dependency set concurrently.
+
+    Starting from the top-level requirements, the prefetcher
+    retrieves the versions of each package, selects the highest one
+    matching the requirement and retrieves its dependencies,
+    which are themselves prefetched as soon as they are discovered.
+
+    This is only a best-effort warm up of the provider caches:
+    the selected versions are not necessarily the ones
+    the resolver will end up choosing, and failures are ignored
+    since the resolver will report them itself.
+    """
+
+    def __init__(self, provider, workers=8):
+        self._provider = provider
+        self._workers = max(1, workers)
+
+    @property
+    def workers(self):
+        return self._workers
+
+    def prefetch(self, requirements, prereleases=False, environment=None):
+        """
+        Prefetch the metadata of the given requirements
+        and of their dependencies.
+
+        :param requirements: List of (name, constraint) tuples,
+                             the constraints being PEP 440 specifiers.
+        :type requirements: list[tuple]
+
+        :param prereleases: Whether to accept prereleases or not
+        :type prereleases: bool
+
+        :param environment: Marker environment overrides
+        :type environment: dict or None
+
+        :return: The prefetched packages with their selected version
+        :rtype: dict
+        """
+        seen = set()
+        selected = {}
+        running = 0
+
+        work = Queue()
+        results = Queue()
+
+        workers = []
+        for _ in range(self._workers):
+            worker = threading.Thread(
+                target=self._work, args=(work, results, prereleases, environment)
+            )
+            worker.daemon = True
+            worker.start()
+            workers.append(worker)
+
+        try:
+            pending = [
+                Requirement('{}{}'.format(name, constraint or ''))
+                for name, constraint in requirements
+            ]
+
+            while pending or running:
+                for requirement in pending:
+                    name = canonicalize_name(requirement.name)
+                    extras = [''] + sorted(
+                        canonicalize_name(e) for e in requirement.extras
+                    )
+                    extras = [e for e in extras if (name, e) not in seen]
+                    if not extras:
+                        continue
+
+                    seen.update((name, e) for e in extras)
+                    running += 1
+                    work.put((name, requirement.specifier, extras))
+
+                pending = []
+                if not running:
+                    break
+
+                name, version, dependencies = results.get()
+                running -= 1
+
+                if version is not None:
+                    selected.setdefault(name, version)
+
+                pending = dependencies
+        finally:
+            for _ in workers:
+                work.put(None)
+
+            for worker in workers:
+                worker.join()
+
+        return selected
+
+    def _work(self, work, results, prereleases, environment):
+        while True:
+            item = work.get()
+            if item is None:
+                return
+
+            name, specifier, extras = item
+            try:
+                version, dependencies = self._fetch(
+                    name, specifier, extras, prereleases, environment
+                )
+            except Exception:
+                version, dependencies = None, []
+
+            results.put((name, version, dependencies))
+
+    def _fetch(self, name, specifier, extras, prereleases, environment):
+        versions = []
+        for raw_version in self._provider.versions(name):
+            try:
+                versions.append((Version(raw_version), raw_version))
+            except InvalidVersion:
+                continue
+
+        versions = dict(versions)
+        matching = list(SpecifierSet(str(specifier)).filter(
+            versions.keys(), prereleases=True if prereleases else None
+        ))
+        if not matching:
+            return None, []
+
+        version = versions[max(matching)]
+
+        dependencies = []
+        for requirement in self._provider.dependencies(name, version):
+            requirement = Requirement(requirement)
+
+            for extra in extras:
+                if requirement.marker is None:
+                    if not extra:
+                        dependencies.append(requirement)
+
+                    break
+
+                env = dict(environment or {})
+                env['extra'] = extra
+                if requirement.marker.evaluate(env):
+                    dependencies.append(requirement)
+
+                    break
+
+        return version, dependencies
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+
+from .metadata_provider import MetadataProvider
+
+
+class PyPiMetadataProvider(MetadataProvider):
+    """
+    Reads metadata from the JSON API of a PyPI repository,
+    through the repository metadata cache.
+
+    Only the dependencies declared in the uploaded metadata
+    are known, so packages which do not declare them
+    (like most packages only distributed as sdists)
+    will appear to have no dependencies.
+    """
+
+    def __init__(self, repository):
+        self._repository = repository
+
+    def versions(self, name):
+        return [
+            version
+            for version, files in self._get(name).get('releases', {}).items()
+            if files
+        ]
+
+    def dependencies(self, name, version):
+        info = self._get(name, version)['info']
+
+        return info.get('requires_dist') or []
+
+    def hashes(self, name, version):
+        hashes = []
+        for f in self._get(name).get('releases', {}).get(version, []):
+            sha256 = f.get('digests', {}).get('sha256')
+            if sha256:
+                hashes.append('sha256:{}'.format(sha256))
+
+        return sorted(hashes)
+
+    def _get(self, name, version=None):
+        url = self._repository.json_url(name, version)
+        info = self._repository.cache.get_json(url)
+
+        if info is None:
+            raise Exception('Package [{}] not found'.format(name))
+
+        return info
@@ -0,0 +1,395 @@
+# -*- coding: utf-8 -*-
+
+from packaging.requirements import Requirement
+from packaging.specifiers import SpecifierSet
+from packaging.utils import canonicalize_name
+from packaging.version import Version, InvalidVersion
+
+from ..exceptions.resolution import ResolutionError
+
+
+class Resolution(object):
+    """
+    The result of a resolution.
+
+    Checksums are only retrieved when first requested.
+    """
+
+    def __init__(self, packages, dependencies, provider):
+        self._packages = packages
+        self._dependencies = dependencies
+        self._provider = provider
+        self._hashes = {}
+
+    @property
+    def packages(self):
+        """
+        Mapping of package names to their selected version.
+
+        :rtype: dict
+        """
+        return self._packages
+
+    @property
+    def dependencies(self):
+        """
+        Mapping of package names to the names of their direct dependencies.
+
+        :rtype: dict
+        """
+        return self._dependencies
+
+    def hashes(self, name):
+        if name not in self._packages:
+            return []
+
+        if name not in self._hashes:
+            self._hashes[name] = self._provider.hashes(name, self._packages[name])
+
+        return self._hashes[name]
+
+
+class Resolver(object):
+    """
+    Backtracking dependency resolver.
+
+    The resolver always decides the package with the fewest
+    remaining candidates first, and tries candidates from the
+    highest version to the lowest, preferred versions first. When every candidate of a package
+    fails, it jumps back directly to the last decision which
+    took part in the conflict, skipping the decisions which
+    could not have changed its outcome.
+
+    If a prefetcher is given, the metadata of the whole
+    dependency set are fetched concurrently before resolving.
+    """
+
+    def __init__(self, provider, environment=None, prefetcher=None):
+        self._provider = provider
+        self._prefetcher = prefetcher
+        self._prereleases = False
+        self._environment = environment
+        self._versions = {}
+        self._dependencies = {}
+        self._candidates_cache = {}
+        self._raw_versions = {}
+        self._preferred = {}
+        self._failure = None
+
+    def resolve(self, requirements, prereleases=False, preferred=None):
+        """
+        Resolve the given requirements.
+
+        :param requirements: List of (name, constraint) tuples,
+                             the constraints being PEP 440 specifiers.
+        :type requirements: list[tuple]
+
+        :param prereleases: Whether to accept prereleases or not
+        :type prereleases: bool
+
+        :param preferred: Mapping of package names to the version
+                          to try first, like the ones of a previous lock.
+        :type preferred: dict or None
+
+        :rtype: Resolution
+        """
+        if prereleases != self._prereleases:
+            self._prereleases = prereleases
+            self._candidates_cache = {}
+
+        self._preferred = {}
+        for name, version in (preferred or {}).items():
+            try:
+                self._preferred[canonicalize_name(name)] = Version(version)
+            except InvalidVersion:
+                continue
+
+        if self._prefetcher is not None:
+            self._prefetcher.prefetch(
+                requirements,
+                prereleases=prereleases,
+                environment=self._environment
+            )
+
+        constraints = {}
+        for name, constraint in requirements:
+            requirement = Requirement(
+                '{}{}'.format(name, constraint or '')
+            )
+
+            for node in self._nodes(requirement):
+                constraints[node] = constraints.get(node, ()) + (
+                    (requirement.specifier, None),
+                )
+
+        self._failure = None
+        decisions, _ = self._solve({}, constraints)
+        if decisions is None:
+            raise ResolutionError(self._failure or 'Unable to resolve dependencies')
+
+        packages = {}
+        dependencies = {}
+        for node, version in decisions.items():
+            name = self._base_name(node)
+            packages[name] = self._raw_versions[(name, version)]
+            dependencies.setdefault(name, set())
+
+            for child, _ in self._get_dependencies(node, version):
+                child = self._base_name(child)
+                if child != name:
+                    dependencies[name].add(child)
+
+        return Resolution(packages, dependencies, self._provider)
+
+    def _solve(self, decisions, constraints):
+        """
+        Decide a version for every package.
+
+        The search keeps an explicit stack of decisions rather than
+        recursing, so that large dependency sets do not exceed
+        the recursion limit. The decisions and constraints are updated
+        in place, each frame recording how to undo its own changes.
+
+        :return: The decisions if the resolution succeeded,
+                 or the names of the decisions responsible
+                 for the failure otherwise.
+        :rtype: tuple
+        """
+        decisions = dict(decisions)
+        constraints = dict(constraints)
+        stack = []
+        conflict = None
+
+        while True:
+            if conflict is None:
+                frame, conflict = self._select(decisions, constraints)
+                if conflict is not None:
+                    continue
+
+                if frame is None:
+                    return decisions, None
+
+                stack.append(frame)
+            else:
+                if not stack:
+                    return None, conflict
+
+                # The last decision failed
+                frame = stack[-1]
+                frame.undo(decisions, constraints)
+
+                if frame.name not in conflict:
+                    # Our decision is not part of the conflict,
+                    # trying other versions would lead to the same failure.
+                    stack.pop()
+
+                    continue
+
+                frame.conflict |= conflict - set([frame.name])
+
+            conflict = self._decide(frame, decisions, constraints)
+            if conflict is not None:
+                stack.pop()
+
+    def _select(self, decisions, constraints):
+        """
+        Select the undecided package with the fewest candidates.
+
+        :return: The frame of the package, None if every package
+                 is decided, and the names of the decisions responsible
+                 for the failure if a package has no candidate.
+        :rtype: tuple
+        """
+        name = None
+        candidates = None
+        for node in sorted(constraints):
+            if node in decisions:
+                continue
+
+            node_candidates = self._candidates(node, constraints[node])
+            if not node_candidates:
+                self._failure = self._describe_failure(node, constraints[node])
+
+                return None, self._origins(constraints[node])
+
+            if candidates is None or len(node_candidates) < len(candidates):
+                name = node
+                candidates = node_candidates
+
+        if name is None:
+            return None, None
+
+        return _Frame(name, candidates), None
+
+    def _decide(self, frame, decisions, constraints):
+        """
+        Decide the next candidate of a frame
+        not clashing with the current decisions.
+
+        :return: None if a candidate was decided, or the names
+                 of the decisions responsible for the failure
+                 if every candidate was tried.
+        :rtype: set or None
+        """
+        name = frame.name
+
+        while frame.position < len(frame.candidates):
+            version = frame.candidates[frame.position]
+            frame.position += 1
+            clash = set()
+
+            for child, specifier in self._get_dependencies(name, version):
+                frame.changes.append((child, constraints.get(child)))
+                constraints[child] = constraints.get(child, ()) + (
+                    (specifier, name),
+                )
+
+                if child in decisions and not specifier.contains(decisions[child], prereleases=True):
+                    clash.add(child)
+                    self._failure = self._describe_failure(child, constraints[child])
+
+            if clash:
+                frame.undo(decisions, constraints)
+                frame.conflict |= clash
+
+                continue
+
+            decisions[name] = version
+
+            return
+
+        return frame.conflict | self._origins(constraints[name])
+
+    def _candidates(self, name, constraints):
+        specifier = ','.join(sorted(set(str(s) for s, _ in constraints if str(s))))
+
+        key = (name, specifier)
+        if key not in self._candidates_cache:
+            versions = self._get_versions(name)
+            prereleases = True if self._prereleases else None
+
+            self._candidates_cache[key] = list(
+                SpecifierSet(specifier).filter(versions, prereleases=prereleases)
+            )
+
+        candidates = self._candidates_cache[key]
+
+        preferred = self._preferred.get(self._base_name(name))
+        if preferred is not None and preferred in candidates:
+            candidates = [preferred] + [c for c in candidates if c != preferred]
+
+        return candidates
+
+    def _origins(self, constraints):
+        return set(origin for _, origin in constraints if origin is not None)
+
+    def _get_versions(self, name):
+        if name not in self._versions:
+            base_name = self._base_name(name)
+            versions = []
+            for raw_version in self._provider.versions(base_name):
+                try:
+                    version = Version(raw_version)
+                except InvalidVersion:
+                    continue
+
+                self._raw_versions[(base_name, version)] = raw_version
+                versions.append(version)
+
+            self._versions[name] = sorted(versions, reverse=True)
+
+        return self._versions[name]
+
+    def _get_dependencies(self, name, version):
+        """
+        Return the dependencies of a version of a package
+        as (name, specifier) tuples.
+
+        Extras are handled as separate packages, "name[extra]",
+        which depend on the exact same version of the package.
+        """
+        key = (name, version)
+        if key in self._dependencies:
+            return self._dependencies[key]
+
+        base_name = self._base_name(name)
+        extra = None
+        if name != base_name:
+            extra = name[len(base_name) + 1:-1]
+
+        dependencies = []
+        if extra is not None:
+            dependencies.append((base_name, SpecifierSet('=={}'.format(version))))
+
+        raw_version = self._raw_versions[(base_name, version)]
+        for requirement in self._provider.dependencies(base_name, raw_version):
+            requirement = Requirement(requirement)
+
+            environment = dict(self._environment or {})
+            environment['extra'] = extra or ''
+            if requirement.marker and not requirement.marker.evaluate(environment):
+                continue
+
+            if extra is not None and not self._requires_extra(requirement):
+                # Already a dependency of the base package
+                continue
+
+            for node in self._nodes(requirement):
+                dependencies.append((node, requirement.specifier))
+
+        self._dependencies[key] = dependencies
+
+        return dependencies
+
+    def _requires_extra(self, requirement):
+        return requirement.marker is not None and 'extra' in str(requirement.marker)
+
+    def _nodes(self, requirement):
+        name = canonicalize_name(requirement.name)
+        nodes = [name]
+
+        for extra in sorted(requirement.extras):
+            nodes.append('{}[{}]'.format(name, canonicalize_name(extra)))
+
+        return nodes
+
+    def _base_name(self, name):
+        return name.split('[', 1)[0]
+
+    def _describe_failure(self, name, constraints):
+        requirements = []
+        for specifier, origin in constraints:
+            requirements.append(
+                '{} ({})'.format(str(specifier) or '*', origin or 'root')
+            )
+
+        return (
+            'Unable to find a version of [{}] matching {}'
+            .format(self._base_name(name), ', '.join(requirements))
+        )
+
+
+class _Frame(object):
+    """
+    A package being decided, with its remaining candidates
+    and the changes of its current decision.
+    """
+
+    __slots__ = ('name', 'candidates', 'position', 'conflict', 'changes')
+
+    def __init__(self, name, candidates):
+        self.name = name
+        self.candidates = candidates
+        self.position = 0
+        self.conflict = set()
+        self.changes = []
+
+    def undo(self, decisions, constraints):
+        decisions.pop(self.name, None)
+
+        while self.changes:
+            child, previous = self.changes.pop()
+            if previous is None:
+                del constraints[child]
+            else:
+                constraints[child] = previous
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 
+import os
 import subprocess
+import tempfile
 
 from jinja2 import Environment, PackageLoader
 
@@ -22,16 +24,23 @@ TEMPLATE_ENV.globals.update({
 })
 
 
-def call(args):
+def call(args, cwd=None):
     """
     Calls a command and return the output.
     
     :param args: The command args.
     :type args: list
+
+    :param cwd: The directory to run the command in.
+    :type cwd: str or None
     
     :rtype: str 
     """
-    output = subprocess.check_output(args, stderr=subprocess.STDOUT)
+    kwargs = {'stderr': subprocess.STDOUT}
+    if cwd is not None:
+        kwargs['cwd'] = cwd
+
+    output = subprocess.check_output(args, **kwargs)
 
     if PY3K:
         return decode(output)
@@ -52,3 +61,52 @@ def template(name):
         name += '.jinja2'
 
     return TEMPLATE_ENV.get_template(name)
+
+
+def atomic_write(path, write, mode='w'):
+    """
+    Writes a cache file through a temporary file,
+    so that readers never see a partially written file.
+
+    Cache files are only an optimization, so failing to write them,
+    for instance when the directory is not writable, is not an error.
+
+    :param path: The path of the file.
+    :type path: str
+
+    :param write: Called with the file object to write the content.
+    :type write: callable
+
+    :param mode: The mode to open the file with, "w" or "wb".
+    :type mode: str
+
+    :return: Whether the file was written.
+    :rtype: bool
+    """
+    directory = os.path.dirname(path)
+    tmp = None
+
+    try:
+        if not os.path.isdir(directory):
+            try:
+                os.makedirs(directory)
+            except OSError:
+                # Created concurrently
+                if not os.path.isdir(directory):
+                    raise
+
+        fd, tmp = tempfile.mkstemp(prefix='.', dir=directory)
+        with os.fdopen(fd, mode) as f:
+            write(f)
+
+        if os.name == 'nt' and os.path.exists(path):
+            os.remove(path)
+
+        os.rename(tmp, path)
+    except (IOError, OSError):
+        if tmp is not None and os.path.exists(tmp):
+            os.remove(tmp)
+
+        return False
+
+    return True
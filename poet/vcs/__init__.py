@@ -0,0 +1,5 @@
+# -*- coding: utf-8 -*-
+
+from .git import Git
+from .git_config import GitConfig
+from .mirror_cache import MirrorCache
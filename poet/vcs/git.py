@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+import re
+import shutil
+import tempfile
+
+from ..utils.helpers import call
+
+
+class Git(object):
+    """
+    Resolves revisions of remote git repositories.
+
+    Commands never change the working directory of the process,
+    so that revisions can be resolved from several threads.
+
+    If a mirror cache is given, revisions are resolved
+    from the mirrors of the repositories.
+    """
+
+    SHA_RE = re.compile('^[0-9a-f]{40}$')
+
+    def __init__(self, executable='git', mirrors=None):
+        self._executable = executable
+        self._mirrors = mirrors
+
+    @property
+    def mirrors(self):
+        return self._mirrors
+
+    def resolve(self, url, rev):
+        """
+        Resolve a branch, tag or commit of a remote repository
+        to the SHA of a commit.
+
+        :param url: The URL of the repository, with or without
+                    the git+ prefix.
+        :type url: str
+
+        :param rev: The branch, tag or commit
+        :type rev: str
+
+        :rtype: str
+        """
+        url = self.remote_url(url)
+
+        if self.SHA_RE.match(rev):
+            return rev
+
+        if self._mirrors is not None:
+            return self.rev_parse(rev, self._mirrors.mirror(url))
+
+        revision = self.ls_remote(url, rev)
+        if revision is not None:
+            return revision
+
+        # Abbreviated commits can not be resolved
+        # without the history of the repository.
+        return self._resolve_from_clone(url, rev)
+
+    def ls_remote(self, url, rev):
+        """
+        Look for a branch or tag on a remote repository.
+
+        Tags take precedence over branches, like they do
+        for git checkout.
+
+        :rtype: str or None
+        """
+        output = self.run(
+            'ls-remote', url,
+            rev, 'refs/tags/{}^{{}}'.format(rev)
+        )
+
+        refs = {}
+        for line in output.splitlines():
+            parts = line.strip().split('\t')
+            if len(parts) != 2:
+                continue
+
+            refs[parts[1]] = parts[0]
+
+        for ref in [
+            'refs/tags/{}^{{}}'.format(rev),
+            'refs/tags/{}'.format(rev),
+            'refs/heads/{}'.format(rev),
+            rev
+        ]:
+            if ref in refs:
+                return refs[ref]
+
+    def rev_parse(self, rev, git_dir):
+        """
+        Resolve a revision in a local repository.
+
+        :rtype: str
+        """
+        return self.run(
+            'rev-parse', '--verify', '{}^{{commit}}'.format(rev),
+            cwd=git_dir
+        ).strip()
+
+    def run(self, *args, **kwargs):
+        return call([self._executable] + list(args), cwd=kwargs.get('cwd'))
+
+    @classmethod
+    def remote_url(cls, url):
+        if url.startswith('git+'):
+            url = url[4:]
+
+        return url
+
+    def _resolve_from_clone(self, url, rev):
+        tmp_dir = tempfile.mkdtemp(prefix='poet_')
+
+        try:
+            self.run('clone', '--quiet', '--bare', url, tmp_dir)
+
+            return self.rev_parse(rev, tmp_dir)
+        finally:
+            shutil.rmtree(tmp_dir)
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+import os
+import subprocess
+
+from .._compat import decode
+from ..utils.helpers import call
+
+
+class GitConfig(object):
+    """
+    Lazily evaluated git configuration.
+
+    Only the requested keys are read, with ``git config --get``,
+    and values are cached for the lifetime of the process.
+
+    Values supplied as overrides or through the environment
+    are used without spawning git at all.
+    Like git, the author variables take precedence over the configuration
+    and EMAIL is only used when user.email is not set.
+    """
+
+    ENVIRONMENT = {
+        'user.name': ['GIT_AUTHOR_NAME'],
+        'user.email': ['GIT_AUTHOR_EMAIL'],
+    }
+
+    FALLBACK_ENVIRONMENT = {
+        'user.email': ['EMAIL'],
+    }
+
+    _cache = {}
+
+    def __init__(self, overrides=None, environ=None,
+                 executable='git', cwd=None):
+        self._overrides = dict(
+            (k, v) for k, v in (overrides or {}).items() if v
+        )
+        self._environ = os.environ if environ is None else environ
+        self._executable = executable
+        self._cwd = cwd
+
+    def get(self, key, default=None):
+        """
+        Return the value of a configuration key.
+
+        :param key: The key, e.g. user.name
+        :type key: str
+
+        :param default: The value to return if the key is not set.
+
+        :rtype: str or None
+        """
+        if key in self._overrides:
+            return self._overrides[key]
+
+        value = self._from_environment(self.ENVIRONMENT, key)
+        if value:
+            return value
+
+        cache_key = (self._executable, self._cwd or os.getcwd(), key)
+        if cache_key not in self._cache:
+            self._cache[cache_key] = self._read(key)
+
+        value = self._cache[cache_key]
+        if value is None:
+            value = self._from_environment(self.FALLBACK_ENVIRONMENT, key)
+
+        if value is None:
+            return default
+
+        return value
+
+    @classmethod
+    def clear(cls):
+        cls._cache.clear()
+
+    def _from_environment(self, variables, key):
+        for variable in variables.get(key, []):
+            value = self._environ.get(variable)
+            if value:
+                return value
+
+    def _read(self, key):
+        try:
+            value = call(
+                [self._executable, 'config', '--get', key],
+                cwd=self._cwd
+            )
+        except (OSError, subprocess.CalledProcessError):
+            # Either git is not available or the key is not set
+            return
+
+        return decode(value).strip() or None
+
+    def __getitem__(self, key):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+
+        return value
+
+    def __contains__(self, key):
+        return self.get(key) is not None
@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+
+import contextlib
+import errno
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+import uuid
+
+from .._compat import encode
+from ..locations import CACHE_DIR
+from ..utils.helpers import call
+
+
+class MirrorCache(object):
+    """
+    Bare mirrors of remote git repositories.
+
+    Each remote gets its own mirror, cloned on first use
+    and then updated with incremental fetches, so that only
+    new objects are transferred. Mirrors are locked while
+    they are updated, so the cache can be used by several
+    threads or processes at once.
+
+    Mirrors which have not been used for a while are evicted.
+    """
+
+    DEFAULT_PATH = os.path.join(CACHE_DIR, 'git')
+
+    # 30 days
+    DEFAULT_MAX_AGE = 30 * 24 * 60 * 60
+
+    # Waiting at most 10 minutes for a lock
+    LOCK_TIMEOUT = 600
+
+    # Locks older than 1 hour, well beyond the time
+    # to wait for them, are considered abandoned
+    STALE_LOCK_AGE = 3600
+
+    def __init__(self, path=DEFAULT_PATH, max_age=DEFAULT_MAX_AGE):
+        self._path = path
+        self._max_age = max_age
+        self._updated = set()
+        self._evicted = False
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def max_age(self):
+        return self._max_age
+
+    def mirror(self, url):
+        """
+        Return the path of an up-to-date mirror of a remote repository.
+
+        A mirror is only fetched once during the lifetime of the cache.
+
+        :param url: The URL of the repository, with or without
+                    the git+ prefix.
+        :type url: str
+
+        :rtype: str
+        """
+        if url.startswith('git+'):
+            url = url[4:]
+
+        directory = self._directory(url)
+
+        with self._lock(directory):
+            if url not in self._updated:
+                if os.path.isdir(directory):
+                    call(['git', 'fetch', '--quiet', '--prune', 'origin'], cwd=directory)
+                else:
+                    self._clone(url, directory)
+
+                self._updated.add(url)
+
+            # Marking the mirror as recently used
+            os.utime(directory, None)
+
+        if not self._evicted:
+            self._evicted = True
+            self.evict()
+
+        return directory
+
+    def entries(self):
+        """
+        Return the mirrors, least recently used first.
+
+        :return: List of (path, last_used) tuples
+        :rtype: list
+        """
+        entries = []
+
+        if not os.path.isdir(self._path):
+            return entries
+
+        for name in os.listdir(self._path):
+            directory = os.path.join(self._path, name)
+            if not name.endswith('.git') or not os.path.isdir(directory):
+                continue
+
+            entries.append((directory, os.path.getmtime(directory)))
+
+        return sorted(entries, key=lambda e: (e[1], e[0]))
+
+    def evict(self, max_age=None):
+        """
+        Remove the mirrors which have not been used
+        for the given number of seconds.
+
+        Mirrors currently in use are kept.
+
+        :param max_age: The maximum age in seconds
+        :type max_age: int or None
+
+        :return: The removed entries
+        :rtype: list
+        """
+        if max_age is None:
+            max_age = self._max_age
+
+        limit = time.time() - max_age
+        removed = []
+
+        for entry in self.entries():
+            if entry[1] > limit:
+                break
+
+            try:
+                with self._lock(entry[0], timeout=0):
+                    shutil.rmtree(entry[0], ignore_errors=True)
+            except LockError:
+                continue
+
+            removed.append(entry)
+
+        return removed
+
+    def clear(self):
+        """
+        Remove every mirror not currently in use.
+
+        :return: The removed entries
+        :rtype: list
+        """
+        return self.evict(max_age=-1)
+
+    def _clone(self, url, directory):
+        # Cloning under a temporary name first so that
+        # a partially cloned mirror is never used
+        tmp_dir = tempfile.mkdtemp(prefix='.', dir=self._path)
+
+        try:
+            call(['git', 'clone', '--quiet', '--mirror', url, tmp_dir])
+            os.rename(tmp_dir, directory)
+        except Exception:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+            raise
+
+    def _directory(self, url):
+        return os.path.join(
+            self._path, hashlib.sha256(encode(url)).hexdigest() + '.git'
+        )
+
+    @contextlib.contextmanager
+    def _lock(self, directory, timeout=LOCK_TIMEOUT):
+        if not os.path.isdir(self._path):
+            try:
+                os.makedirs(self._path)
+            except OSError:
+                # Created concurrently
+                pass
+
+        lock_file = directory + '.lock'
+        token = encode('{}:{}'.format(os.getpid(), uuid.uuid4().hex))
+        start = time.time()
+
+        while True:
+            try:
+                fd = os.open(lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                break
+            except OSError as e:
+                if e.errno != errno.EEXIST:
+                    raise
+
+            try:
+                if time.time() - os.path.getmtime(lock_file) > self.STALE_LOCK_AGE:
+                    # Abandoned lock
+                    os.remove(lock_file)
+
+                    continue
+            except OSError:
+                # Released in the meantime
+                continue
+
+            if time.time() - start >= timeout:
+                raise LockError(
+                    'Unable to lock the git mirror [{}]'.format(directory)
+                )
+
+            time.sleep(0.1)
+
+        try:
+            os.write(fd, token)
+            os.close(fd)
+
+            yield
+        finally:
+            self._release(lock_file, token)
+
+    def _release(self, lock_file, token):
+        """
+        Remove a lock file, unless it was taken over
+        by another process after being considered abandoned.
+        """
+        try:
+            with open(lock_file, 'rb') as f:
+                if f.read() != token:
+                    return
+
+            os.remove(lock_file)
+        except (IOError, OSError):
+            # Already removed
+            pass
+
+
+class LockError(Exception):
+
+    pass
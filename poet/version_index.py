@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+
+import sys
+
+from bisect import bisect_left, bisect_right
+
+from semantic_version import SpecItem, Version
+
+
+# Greater than any version component
+_MAX = sys.maxsize
+
+
+class VersionIndex(object):
+    """
+    Sorted index of the releases of a package.
+
+    Releases are sorted once, along with the (major, minor, patch)
+    integer tuples of their versions, so that the releases matching
+    a Spec are found by bisecting the tuples for each item of the Spec.
+    Only the releases within the resulting bounds are matched
+    against the Spec itself, to account for prereleases and
+    partial versions.
+
+    Stable releases are also indexed on their own,
+    to look for the highest stable release first.
+    """
+
+    def __init__(self, releases):
+        versions = []
+        for release in releases:
+            try:
+                versions.append((Version.coerce(release), release))
+            except ValueError:
+                continue
+
+        versions.sort(key=lambda v: v[0])
+
+        self._versions = [v[0] for v in versions]
+        self._releases = [v[1] for v in versions]
+        self._keys = [(v.major, v.minor, v.patch) for v in self._versions]
+        self._stable = [
+            i for i, v in enumerate(self._versions) if not v.prerelease
+        ]
+        self._stable_keys = [self._keys[i] for i in self._stable]
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Load an index serialized with as_dict().
+
+        Versions are only parsed when needed.
+
+        :rtype: VersionIndex
+        """
+        index = cls.__new__(cls)
+        index._releases = list(data['releases'])
+        index._keys = [tuple(key) for key in data['keys']]
+        index._versions = [None] * len(index._releases)
+        index._stable = list(data['stable'])
+        index._stable_keys = [index._keys[i] for i in index._stable]
+
+        return index
+
+    def as_dict(self):
+        """
+        Return a serializable representation of the index.
+
+        :rtype: dict
+        """
+        return {
+            'releases': self._releases,
+            'keys': [list(key) for key in self._keys],
+            'stable': self._stable
+        }
+
+    @property
+    def releases(self):
+        """
+        The valid releases, from the lowest to the highest version.
+
+        :rtype: list[str]
+        """
+        return self._releases
+
+    def filter(self, spec=None, stable=False):
+        """
+        Return the releases matching a Spec,
+        from the lowest to the highest version.
+
+        :param spec: The Spec to match
+        :type spec: semantic_version.Spec or None
+
+        :param stable: Whether to only return stable releases
+        :type stable: bool
+
+        :rtype: list[str]
+        """
+        positions = self._positions(spec, stable)
+
+        return [
+            self._releases[i] for i in positions
+            if spec is None or spec.match(self._version(i))
+        ]
+
+    def select(self, spec=None, stable=False):
+        """
+        Return the release with the highest version matching a Spec.
+
+        :param spec: The Spec to match
+        :type spec: semantic_version.Spec or None
+
+        :param stable: Whether to only select a stable release
+        :type stable: bool
+
+        :rtype: str or None
+        """
+        for i in reversed(self._positions(spec, stable)):
+            if spec is None or spec.match(self._version(i)):
+                return self._releases[i]
+
+    def _positions(self, spec, stable):
+        """
+        Return the positions of the releases
+        within the bounds of a Spec.
+
+        :rtype: list or range
+        """
+        keys = self._stable_keys if stable else self._keys
+        start, end = 0, len(keys)
+
+        for item in (spec.specs if spec is not None else []):
+            lower, upper = _item_bounds(item)
+
+            if lower is not None:
+                start = max(start, bisect_left(keys, lower))
+
+            if upper is not None:
+                end = min(end, bisect_right(keys, upper))
+
+        if stable:
+            return self._stable[start:end]
+
+        return range(start, max(start, end))
+
+    def _version(self, i):
+        version = self._versions[i]
+        if version is None:
+            version = self._versions[i] = Version.coerce(self._releases[i])
+
+        return version
+
+    def __len__(self):
+        return len(self._releases)
+
+
+def _item_bounds(item):
+    """
+    Return the lowest and highest (major, minor, patch) tuples,
+    inclusive, of the versions that can match a SpecItem.
+
+    The bounds may include versions not matching the item,
+    but never exclude matching ones.
+
+    :rtype: tuple
+    """
+    if item.kind in (SpecItem.KIND_ANY, SpecItem.KIND_NEQ):
+        return None, None
+
+    spec = item.spec
+    lowest = (spec.major, spec.minor or 0, spec.patch or 0)
+    highest = (
+        spec.major,
+        _MAX if spec.minor is None else spec.minor,
+        _MAX if spec.patch is None else spec.patch
+    )
+
+    if item.kind in (SpecItem.KIND_GT, SpecItem.KIND_GTE):
+        return lowest, None
+
+    if item.kind in (SpecItem.KIND_LT, SpecItem.KIND_LTE):
+        return None, highest
+
+    if item.kind == SpecItem.KIND_EQUAL:
+        return lowest, highest
+
+    # Caret, tilde and compatible constraints:
+    # matching versions are lower than the next major version,
+    # or the next minor version where it is certain.
+    if spec.minor is None:
+        return lowest, (spec.major + 1, 0, 0)
+
+    if item.kind == SpecItem.KIND_TILDE or (
+        item.kind == SpecItem.KIND_CARET and spec.major == 0
+    ):
+        return lowest, (spec.major, spec.minor + 1, 0)
+
+    if item.kind == SpecItem.KIND_COMPATIBLE and spec.patch is not None:
+        return lowest, (spec.major, spec.minor + 1, 0)
+
+    return lowest, (spec.major + 1, 0, 0)
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+import hashlib
+import json
+import os
+
+from packaging.utils import canonicalize_name
+
+from ._compat import encode
+from .locations import CACHE_DIR
+from .utils.helpers import atomic_write
+from .version_index import VersionIndex
+
+
+class VersionIndexCache(object):
+    """
+    Cache of the release indexes of packages,
+    kept in memory and on disk.
+
+    Indexes are stored along with a digest of the releases
+    they were built from, and are only built again
+    when the releases of the package change.
+    """
+
+    DEFAULT_PATH = os.path.join(CACHE_DIR, 'versions')
+
+    def __init__(self, path=DEFAULT_PATH):
+        self._path = path
+        self._indexes = {}
+
+    @property
+    def path(self):
+        return self._path
+
+    def get(self, name, releases):
+        """
+        Return the index of the releases of a package.
+
+        :param name: The name of the package
+        :type name: str
+
+        :param releases: The current releases of the package
+        :type releases: list[str]
+
+        :rtype: poet.version_index.VersionIndex
+        """
+        name = canonicalize_name(name)
+        digest = self.digest(releases)
+
+        entry = self._indexes.get(name)
+        if entry is not None and entry[0] == digest:
+            return entry[1]
+
+        index = self._load(name, digest)
+        if index is None:
+            index = VersionIndex(releases)
+            self._write(name, digest, index)
+
+        self._indexes[name] = (digest, index)
+
+        return index
+
+    @classmethod
+    def digest(cls, releases):
+        h = hashlib.sha256(encode('\n'.join(sorted(releases))))
+
+        return h.hexdigest()
+
+    def _file(self, name):
+        return os.path.join(self._path, '{}.json'.format(name))
+
+    def _load(self, name, digest):
+        path = self._file(name)
+        if not os.path.exists(path):
+            return
+
+        try:
+            with open(path) as f:
+                data = json.load(f)
+
+            if data['digest'] != digest:
+                return
+
+            return VersionIndex.from_dict(data['index'])
+        except (ValueError, KeyError, TypeError):
+            # Corrupted entry
+            return
+
+    def _write(self, name, digest, index):
+        atomic_write(
+            self._file(name),
+            lambda f: json.dump({'digest': digest, 'index': index.as_dict()}, f)
+        )
@@ -4,10 +4,13 @@ import re
 
 from semantic_version import Spec, Version
 
+from .utils.lru_cache import LRUCache
+
 
 class VersionParser(object):
 
-    _constraints = {}
+    # Parsed constraints, shared by every parser
+    _constraints = LRUCache(2048)
 
     def parse_constraints(self, constraints):
         if not isinstance(constraints, list):
@@ -15,12 +18,27 @@ class VersionParser(object):
         else:
             constraints = ','.join(constraints)
 
-        if constraints not in self.__class__._constraints:
+        specs = self._constraints.get(constraints)
+        if specs is None:
             specs = Spec(constraints)
 
-            self.__class__._constraints[constraints] = specs
+            self._constraints.set(constraints, specs)
+
+        return specs
+
+    @classmethod
+    def cache_stats(cls):
+        """
+        Return the statistics of the cache of parsed constraints:
+        hits, misses, size and maxsize.
+
+        :rtype: dict
+        """
+        return cls._constraints.stats()
 
-        return self.__class__._constraints[constraints]
+    @classmethod
+    def clear_cache(cls):
+        cls._constraints.clear()
 
     @classmethod
     def parse_stability(cls, version):
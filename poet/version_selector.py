@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+from .package import Package
 from .version_parser import VersionParser
 
 
@@ -8,6 +9,7 @@ class VersionSelector(object):
     def __init__(self, repository, parser=VersionParser()):
         self._repository = repository
         self._parser = parser
+        self._indexes = {}
 
     def find_best_candidate(self, package_name, target_package_version=None,
                             preferred_stability='stable'):
@@ -16,19 +18,21 @@ class VersionSelector(object):
         else:
             constraint = None
 
-        candidates = self._repository.find_packages(package_name, constraint)
+        index = self._index(package_name)
 
-        if not candidates:
-            return False
+        # Selecting the highest version,
+        # with the preferred stability if possible
+        version = None
+        if preferred_stability == 'stable':
+            version = index.select(constraint, stable=True)
+
+        if version is None:
+            version = index.select(constraint)
 
-        # Select highest version if we have many
-        package = candidates[0]
-        for candidate in candidates:
-            # Select highest version of the two
-            if package.version < candidate.version:
-                package = candidate
+        if version is None:
+            return False
 
-        return package
+        return Package(package_name, version)
 
     def find_recommended_require_version(self, package):
         version = package.version
@@ -36,6 +40,18 @@ class VersionSelector(object):
         if not package.is_dev():
             return self._transform_version(version, package.pretty_version, package.stability)
 
+    def _index(self, package_name):
+        """
+        Return the release index of a package,
+        kept for the lifetime of the selector.
+
+        :rtype: poet.version_index.VersionIndex
+        """
+        if package_name not in self._indexes:
+            self._indexes[package_name] = self._repository.version_index(package_name)
+
+        return self._indexes[package_name]
+
     def _transform_version(self, version, pretty_version, stability):
         # attempt to transform 2.1.1 to 2.1
         # this allows you to upgrade through minor versions
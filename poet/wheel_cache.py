@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+
+import hashlib
+import os
+import shutil
+import tempfile
+
+from .locations import CACHE_DIR
+
+
+class WheelCache(object):
+    """
+    Content-addressed store of package archives.
+
+    Archives are stored under a directory named after
+    their sha256 hash, so that they can be shared
+    by every project locking the same checksums.
+    """
+
+    DEFAULT_PATH = os.path.join(CACHE_DIR, 'wheels')
+
+    # 1 GB
+    DEFAULT_MAX_SIZE = 1024 * 1024 * 1024
+
+    def __init__(self, path=DEFAULT_PATH, max_size=DEFAULT_MAX_SIZE):
+        self._path = path
+        self._max_size = max_size
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def max_size(self):
+        return self._max_size
+
+    def get(self, checksum):
+        """
+        Return the archive matching a checksum, if any.
+
+        :param checksum: The checksum, e.g. sha256:<hash>
+        :type checksum: str
+
+        :rtype: str or None
+        """
+        directory = self._directory(checksum)
+        if directory is None:
+            return
+
+        archive = self._archive(directory)
+        if archive is not None:
+            # Marking the entry as recently used
+            os.utime(directory, None)
+
+        return archive
+
+    def find(self, checksums):
+        """
+        Return the first archive matching one of the checksums.
+
+        :type checksums: list
+
+        :rtype: str or None
+        """
+        for checksum in sorted(checksums or []):
+            path = self.get(checksum)
+            if path is not None:
+                return path
+
+    def add(self, archive):
+        """
+        Add an archive to the cache.
+
+        The cache is not pruned, so that archives can be added
+        in batch before pruning it once.
+
+        :param archive: The path of the archive
+        :type archive: str
+
+        :return: The checksum of the archive
+        :rtype: str
+        """
+        checksum = 'sha256:{}'.format(self.hash(archive))
+        directory = self._directory(checksum)
+
+        if self._archive(directory) is None:
+            if not os.path.isdir(directory):
+                os.makedirs(directory)
+
+            # Copying under a temporary name first so that
+            # a partially copied archive is never served
+            fd, tmp = tempfile.mkstemp(prefix='.', dir=directory)
+            os.close(fd)
+            shutil.copyfile(archive, tmp)
+            os.rename(tmp, os.path.join(directory, os.path.basename(archive)))
+
+        return checksum
+
+    def entries(self):
+        """
+        Return the cached archives, least recently used first.
+
+        :return: List of (checksum, path, size, last_used) tuples
+        :rtype: list
+        """
+        entries = []
+
+        if not os.path.isdir(self._path):
+            return entries
+
+        for prefix in os.listdir(self._path):
+            prefix_dir = os.path.join(self._path, prefix)
+            if not os.path.isdir(prefix_dir):
+                continue
+
+            for digest in os.listdir(prefix_dir):
+                directory = os.path.join(prefix_dir, digest)
+                archive = self._archive(directory)
+                if archive is None:
+                    continue
+
+                entries.append((
+                    'sha256:{}'.format(digest),
+                    archive,
+                    os.path.getsize(archive),
+                    os.path.getmtime(directory)
+                ))
+
+        return sorted(entries, key=lambda e: (e[3], e[0]))
+
+    def size(self):
+        return sum(e[2] for e in self.entries())
+
+    def prune(self, max_size=None, keep=None):
+        """
+        Remove the least recently used archives
+        until the cache fits in the given size.
+
+        :param max_size: The maximum size in bytes
+        :type max_size: int or None
+
+        :param keep: Checksums of archives never to remove,
+                     like the ones of the current lock.
+        :type keep: set or None
+
+        :return: The removed entries
+        :rtype: list
+        """
+        if max_size is None:
+            max_size = self._max_size
+
+        keep = keep or set()
+        entries = self.entries()
+        size = sum(e[2] for e in entries)
+        removed = []
+
+        for entry in entries:
+            if size <= max_size:
+                break
+
+            if entry[0] in keep:
+                continue
+
+            shutil.rmtree(os.path.dirname(entry[1]), ignore_errors=True)
+            size -= entry[2]
+            removed.append(entry)
+
+        return removed
+
+    def clear(self):
+        """
+        Remove every cached archive.
+
+        :return: The removed entries
+        :rtype: list
+        """
+        return self.prune(max_size=0)
+
+    @classmethod
+    def hash(cls, archive):
+        h = hashlib.sha256()
+
+        with open(archive, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                h.update(chunk)
+
+        return h.hexdigest()
+
+    def _archive(self, directory):
+        if not os.path.isdir(directory):
+            return
+
+        for filename in os.listdir(directory):
+            # Dot files are archives being copied
+            if not filename.startswith('.'):
+                return os.path.join(directory, filename)
+
+    def _directory(self, checksum):
+        if not checksum.startswith('sha256:'):
+            return
+
+        digest = checksum[len('sha256:'):]
+
+        return os.path.join(self._path, digest[:2], digest)
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+
+from cleo.testers import CommandTester
+from poet import lock_file
+from poet.installer import Installer
+from poet.poet import Poet
+from poet.repositories import PyPiRepository
+
+
+def make_poet(tmp_dir):
+    fixtures = os.path.join(os.path.dirname(__file__), '..', 'fixtures')
+    shutil.copy(os.path.join(fixtures, 'poetry.toml'), tmp_dir)
+    shutil.copy(os.path.join(fixtures, 'README.rst'), tmp_dir)
+
+    return Poet(os.path.join(tmp_dir, 'poetry.toml'))
+
+
+def write_lock(poet, fingerprint):
+    with open(poet.lock_file, 'w') as f:
+        f.write(lock_file.dumps(
+            poet.name, poet.version, [], fingerprint=fingerprint
+        ))
+
+
+def execute(app, mocker, poet):
+    mocker.patch('poet.console.commands.command.Command.poet', poet)
+
+    command = app.find('check')
+    tester = CommandTester(command)
+    status_code = tester.execute([('command', command.name)])
+
+    return status_code, tester.get_display()
+
+
+def test_check_fresh_lock(app, mocker, tmp_dir):
+    poet = make_poet(tmp_dir)
+    write_lock(poet, poet.fingerprint)
+
+    status_code, output = execute(app, mocker, poet)
+
+    assert 0 == status_code
+    assert 'The poetry.lock file is up to date.' in output
+
+
+def test_check_stale_lock(app, mocker, tmp_dir):
+    poet = make_poet(tmp_dir)
+    write_lock(poet, 'sha256:outdated')
+
+    status_code, output = execute(app, mocker, poet)
+
+    assert 1 == status_code
+    assert 'The poetry.lock file is not up to date' in output
+
+
+def test_fingerprint(tmp_dir):
+    poet = make_poet(tmp_dir)
+    fingerprint = poet.fingerprint
+
+    path = os.path.join(tmp_dir, 'poetry.toml')
+    with open(path) as f:
+        content = f.read()
+
+    # Only the sections affecting the lock are taken into account
+    with open(path, 'w') as f:
+        f.write(content.replace('0.1.2', '0.2.0') + '\n# Comment\n')
+
+    assert fingerprint == Poet(path).fingerprint
+
+    with open(path, 'w') as f:
+        f.write(content.replace('pendulum = "^1.2.0"', 'pendulum = "^1.3.0"'))
+
+    assert fingerprint != Poet(path).fingerprint
+
+
+def test_partial_locks_are_never_fresh(app, mocker, tmp_dir):
+    poet = make_poet(tmp_dir)
+    command = mocker.MagicMock(poet=poet)
+    mocker.patch('poet.installer.Installer.resolve', return_value=[])
+    installer = Installer(command, PyPiRepository())
+    dump = mocker.spy(lock_file, 'dump')
+    dumps = mocker.spy(lock_file, 'dumps')
+
+    # Without dev dependencies
+    installer.lock(dev=False)
+
+    # The lock is streamed to the file
+    assert dump.called
+    assert not dumps.called
+
+    assert poet.lock.fingerprint is None
+    assert not poet.is_lock_fresh()
+
+    status_code, output = execute(app, mocker, poet)
+
+    assert 1 == status_code
+    assert 'The poetry.lock file is not up to date' in output
+
+    installer.lock()
+
+    assert poet.is_lock_fresh()
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 
+import json
 import os
+import subprocess
 import tempfile
 import pytest
 
@@ -8,6 +10,7 @@ from cleo import CommandTester
 from poet.console import Application
 from poet.console.commands import InstallCommand as BaseCommand
 from poet.poet import Poet as BasePoet
+from poet.wheel_cache import WheelCache
 from pip.req.req_install import InstallRequirement
 
 fd, DUMMY_LOCK = tempfile.mkstemp(prefix='poet_lock_')
@@ -44,6 +47,9 @@ class InstallCommand(BaseCommand):
     def python(self):
         return 'python'
 
+    def site_packages(self):
+        return []
+
 
 def test_install_default(mocker, check_output):
     resolve = mocker.patch('piptools.resolver.Resolver.resolve')
@@ -90,3 +96,349 @@ def test_install_invalid_feature(app):
             ('--features', ['invalid']),
             ('--no-progress', True)
         ])
+
+
+@pytest.mark.parametrize('jobs', ['foo', '0', '-2'])
+def test_install_invalid_jobs(mocker, jobs):
+    installer = mocker.patch('poet.console.commands.install.Installer')
+    app = Application()
+    app.add(InstallCommand())
+
+    command = app.find('install')
+    command_tester = CommandTester(command)
+    status_code = command_tester.execute([
+        ('command', command.name),
+        ('--jobs', jobs)
+    ])
+
+    assert 1 == status_code
+    assert not installer.called
+    assert (
+        'The --jobs option must be a positive integer, got [{}]'.format(jobs)
+        in command_tester.get_display()
+    )
+
+
+def test_install_parallel(mocker, check_output):
+    resolve = mocker.patch('piptools.resolver.Resolver.resolve')
+    reverse_dependencies = mocker.patch('piptools.resolver.Resolver.reverse_dependencies')
+    resolve_hashes = mocker.patch('piptools.resolver.Resolver.resolve_hashes')
+    pendulum_req = InstallRequirement.from_line('pendulum==1.2.0')
+    pytzdata_req = InstallRequirement.from_line('pytzdata==2017.2')
+    resolve.return_value = [pendulum_req, pytzdata_req]
+    reverse_dependencies.return_value = {'pytzdata': set(['pendulum'])}
+    resolve_hashes.return_value = {pendulum_req: set(), pytzdata_req: set()}
+    app = Application()
+    app.add(InstallCommand())
+
+    command = app.find('install')
+    command_tester = CommandTester(command)
+    command_tester.execute([
+        ('command', command.name),
+        ('--no-progress', True),
+        ('--jobs', '2')
+    ])
+
+    with open(DUMMY_LOCK) as f:
+        lock = f.read()
+
+    os.remove(DUMMY_LOCK)
+
+    assert 'dependencies = [\n    "pytzdata"\n]' in lock
+    assert 2 == check_output.call_count
+    check_output.assert_any_call(
+        ['pip', 'install', 'pendulum==1.2.0', '--no-deps'],
+        stderr=subprocess.STDOUT
+    )
+
+    output = command_tester.get_display()
+    expected = """
+Locking dependencies to poetry.lock
+
+ - Resolving dependencies
+ - Writing dependencies
+
+Installing dependencies
+
+ - Installed pytzdata (2017.2)
+ - Installed pendulum (1.2.0)
+"""
+
+    assert output == expected
+
+
+def test_install_skips_installed_packages(mocker, check_output, tmp_dir):
+    resolve = mocker.patch('piptools.resolver.Resolver.resolve')
+    reverse_dependencies = mocker.patch('piptools.resolver.Resolver.reverse_dependencies')
+    resolve_hashes = mocker.patch('piptools.resolver.Resolver.resolve_hashes')
+    site_packages = mocker.patch.object(InstallCommand, 'site_packages')
+    pendulum_req = InstallRequirement.from_line('pendulum==1.2.0')
+    resolve.return_value = [pendulum_req]
+    reverse_dependencies.return_value = {}
+    resolve_hashes.return_value = {pendulum_req: set()}
+    site_packages.return_value = [tmp_dir]
+
+    os.mkdir(os.path.join(tmp_dir, 'pendulum-1.2.0.dist-info'))
+    with open(os.path.join(tmp_dir, 'pendulum-1.2.0.dist-info', 'METADATA'), 'w') as f:
+        f.write('Metadata-Version: 2.0\nName: pendulum\nVersion: 1.2.0\n')
+
+    app = Application()
+    app.add(InstallCommand())
+
+    command = app.find('install')
+    command_tester = CommandTester(command)
+    command_tester.execute([('command', command.name), ('--no-progress', True)])
+
+    os.remove(DUMMY_LOCK)
+
+    assert 0 == check_output.call_count
+
+    output = command_tester.get_display()
+    expected = """
+Locking dependencies to poetry.lock
+
+ - Resolving dependencies
+ - Writing dependencies
+
+Installing dependencies
+
+ - Dependencies already installed!
+"""
+
+    assert output == expected
+
+
+def test_install_require_hashes(mocker):
+    calls = []
+
+    def check_output(cmd, *args, **kwargs):
+        with open(cmd[-1]) as f:
+            calls.append((cmd[:-1], f.read()))
+
+        return b'Successfully installed pendulum-1.2.0\n'
+
+    mocker.patch('subprocess.check_output', side_effect=check_output)
+    resolve = mocker.patch('piptools.resolver.Resolver.resolve')
+    reverse_dependencies = mocker.patch('piptools.resolver.Resolver.reverse_dependencies')
+    resolve_hashes = mocker.patch('piptools.resolver.Resolver.resolve_hashes')
+    pendulum_req = InstallRequirement.from_line('pendulum==1.2.0')
+    resolve.return_value = [pendulum_req]
+    reverse_dependencies.return_value = {}
+    resolve_hashes.return_value = {
+        pendulum_req: set([
+            'sha256:a97e3ed9557ac0c5c3742f21fa4d852d7a050dd9b1b517e993aebef2dd2eea52',
+            'sha256:641140a05f959b37a177866e263f6f53a53b711fae6355336ee832ec1a59da8a'
+        ])
+    }
+    app = Application()
+    app.add(InstallCommand())
+
+    command = app.find('install')
+    command_tester = CommandTester(command)
+    command_tester.execute([
+        ('command', command.name),
+        ('--no-progress', True),
+        ('--require-hashes', True)
+    ])
+
+    os.remove(DUMMY_LOCK)
+
+    assert [(
+        ['pip', 'install', '--require-hashes', '--no-deps', '-r'],
+        'pendulum==1.2.0'
+        ' --hash=sha256:641140a05f959b37a177866e263f6f53a53b711fae6355336ee832ec1a59da8a'
+        ' --hash=sha256:a97e3ed9557ac0c5c3742f21fa4d852d7a050dd9b1b517e993aebef2dd2eea52\n'
+    )] == calls
+
+    output = command_tester.get_display()
+    expected = """
+Locking dependencies to poetry.lock
+
+ - Resolving dependencies
+ - Writing dependencies
+
+Installing dependencies
+
+ - Installing 1 packages
+ - Installed pendulum (1.2.0)
+"""
+
+    assert output == expected
+
+
+def test_install_from_wheel_cache(mocker, tmp_dir):
+    cache = WheelCache(os.path.join(tmp_dir, 'cache'))
+    archive = os.path.join(tmp_dir, 'pendulum-1.2.0-py2.py3-none-any.whl')
+    with open(archive, 'wb') as f:
+        f.write(b'pendulum')
+
+    checksum = cache.add(archive)
+
+    mocker.patch(
+        'poet.console.commands.install.WheelCache',
+        return_value=cache
+    )
+    sub = mocker.patch(
+        'subprocess.check_output',
+        return_value=b'Successfully installed pendulum-1.2.0\n'
+    )
+    resolve = mocker.patch('piptools.resolver.Resolver.resolve')
+    reverse_dependencies = mocker.patch('piptools.resolver.Resolver.reverse_dependencies')
+    resolve_hashes = mocker.patch('piptools.resolver.Resolver.resolve_hashes')
+    pendulum_req = InstallRequirement.from_line('pendulum==1.2.0')
+    resolve.return_value = [pendulum_req]
+    reverse_dependencies.return_value = {}
+    resolve_hashes.return_value = {
+        pendulum_req: set([checksum, 'sha256:unknown'])
+    }
+    app = Application()
+    app.add(InstallCommand())
+
+    command = app.find('install')
+    command_tester = CommandTester(command)
+    command_tester.execute([
+        ('command', command.name),
+        ('--no-progress', True),
+        ('--wheel-cache', True)
+    ])
+
+    os.remove(DUMMY_LOCK)
+
+    sub.assert_called_once_with(
+        ['pip', 'install', '--no-index', '--no-deps', cache.get(checksum)],
+        stderr=subprocess.STDOUT
+    )
+
+
+def test_install_from_wheel_cache_prunes_after_download(mocker, tmp_dir):
+    cache = WheelCache(os.path.join(tmp_dir, 'cache'), max_size=1)
+    unused = os.path.join(tmp_dir, 'pytzdata-2017.2-py2.py3-none-any.whl')
+    with open(unused, 'wb') as f:
+        f.write(b'pytzdata')
+
+    unused = cache.add(unused)
+    archive = os.path.join(tmp_dir, 'pendulum-1.2.0-py2.py3-none-any.whl')
+    with open(archive, 'wb') as f:
+        f.write(b'pendulum')
+
+    checksum = 'sha256:{}'.format(WheelCache.hash(archive))
+    prune = mocker.spy(cache, 'prune')
+
+    def download(deps):
+        assert cache.get(unused) is not None
+
+        cache.add(archive)
+
+    mocker.patch(
+        'poet.console.commands.install.WheelCache',
+        return_value=cache
+    )
+    mocker.patch('poet.installer.Installer._download', side_effect=download)
+    sub = mocker.patch(
+        'subprocess.check_output',
+        return_value=b'Successfully installed pendulum-1.2.0\n'
+    )
+    resolve = mocker.patch('piptools.resolver.Resolver.resolve')
+    reverse_dependencies = mocker.patch('piptools.resolver.Resolver.reverse_dependencies')
+    resolve_hashes = mocker.patch('piptools.resolver.Resolver.resolve_hashes')
+    pendulum_req = InstallRequirement.from_line('pendulum==1.2.0')
+    resolve.return_value = [pendulum_req]
+    reverse_dependencies.return_value = {}
+    resolve_hashes.return_value = {pendulum_req: set([checksum])}
+    app = Application()
+    app.add(InstallCommand())
+
+    command = app.find('install')
+    command_tester = CommandTester(command)
+    command_tester.execute([
+        ('command', command.name),
+        ('--no-progress', True),
+        ('--wheel-cache', True),
+        ('--jobs', '2')
+    ])
+
+    os.remove(DUMMY_LOCK)
+
+    # The cache is pruned once, without evicting the locked archive
+    prune.assert_called_once()
+    assert cache.get(unused) is None
+    sub.assert_called_once_with(
+        ['pip', 'install', '--no-index', '--no-deps', cache.get(checksum)],
+        stderr=subprocess.STDOUT
+    )
+    assert (
+        'The --jobs option is ignored with the --batch, '
+        '--require-hashes and --wheel-cache options.'
+    ) in command_tester.get_display()
+
+
+def test_install_dry_run(mocker, check_output, tmp_dir):
+    resolve = mocker.patch('piptools.resolver.Resolver.resolve')
+    reverse_dependencies = mocker.patch('piptools.resolver.Resolver.reverse_dependencies')
+    resolve_hashes = mocker.patch('piptools.resolver.Resolver.resolve_hashes')
+    site_packages = mocker.patch.object(InstallCommand, 'site_packages')
+    pendulum_req = InstallRequirement.from_line('pendulum==1.2.0')
+    pytzdata_req = InstallRequirement.from_line('pytzdata==2017.2')
+    resolve.return_value = [pendulum_req, pytzdata_req]
+    reverse_dependencies.return_value = {'pytzdata': set(['pendulum'])}
+    resolve_hashes.return_value = {pendulum_req: set(), pytzdata_req: set()}
+    site_packages.return_value = [tmp_dir]
+
+    os.mkdir(os.path.join(tmp_dir, 'pytzdata-2016.1.dist-info'))
+    with open(os.path.join(tmp_dir, 'pytzdata-2016.1.dist-info', 'METADATA'), 'w') as f:
+        f.write('Metadata-Version: 2.0\nName: pytzdata\nVersion: 2016.1\n')
+
+    app = Application()
+    app.add(InstallCommand())
+
+    command = app.find('install')
+    command_tester = CommandTester(command)
+    command_tester.execute([
+        ('command', command.name), ('--no-progress', True), ('--dry-run', True)
+    ])
+
+    assert not os.path.exists(DUMMY_LOCK)
+    assert 0 == check_output.call_count
+
+    output = command_tester.get_display()
+    expected = """ - Resolving dependencies
+
+Installing dependencies
+
+ - Summary: 1 updates, 1 installations
+ - Would update pytzdata (2016.1 -> 2017.2)
+ - Would install pendulum (1.2.0)
+"""
+
+    assert output == expected
+
+
+def test_install_json(mocker, check_output):
+    resolve = mocker.patch('piptools.resolver.Resolver.resolve')
+    reverse_dependencies = mocker.patch('piptools.resolver.Resolver.reverse_dependencies')
+    resolve_hashes = mocker.patch('piptools.resolver.Resolver.resolve_hashes')
+    pendulum_req = InstallRequirement.from_line('pendulum==1.2.0')
+    resolve.return_value = [pendulum_req]
+    reverse_dependencies.return_value = {}
+    resolve_hashes.return_value = {pendulum_req: set()}
+
+    app = Application()
+    app.add(InstallCommand())
+
+    command = app.find('install')
+    command_tester = CommandTester(command)
+    status_code = command_tester.execute([
+        ('command', command.name), ('--no-progress', True), ('--json', True)
+    ])
+
+    assert 0 == status_code
+    assert not os.path.exists(DUMMY_LOCK)
+    assert 0 == check_output.call_count
+
+    plan = json.loads(command_tester.get_display())
+
+    assert [
+        {'action': 'install', 'name': 'pendulum', 'from': None, 'to': '1.2.0'}
+    ] == plan['actions']
+    assert {'install': 1} == plan['summary']
+    assert ['diff', 'hash', 'resolve', 'scan'] == sorted(plan['timings'])
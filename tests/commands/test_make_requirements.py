@@ -5,6 +5,7 @@ import shutil
 
 from cleo.testers import CommandTester
 from pip.req.req_install import InstallRequirement
+from poet import lock_file
 from poet.poet import Poet
 
 
@@ -45,3 +46,47 @@ def test_command(app, mocker, tmp_dir):
     with open(requirements_file) as f:
         assert content == f.read()
 
+
+
+def test_command_uses_fresh_lock(app, mocker, tmp_dir):
+    poetry_file = os.path.join(tmp_dir, 'poetry.toml')
+    fixtures = os.path.join(os.path.dirname(__file__), '..', 'fixtures')
+    shutil.copy(os.path.join(fixtures, 'poetry.toml'), poetry_file)
+    shutil.copy(os.path.join(fixtures, 'README.rst'), tmp_dir)
+
+    poet = Poet(poetry_file)
+    with open(poet.lock_file, 'w') as f:
+        f.write(lock_file.dumps(
+            poet.name, poet.version,
+            [
+                {
+                    'name': 'pendulum', 'version': '1.2.0',
+                    'category': 'main', 'optional': False,
+                    'python': ['*'], 'dependencies': []
+                },
+                {
+                    'name': 'pytest', 'version': '3.0.7',
+                    'category': 'dev', 'optional': False,
+                    'python': ['*'], 'dependencies': []
+                }
+            ],
+            fingerprint=poet.fingerprint
+        ))
+
+    resolve = mocker.patch('piptools.resolver.Resolver.resolve')
+    mocker.patch('poet.console.commands.command.Command.poet', poet)
+
+    command = app.find('make:requirements')
+    tester = CommandTester(command)
+    tester.execute([('command', command.name), ('--no-dev', True)])
+
+    expected = """
+ - Using the poetry.lock file
+ - Created requirements.txt file
+"""
+
+    assert expected == tester.get_display()
+    assert not resolve.called
+
+    with open(os.path.join(tmp_dir, 'requirements.txt')) as f:
+        assert 'pendulum==1.2.0\n' == f.read()
@@ -5,6 +5,7 @@ import os
 from cleo import CommandTester
 from poet.console import Application
 from poet.console.commands import UpdateCommand as BaseCommand
+from poet.installer import Installer
 from poet.poet import Poet as BasePoet
 from pip.req.req_install import InstallRequirement
 
@@ -61,6 +62,9 @@ def test_update_only_update(mocker):
     assert sub.call_count == 2
     write_lock.assert_called_once()
 
+    # Nothing was left out, the lock reflects the poetry.toml file
+    assert write_lock.call_args[1]['complete']
+
     output = command_tester.get_display()
     expected = """
 Updating dependencies
@@ -74,6 +78,52 @@ Updating dependencies
     assert output == expected
 
 
+def test_update_dry_run(mocker):
+    sub = mocker.patch('subprocess.check_output')
+    resolve = mocker.patch('piptools.resolver.Resolver.resolve')
+    get_hashes = mocker.patch('piptools.resolver.Resolver.resolve_hashes')
+    reverse_dependencies = mocker.patch('piptools.resolver.Resolver.reverse_dependencies')
+    reverse_dependencies.return_value = {}
+    write_lock = mocker.patch('poet.installer.Installer._write_lock')
+    pendulum_req = InstallRequirement.from_line('pendulum==1.3.0')
+    pytest_req = InstallRequirement.from_line('pytest==3.0.6')
+    requests_req = InstallRequirement.from_line('requests==2.13.0')
+    resolve.return_value = [
+        pendulum_req,
+        pytest_req,
+        requests_req
+    ]
+    get_hashes.return_value = {
+        pendulum_req: set(),
+        pytest_req: set(),
+        requests_req: set()
+    }
+    app = Application()
+    app.add(UpdateCommand())
+
+    command = app.find('update')
+    command_tester = CommandTester(command)
+    command_tester.execute([
+        ('command', command.name), ('--no-progress', True), ('--dry-run', True)
+    ])
+
+    assert sub.call_count == 0
+    assert write_lock.call_count == 0
+
+    output = command_tester.get_display()
+    expected = """
+Updating dependencies
+
+ - Resolving dependencies
+ - Summary: 1 updates, 1 downgrades, 1 installations
+ - Would update pendulum (1.2.0 -> 1.3.0)
+ - Would downgrade pytest (3.0.7 -> 3.0.6)
+ - Would install requests (2.13.0)
+"""
+
+    assert output == expected
+
+
 def test_update_specific_packages(mocker):
     sub = mocker.patch('subprocess.check_output')
     resolve = mocker.patch('piptools.resolver.Resolver.resolve')
@@ -81,8 +131,10 @@ def test_update_specific_packages(mocker):
     reverse_dependencies = mocker.patch('piptools.resolver.Resolver.reverse_dependencies')
     reverse_dependencies.return_value = {}
     write_lock = mocker.patch('poet.installer.Installer._write_lock')
+    resolve_deps = mocker.spy(Installer, 'resolve')
     pendulum_req = InstallRequirement.from_line('pendulum==1.3.0')
-    pytest_req = InstallRequirement.from_line('pytest==3.5.0')
+    # pytest is kept at its locked version
+    pytest_req = InstallRequirement.from_line('pytest==3.0.7')
     resolve.return_value = [
         pendulum_req,
         pytest_req
@@ -107,6 +159,15 @@ def test_update_specific_packages(mocker):
     assert sub.call_count == 1
     write_lock.assert_called_once()
 
+    pins = resolve_deps.call_args[1]['pins']
+    assert ['pytest'] == [p.name for p in pins]
+
+    # The whole dependency set is locked
+    packages = write_lock.call_args[0][0]
+    assert [('pendulum', '1.3.0'), ('pytest', '3.0.7')] == [
+        (p['name'], p['version']) for p in packages
+    ]
+
     output = command_tester.get_display()
     expected = """
 Updating dependencies
@@ -214,3 +275,57 @@ Updating dependencies
 """
 
     assert output == expected
+
+
+def test_update_batch(mocker):
+    requirements = []
+
+    def check_output(cmd, *args, **kwargs):
+        with open(cmd[-1]) as f:
+            requirements.append(f.read())
+
+        return b'Successfully installed pendulum-1.3.0\n'
+
+    sub = mocker.patch('subprocess.check_output', side_effect=check_output)
+    resolve = mocker.patch('piptools.resolver.Resolver.resolve')
+    get_hashes = mocker.patch('piptools.resolver.Resolver.resolve_hashes')
+    reverse_dependencies = mocker.patch('piptools.resolver.Resolver.reverse_dependencies')
+    reverse_dependencies.return_value = {}
+    write_lock = mocker.patch('poet.installer.Installer._write_lock')
+    pendulum_req = InstallRequirement.from_line('pendulum==1.3.0')
+    pytest_req = InstallRequirement.from_line('pytest==3.5.0')
+    resolve.return_value = [
+        pendulum_req,
+        pytest_req
+    ]
+    get_hashes.return_value = {
+        pendulum_req: set(),
+        pytest_req: set()
+    }
+    app = Application()
+    app.add(UpdateCommand())
+
+    command = app.find('update')
+    command_tester = CommandTester(command)
+    command_tester.execute([
+        ('command', command.name),
+        ('--no-progress', True),
+        ('--batch', True)
+    ])
+
+    assert sub.call_count == 1
+    assert ['pendulum==1.3.0\npytest==3.5.0\n'] == requirements
+    write_lock.assert_called_once()
+
+    output = command_tester.get_display()
+    expected = """
+Updating dependencies
+
+ - Resolving dependencies
+ - Summary: 2 updates
+ - Installing 2 packages
+ - Updated pendulum (1.2.0 -> 1.3.0)
+ - pytest (3.0.7 -> 3.5.0) is already installed
+"""
+
+    assert output == expected
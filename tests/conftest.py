@@ -1,9 +1,17 @@
 # -*- coding: utf-8 -*-
 
+import json
 import os
 import pytest
 import tempfile
+import threading
 import shutil
+import subprocess
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
 
 from cleo.inputs.list_input import ListInput
 from cleo.outputs.console_output import ConsoleOutput
@@ -11,6 +19,7 @@ from cleo.styles import CleoStyle
 
 from poet.console import Application
 from poet.console.commands.command import Command
+from poet.resolution import MetadataProvider
 
 
 class DummyCommand(Command):
@@ -27,6 +36,114 @@ class DummyCommand(Command):
         self.output = CleoStyle(self.input, ConsoleOutput())
 
 
+class JsonServer(HTTPServer):
+    """
+    Local stand-in for a JSON API.
+
+    Documents registered with add() are served with an ETag
+    and conditional requests are answered with a 304.
+    Every request is recorded.
+    """
+
+    def __init__(self):
+        HTTPServer.__init__(self, ('127.0.0.1', 0), JsonRequestHandler)
+
+        self.documents = {}
+        self.requests = []
+
+    @property
+    def url(self):
+        return 'http://127.0.0.1:{}'.format(self.server_address[1])
+
+    def add(self, path, document, etag=None):
+        self.documents[path] = (json.dumps(document), etag)
+
+
+class JsonRequestHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        # Header names are lowercased on Python 2
+        self.server.requests.append((
+            self.path,
+            dict((k.lower(), v) for k, v in self.headers.items())
+        ))
+
+        if self.path not in self.server.documents:
+            self.send_response(404)
+            self.end_headers()
+
+            return
+
+        body, etag = self.server.documents[self.path]
+        if etag is not None and self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.end_headers()
+
+            return
+
+        body = body.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        if etag is not None:
+            self.send_header('ETag', etag)
+
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class FakeProvider(MetadataProvider):
+    """
+    In-memory metadata provider.
+
+    Packages are given as a mapping of names to mappings
+    of versions to requirements. If asked to, the dependencies
+    fetched are recorded, from any thread, in calls.
+    """
+
+    def __init__(self, packages, record_calls=False):
+        self._packages = packages
+        self._lock = threading.Lock()
+        self.calls = [] if record_calls else None
+
+    def versions(self, name):
+        if name not in self._packages:
+            raise Exception('Package [{}] not found'.format(name))
+
+        return list(self._packages[name].keys())
+
+    def dependencies(self, name, version):
+        if self.calls is not None:
+            with self._lock:
+                self.calls.append((name, version))
+
+        return self._packages[name][version]
+
+    def hashes(self, name, version):
+        return ['sha256:{}-{}'.format(name, version)]
+
+
+@pytest.fixture
+def fake_provider():
+    return FakeProvider
+
+
+@pytest.fixture
+def json_server():
+    server = JsonServer()
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
 @pytest.fixture
 def app():
     return Application()
@@ -67,3 +184,43 @@ def tmp_file():
     yield dir_
 
     os.unlink(file_)
+
+
+class GitRepository(object):
+    """
+    Local git repository standing in for a remote one.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.url = 'file://' + path
+
+        self.git('init', '--quiet')
+
+    def git(self, *args):
+        return subprocess.check_output(
+            [
+                'git',
+                '-c', 'user.name=Poet', '-c', 'user.email=poet@example.com',
+                '-c', 'commit.gpgsign=false', '-c', 'tag.gpgsign=false'
+            ] + list(args),
+            cwd=self.path, stderr=subprocess.STDOUT
+        ).decode().strip()
+
+    def commit(self, message):
+        with open(os.path.join(self.path, 'file.txt'), 'a') as f:
+            f.write(message + '\n')
+
+        self.git('add', 'file.txt')
+        self.git('commit', '--quiet', '-m', message)
+
+        return self.git('rev-parse', 'HEAD')
+
+
+@pytest.fixture
+def git_repo():
+    dir_ = tempfile.mkdtemp(prefix='poet_')
+
+    yield GitRepository(dir_)
+
+    shutil.rmtree(dir_)
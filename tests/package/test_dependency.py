@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
 
+import pytest
+
 from poet.package.dependency import Dependency
+from poet.package.pip_dependency import PipDependency
 
 
 def test_normalized_caret():
@@ -141,3 +144,41 @@ def test_python_restricted_dependency():
     assert not dep.is_vcs_dependency()
     assert not dep.accepts_prereleases()
     assert ['~2.7'] == [str(dep.python[0])]
+
+
+def test_create_interns_dependencies():
+    dep = Dependency.create('foo', {'version': '^1.2.3', 'python': ['~2.7']})
+
+    assert dep is Dependency.create('foo', {'python': ['~2.7'], 'version': '^1.2.3'})
+    assert dep is not Dependency.create('foo', {'version': '^1.2.3', 'python': ['~2.7']}, category='dev')
+    assert dep is not Dependency.create('bar', {'version': '^1.2.3', 'python': ['~2.7']})
+    assert dep is not PipDependency.create('foo', {'version': '^1.2.3', 'python': ['~2.7']})
+
+    pip_dep = PipDependency.create('foo', '1.2.3', checksum=['sha256:abc'])
+    assert pip_dep is PipDependency.create('foo', '1.2.3', checksum=['sha256:abc'])
+    assert pip_dep is not PipDependency.create('foo', '1.2.3', checksum=['sha256:def'])
+
+    with pytest.raises(AttributeError):
+        dep.foo = 'bar'
+
+
+def test_normalization_is_memoized(mocker):
+    Dependency('foo', '^1.2.3-rc.2')
+
+    normalize = mocker.spy(Dependency, '_normalize')
+    dep = Dependency('bar', '^1.2.3-rc.2')
+
+    assert not normalize.called
+    assert Dependency('foo', '^1.2.3-rc.2').normalized_constraint == dep.normalized_constraint
+    assert dep.accepts_prereleases()
+
+    git = {'git': 'https://github.com/sdispater/pendulum.git', 'branch': 'master'}
+    assert 'pendulum' in PipDependency('pendulum', git).normalized_name
+    assert 'pytzdata' in PipDependency('pytzdata', git).normalized_name
+
+
+def test_memoized_normalizations_are_bounded():
+    for i in range(Dependency._normalized.maxsize + 10):
+        Dependency('foo', '=={}.0.0'.format(i))
+
+    assert Dependency._normalized.maxsize == len(Dependency._normalized)
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+
+from semantic_version import Spec, Version
+
+from poet.package import PipDependency, PythonFilter
+
+
+def test_partition():
+    deps = [
+        PipDependency('pendulum', '1.2.0'),
+        PipDependency('pathlib2', {'version': '2.2.0', 'python': '~2.7'}),
+        PipDependency('typing', {'version': '3.6.1', 'python': ['~2.7', '~3.4']}),
+        PipDependency('asyncio', {'version': '3.4.3', 'python': '^3.3'}),
+    ]
+
+    compatible, incompatible = PythonFilter(Version('3.6.1')).partition(deps)
+
+    assert ['pendulum', 'asyncio'] == [d.name for d in compatible]
+    assert ['pathlib2', 'typing'] == [d.name for d in incompatible]
+
+    compatible, incompatible = PythonFilter(Version('2.7.13')).partition(deps)
+
+    assert ['pendulum', 'pathlib2', 'typing'] == [d.name for d in compatible]
+    assert ['asyncio'] == [d.name for d in incompatible]
+
+
+def test_specs_are_evaluated_once(mocker):
+    deps = [
+        PipDependency('package-{}'.format(i), {'version': '1.0', 'python': ['~2.7', '^3.5']})
+        for i in range(10)
+    ]
+    match = mocker.spy(Spec, 'match')
+
+    python_filter = PythonFilter(Version('3.6.1'))
+
+    assert all(python_filter.accepts(dep) for dep in deps)
+    assert 2 == match.call_count
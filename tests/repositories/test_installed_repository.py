@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+import os
+
+from poet.repositories import InstalledRepository
+
+
+def write_metadata(path, name, version):
+    with open(path, 'w') as f:
+        f.write(
+            'Metadata-Version: 2.0\n'
+            'Name: {}\n'
+            'Version: {}\n'
+            '\n'
+            'Version: 0.0.0\n'.format(name, version)
+        )
+
+
+def test_packages(tmp_dir):
+    os.mkdir(os.path.join(tmp_dir, 'pendulum-1.2.0.dist-info'))
+    write_metadata(
+        os.path.join(tmp_dir, 'pendulum-1.2.0.dist-info', 'METADATA'),
+        'pendulum', '1.2.0'
+    )
+    os.mkdir(os.path.join(tmp_dir, 'Python_Dateutil-2.6.0.egg-info'))
+    write_metadata(
+        os.path.join(tmp_dir, 'Python_Dateutil-2.6.0.egg-info', 'PKG-INFO'),
+        'Python_Dateutil', '2.6.0'
+    )
+    write_metadata(
+        os.path.join(tmp_dir, 'pytzdata-2017.2-py3.6.egg-info'),
+        'pytzdata', '2017.2'
+    )
+    os.mkdir(os.path.join(tmp_dir, 'pendulum'))
+
+    repository = InstalledRepository([tmp_dir, os.path.join(tmp_dir, 'missing')])
+
+    assert {
+        'pendulum': '1.2.0',
+        'python-dateutil': '2.6.0',
+        'pytzdata': '2017.2'
+    } == repository.packages
+
+
+def test_is_installed(tmp_dir):
+    os.mkdir(os.path.join(tmp_dir, 'pytzdata-2017.2.dist-info'))
+    write_metadata(
+        os.path.join(tmp_dir, 'pytzdata-2017.2.dist-info', 'METADATA'),
+        'pytzdata', '2017.2'
+    )
+
+    repository = InstalledRepository([tmp_dir])
+
+    assert repository.is_installed('pytzdata', '2017.2')
+    assert repository.is_installed('PyTZData', '2017.2.0')
+    assert not repository.is_installed('pytzdata', '2017.3')
+    assert not repository.is_installed('pendulum', '1.2.0')
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+from pip.req import InstallRequirement
+
+from poet.package import PipDependency
+from poet.repositories import LockedRepository
+
+
+class FakeRepository(object):
+
+    def find_best_match(self, ireq, prereleases=None):
+        return InstallRequirement.from_line('{}==2.0.0'.format(ireq.name))
+
+    def get_hashes(self, ireq):
+        return set(['sha256:{}'.format(ireq)])
+
+
+def test_find_best_match_prefers_pins():
+    repository = LockedRepository(
+        [
+            PipDependency('Pendulum', '1.2.0', checksum=['sha256:locked']),
+            PipDependency('pytzdata', '2017.2'),
+        ],
+        FakeRepository()
+    )
+
+    pendulum = repository.find_best_match(
+        InstallRequirement.from_line('pendulum>=1.2,<2.0')
+    )
+    assert 'pendulum==1.2.0' == str(pendulum.req)
+    assert set(['sha256:locked']) == repository.get_hashes(pendulum)
+
+    pendulum = repository.find_best_match(
+        InstallRequirement.from_line('pendulum>=2.0')
+    )
+    assert 'pendulum==2.0.0' == str(pendulum.req)
+    assert set(['sha256:pendulum==2.0.0']) == repository.get_hashes(pendulum)
+
+    pytzdata = repository.find_best_match(InstallRequirement.from_line('pytzdata'))
+    assert 'pytzdata==2017.2' == str(pytzdata.req)
+    assert set(['sha256:pytzdata==2017.2']) == repository.get_hashes(pytzdata)
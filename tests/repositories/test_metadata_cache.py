@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+import os
+import pytest
+
+from poet.repositories import MetadataCache, PyPiRepository
+from poet.version_index_cache import VersionIndexCache
+
+
+PENDULUM = {
+    'info': {
+        'name': 'pendulum'
+    },
+    'releases': {
+        '1.2.0': [],
+        '1.3.0': []
+    }
+}
+
+
+def test_get_json_caches_responses(tmp_dir, json_server):
+    json_server.add('/pendulum/json', PENDULUM, etag='"1"')
+    url = json_server.url + '/pendulum/json'
+
+    cache = MetadataCache(tmp_dir)
+
+    assert PENDULUM == cache.get_json(url)
+    assert PENDULUM == cache.get_json(url)
+    assert 1 == len(json_server.requests)
+    assert 1 == cache.misses
+    assert 1 == cache.hits
+
+    # A new cache instance reads from the disk
+    cache = MetadataCache(tmp_dir)
+
+    assert PENDULUM == cache.get_json(url)
+    assert 1 == len(json_server.requests)
+
+
+def test_get_json_revalidates_stale_entries(tmp_dir, json_server):
+    json_server.add('/pendulum/json', PENDULUM, etag='"1"')
+    url = json_server.url + '/pendulum/json'
+
+    MetadataCache(tmp_dir).get_json(url)
+
+    cache = MetadataCache(tmp_dir, ttl=0)
+
+    assert PENDULUM == cache.get_json(url)
+    assert 2 == len(json_server.requests)
+    assert '"1"' == json_server.requests[1][1].get('if-none-match')
+    assert 1 == cache.revalidations
+    assert 0 == cache.misses
+
+
+def test_get_json_refreshes_modified_entries(tmp_dir, json_server):
+    json_server.add('/pendulum/json', PENDULUM, etag='"1"')
+    url = json_server.url + '/pendulum/json'
+
+    MetadataCache(tmp_dir).get_json(url)
+
+    json_server.add('/pendulum/json', {'info': {'name': 'Pendulum'}}, etag='"2"')
+    cache = MetadataCache(tmp_dir, ttl=0)
+
+    assert {'info': {'name': 'Pendulum'}} == cache.get_json(url)
+    assert 1 == cache.misses
+    assert {'info': {'name': 'Pendulum'}} == MetadataCache(tmp_dir).get_json(url)
+
+
+def test_get_json_not_found(tmp_dir, json_server):
+    cache = MetadataCache(tmp_dir)
+
+    assert cache.get_json(json_server.url + '/missing/json') is None
+
+
+def test_get_json_offline(tmp_dir, json_server):
+    json_server.add('/pendulum/json', PENDULUM)
+    url = json_server.url + '/pendulum/json'
+
+    MetadataCache(tmp_dir).get_json(url)
+
+    cache = MetadataCache(tmp_dir, ttl=0, offline=True)
+
+    assert PENDULUM == cache.get_json(url)
+    assert 1 == len(json_server.requests)
+
+    with pytest.raises(Exception):
+        cache.get_json(json_server.url + '/pytzdata/json')
+
+    assert 1 == len(json_server.requests)
+
+
+def test_repository_uses_cache(tmp_dir, json_server):
+    json_server.add('/pendulum/json', PENDULUM)
+
+    repository = PyPiRepository(
+        json_server.url,
+        cache=MetadataCache(tmp_dir),
+        index_cache=VersionIndexCache(os.path.join(tmp_dir, 'versions'))
+    )
+
+    assert ['1.2.0', '1.3.0'] == sorted(repository.releases('pendulum'))
+    assert ['1.3.0'] == [
+        str(p.version) for p in repository.find_packages('pendulum', '^1.3')
+    ]
+    assert 'pendulum' == repository.package_name('pendulum')
+    assert [] == repository.releases('missing')
+    assert 2 == len(json_server.requests)
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+import threading
+
+from poet.resolution import Prefetcher, Resolver
+
+
+PACKAGES = {
+    'pendulum': {
+        '1.2.0': ['pytzdata>=2016.1', 'python-dateutil'],
+        '2.0.0': ['pytzdata>=2018.1'],
+    },
+    'pytzdata': {
+        '2016.1': [],
+        '2017.2': [],
+    },
+    'python-dateutil': {
+        '2.6.0': [
+            'six>=1.5',
+            'enum34; python_version < "1.0"',
+            'pytest; extra == "test"',
+        ],
+    },
+    'six': {
+        '1.10.0': [],
+        '1.11.0b1': [],
+    },
+    'pytest': {
+        '3.0.7': ['py>=1.4.29'],
+    },
+    'py': {
+        '1.4.33': [],
+    },
+}
+
+
+def test_prefetch(fake_provider):
+    provider = fake_provider(PACKAGES, record_calls=True)
+
+    selected = Prefetcher(provider, workers=4).prefetch(
+        [('pendulum', '<2.0.0')]
+    )
+
+    assert {
+        'pendulum': '1.2.0',
+        'pytzdata': '2017.2',
+        'python-dateutil': '2.6.0',
+        'six': '1.10.0',
+    } == selected
+    assert sorted(selected.items()) == sorted(provider.calls)
+
+
+def test_prefetch_extras(fake_provider):
+    provider = fake_provider(PACKAGES, record_calls=True)
+
+    selected = Prefetcher(provider).prefetch(
+        [('python-dateutil', ''), ('python_dateutil[test]', '')],
+        prereleases=True
+    )
+
+    assert {
+        'python-dateutil': '2.6.0',
+        'six': '1.11.0b1',
+        'pytest': '3.0.7',
+        'py': '1.4.33',
+    } == selected
+    assert 2 == provider.calls.count(('python-dateutil', '2.6.0'))
+
+
+def test_prefetch_ignores_failures(fake_provider):
+    provider = fake_provider(PACKAGES)
+
+    selected = Prefetcher(provider).prefetch(
+        [('missing', ''), ('pendulum', '>=3.0'), ('six', '')]
+    )
+
+    assert {'six': '1.10.0'} == selected
+
+
+def test_prefetch_is_concurrent(fake_provider):
+    started = threading.Event()
+
+    class BlockingProvider(fake_provider):
+
+        def versions(self, name):
+            if name == 'pytzdata':
+                # Blocks until six is being fetched concurrently
+                assert started.wait(5)
+            elif name == 'six':
+                started.set()
+
+            return super(BlockingProvider, self).versions(name)
+
+    provider = BlockingProvider(PACKAGES)
+
+    selected = Prefetcher(provider, workers=2).prefetch(
+        [('pytzdata', ''), ('six', '')]
+    )
+
+    assert {'pytzdata': '2017.2', 'six': '1.10.0'} == selected
+
+
+def test_resolver_prefetches(fake_provider):
+    provider = fake_provider(PACKAGES, record_calls=True)
+
+    resolver = Resolver(provider, prefetcher=Prefetcher(provider))
+    resolution = resolver.resolve([('pendulum', '<2.0.0')])
+
+    assert '1.2.0' == resolution.packages['pendulum']
+    assert sorted(resolution.packages.items()) == sorted(set(provider.calls))
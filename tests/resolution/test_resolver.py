@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import sys
+
+from poet.exceptions.resolution import ResolutionError
+from poet.resolution import Resolver
+
+
+def test_resolve(fake_provider):
+    provider = fake_provider({
+        'pendulum': {
+            '1.2.0': ['pytzdata>=2016.1', 'python-dateutil'],
+            '1.3.0': ['pytzdata>=2017.1', 'python-dateutil'],
+            '2.0.0': ['pytzdata>=2018.1'],
+        },
+        'pytzdata': {
+            '2016.1': [],
+            '2017.2': [],
+        },
+        'python-dateutil': {
+            '2.6.0': ['six>=1.5'],
+        },
+        'six': {
+            '1.10.0': [],
+            '1.11.0b1': [],
+        },
+    })
+
+    resolution = Resolver(provider).resolve([('pendulum', '>=1.2.0,<2.0.0')])
+
+    assert {
+        'pendulum': '1.3.0',
+        'pytzdata': '2017.2',
+        'python-dateutil': '2.6.0',
+        'six': '1.10.0',
+    } == resolution.packages
+    assert {
+        'pendulum': set(['pytzdata', 'python-dateutil']),
+        'pytzdata': set(),
+        'python-dateutil': set(['six']),
+        'six': set(),
+    } == resolution.dependencies
+    assert ['sha256:six-1.10.0'] == resolution.hashes('six')
+
+
+def test_resolve_prereleases(fake_provider):
+    provider = fake_provider({
+        'six': {
+            '1.10.0': [],
+            '1.11.0b1': [],
+        },
+    })
+
+    resolution = Resolver(provider).resolve([('six', '')], prereleases=True)
+
+    assert {'six': '1.11.0b1'} == resolution.packages
+
+
+def test_resolve_backtracks(fake_provider):
+    provider = fake_provider({
+        'foo': {
+            '1.0.0': ['bar>=1.0'],
+            '2.0.0': ['bar<1.0'],
+        },
+        'bar': {
+            '0.9.0': [],
+            '1.0.0': [],
+        },
+        'baz': {
+            '1.0.0': ['bar>=1.0'],
+        },
+    })
+
+    resolution = Resolver(provider).resolve([('foo', ''), ('baz', '')])
+
+    assert {'foo': '1.0.0', 'bar': '1.0.0', 'baz': '1.0.0'} == resolution.packages
+
+
+def test_resolve_jumps_back_to_the_conflicting_decision(fake_provider):
+    provider = fake_provider({
+        'a-foo': {
+            '1.0.0': ['c-bar>=1.0'],
+            '2.0.0': ['c-bar<1.0'],
+        },
+        # Decided between a-foo and c-bar but unrelated to the conflict
+        'b-qux': {
+            '1.0.0': [],
+            '1.1.0': [],
+        },
+        'c-bar': {
+            '0.8.0': ['conflict>=2.0'],
+            '0.9.0': ['conflict>=2.0'],
+            '1.0.0': [],
+        },
+        'conflict': {
+            '1.0.0': [],
+        },
+    }, record_calls=True)
+
+    resolution = Resolver(provider).resolve([('a-foo', ''), ('b-qux', '')])
+
+    assert {
+        'a-foo': '1.0.0',
+        'b-qux': '1.1.0',
+        'c-bar': '1.0.0',
+    } == resolution.packages
+    # Other versions of b-qux have not been tried
+    assert [('b-qux', '1.1.0')] == [c for c in provider.calls if c[0] == 'b-qux']
+
+
+def test_resolve_extras(fake_provider):
+    provider = fake_provider({
+        'requests': {
+            '2.18.0': [
+                'idna>=2.5',
+                'pyopenssl>=0.14; extra == "security"'
+            ],
+        },
+        'idna': {
+            '2.6': [],
+        },
+        'pyopenssl': {
+            '17.3.0': [],
+        },
+    })
+
+    resolution = Resolver(provider).resolve([('requests', '')])
+
+    assert {'requests': '2.18.0', 'idna': '2.6'} == resolution.packages
+
+    resolution = Resolver(provider).resolve([('requests[security]', '>=2.0')])
+
+    assert {
+        'requests': '2.18.0',
+        'idna': '2.6',
+        'pyopenssl': '17.3.0',
+    } == resolution.packages
+    assert set(['idna', 'pyopenssl']) == resolution.dependencies['requests']
+
+
+def test_resolve_failure(fake_provider):
+    provider = fake_provider({
+        'foo': {
+            '1.0.0': ['bar>=2.0'],
+        },
+        'bar': {
+            '1.0.0': [],
+        },
+    })
+
+    with pytest.raises(ResolutionError) as e:
+        Resolver(provider).resolve([('foo', '')])
+
+    assert 'Unable to find a version of [bar] matching >=2.0 (foo)' == str(e.value)
+
+
+def test_resolve_large_dependency_sets(fake_provider):
+    # Deeper than the recursion limit
+    count = sys.getrecursionlimit() + 100
+    packages = {}
+    for i in range(count):
+        # Every 2.0.0 version requires a missing version of the next package
+        if i + 1 < count:
+            dependencies = ['package-{}>=1.0'.format(i + 1)]
+            conflicting = ['package-{}>=3.0'.format(i + 1)]
+        else:
+            dependencies = conflicting = []
+
+        packages['package-{}'.format(i)] = {
+            '1.0.0': dependencies,
+            '2.0.0': conflicting,
+        }
+
+    del packages['package-{}'.format(count - 1)]['2.0.0']
+
+    resolution = Resolver(fake_provider(packages)).resolve([('package-0', '')])
+
+    assert count == len(resolution.packages)
+    assert set(['1.0.0']) == set(resolution.packages.values())
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+
+from poet.installer import Installer
+from poet.repositories import PyPiRepository
+from poet.package import PipDependency
+
+
+def test_install_parallel_installs_vcs_packages_last(mocker):
+    command = mocker.MagicMock()
+    command.pip.return_value = 'pip'
+    installer = Installer(command, PyPiRepository(), jobs=2)
+    # Not going through the git mirror
+    mocker.patch.object(
+        installer, '_requirement',
+        side_effect=lambda dep: (
+            'git+https://github.com/sdispater/pendulum.git@master'
+            if dep.is_vcs_dependency() else dep.normalized_name
+        )
+    )
+    call = mocker.patch.object(installer, '_call')
+
+    installer._install_parallel([
+        PipDependency(
+            'pendulum',
+            {'git': 'https://github.com/sdispater/pendulum.git', 'branch': 'master'}
+        ),
+        PipDependency('pytzdata', '2017.2.0'),
+        PipDependency('six', '1.10.0')
+    ])
+
+    cmds = [c[0][0] for c in call.call_args_list]
+
+    # Locked packages are installed by the pool without their dependencies
+    assert [
+        ['pip', 'install', 'pytzdata==2017.2.0', '--no-deps'],
+        ['pip', 'install', 'six==1.10.0', '--no-deps']
+    ] == sorted(cmds[:2])
+
+    # The dependencies of VCS packages are not locked,
+    # so they are installed with them, once the pool is done
+    assert [
+        'pip', 'install', 'git+https://github.com/sdispater/pendulum.git@master',
+        '-U', '--upgrade-strategy', 'only-if-needed'
+    ] == cmds[2]
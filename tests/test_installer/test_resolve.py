@@ -5,6 +5,7 @@ from pip.req.req_install import InstallRequirement
 from poet.installer import Installer
 from poet.repositories import PyPiRepository
 from poet.package.pip_dependency import PipDependency
+from poet.resolution import Resolver
 
 pendulum_req = InstallRequirement.from_line('pendulum==1.2.0')
 pytzdata_req = InstallRequirement.from_line('pytzdata==2017.2')
@@ -262,3 +263,174 @@ def test_resolve_specific_python_and_wildcard_multiple_parent(mocker, command):
     assert ['~2.7'] == pendulum['python']
     assert ['*'] == pytzdata['python']
     assert ['*'] == requests['python']
+
+
+def test_get_packages_attributes_diamond(command):
+    installer = Installer(command, PyPiRepository())
+
+    dependencies = {
+        'pendulum': set(['python-dateutil', 'pytzdata']),
+        'pytest': set(['py', 'six']),
+        'python-dateutil': set(['six']),
+        'pytzdata': set(['six']),
+    }
+
+    attributes = installer._get_packages_attributes(dependencies, [
+        PipDependency('pendulum', {'version': '^1.2', 'python': '~2.7'}),
+        PipDependency('pytest', '^3.0', category='dev'),
+    ])
+
+    assert ('main', False, ['~2.7']) == attributes['pendulum']
+    assert ('main', False, ['~2.7']) == attributes['pytzdata']
+    assert ('dev', False, ['*']) == attributes['py']
+    # Required by both a main and a dev dependency
+    assert ('main', False, ['*']) == attributes['six']
+
+
+def test_get_packages_attributes_optional_and_cycles(command):
+    installer = Installer(command, PyPiRepository())
+
+    dependencies = {
+        'foo': set(['bar', 'quux']),
+        'bar': set(['baz']),
+        'baz': set(['bar']),
+        'qux': set(['baz']),
+    }
+
+    attributes = installer._get_packages_attributes(dependencies, [
+        PipDependency('foo', {'version': '^1.0', 'optional': True}),
+        PipDependency('qux', {'version': '^1.0', 'python': ['~2.7', '^3.4']}),
+    ])
+
+    assert ('main', True, ['*']) == attributes['foo']
+    assert ('main', True, ['*']) == attributes['quux']
+    # Required through the bar <-> baz cycle
+    assert ('main', False, ['*']) == attributes['bar']
+    assert ('main', False, ['*']) == attributes['baz']
+    assert ('main', False, ['^3.4', '~2.7']) == attributes['qux']
+
+
+def test_resolve_native(command, fake_provider):
+    provider = fake_provider({
+        'pendulum': {
+            '1.2.0': ['pytzdata>=2016.1', 'setuptools'],
+        },
+        'pytzdata': {
+            '2017.2': [],
+        },
+        'pytest': {
+            '3.0.7': ['py>=1.4.29'],
+        },
+        'py': {
+            '1.4.34': [],
+        },
+        'setuptools': {
+            '36.0.1': [],
+        },
+    })
+    installer = Installer(command, PyPiRepository(), resolver=Resolver(provider))
+
+    packages = installer._resolve([
+        PipDependency('pendulum', {'version': '^1.2', 'python': '~2.7'}),
+        PipDependency('pytest', '^3.0', category='dev')
+    ])
+
+    assert [
+        {
+            'name': 'pendulum',
+            'version': '1.2.0',
+            'checksum': ['sha256:pendulum-1.2.0'],
+            'category': 'main',
+            'optional': False,
+            'python': ['~2.7'],
+            'dependencies': ['pytzdata'],
+        },
+        {
+            'name': 'py',
+            'version': '1.4.34',
+            'checksum': ['sha256:py-1.4.34'],
+            'category': 'dev',
+            'optional': False,
+            'python': ['*'],
+            'dependencies': [],
+        },
+        {
+            'name': 'pytest',
+            'version': '3.0.7',
+            'checksum': ['sha256:pytest-3.0.7'],
+            'category': 'dev',
+            'optional': False,
+            'python': ['*'],
+            'dependencies': ['py'],
+        },
+        {
+            'name': 'pytzdata',
+            'version': '2017.2',
+            'checksum': ['sha256:pytzdata-2017.2'],
+            'category': 'main',
+            'optional': False,
+            'python': ['~2.7'],
+            'dependencies': [],
+        },
+    ] == packages
+
+
+def test_resolve_native_with_pins(command, fake_provider):
+    provider = fake_provider({
+        'pendulum': {
+            '1.2.0': ['pytzdata>=2016.1'],
+            '1.3.0': ['pytzdata>=2016.1'],
+        },
+        'pytzdata': {
+            '2016.1': [],
+            '2017.2': [],
+        },
+    })
+    installer = Installer(command, PyPiRepository(), resolver=Resolver(provider))
+
+    pins = [
+        PipDependency('pendulum', '1.2.0', checksum=['sha256:locked-pendulum']),
+        PipDependency('pytzdata', '2016.1', checksum=['sha256:locked-pytzdata']),
+    ]
+
+    packages = installer._resolve([PipDependency('pendulum', '^1.2')], pins=pins)
+
+    assert [
+        ('pendulum', '1.2.0', ['sha256:locked-pendulum']),
+        ('pytzdata', '2016.1', ['sha256:locked-pytzdata']),
+    ] == [(p['name'], p['version'], p['checksum']) for p in packages]
+
+    # Pins not satisfying the requirements anymore are dropped
+    packages = installer._resolve([PipDependency('pendulum', '^1.3')], pins=pins)
+
+    assert [
+        ('pendulum', '1.3.0', ['sha256:pendulum-1.3.0']),
+        ('pytzdata', '2016.1', ['sha256:locked-pytzdata']),
+    ] == [(p['name'], p['version'], p['checksum']) for p in packages]
+
+
+def test_get_unlocked_packages(command):
+    installer = Installer(command, PyPiRepository())
+
+    locked = [
+        PipDependency('pendulum', '1.2.0', dependencies=['pytzdata', 'python-dateutil']),
+        PipDependency('pytzdata', '2017.2'),
+        PipDependency('python-dateutil', '2.6.0', dependencies=['six']),
+        PipDependency('six', '1.10.0'),
+        PipDependency('requests', '2.13.0', dependencies=['idna']),
+        PipDependency('idna', '2.5', dependencies=['six']),
+    ]
+    deps = [
+        PipDependency('pendulum', '^1.2'),
+        PipDependency('requests', '^2.13'),
+    ]
+
+    assert set(['pendulum', 'pytzdata', 'python-dateutil']) == installer._get_unlocked_packages(
+        ['pendulum'], deps, locked
+    )
+    assert set(['requests', 'idna']) == installer._get_unlocked_packages(
+        ['requests'], deps, locked
+    )
+    assert set(['pendulum', 'pytzdata', 'python-dateutil', 'requests', 'idna', 'six']) == (
+        installer._get_unlocked_packages(['pendulum', 'requests'], deps, locked)
+    )
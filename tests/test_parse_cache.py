@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import toml
+
+from poet.lock import Lock
+from poet.parse_cache import ParseCache
+from poet.poet import Poet
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+def copy_fixtures(directory):
+    for name in ['poetry.toml', 'poetry.lock', 'README.rst']:
+        shutil.copy(os.path.join(FIXTURES, name), directory)
+
+    return os.path.join(directory, 'poetry.toml')
+
+
+def test_config_is_parsed_once(tmp_dir, mocker):
+    path = copy_fixtures(tmp_dir)
+    cache = ParseCache()
+    loads = mocker.spy(toml, 'loads')
+
+    config = cache.config(path)
+
+    assert 'pypoet' == config['package']['name']
+    assert config is cache.config(path)
+    assert 1 == loads.call_count
+
+    with open(path, 'a') as f:
+        f.write('\n')
+
+    assert config is not cache.config(path)
+    assert 2 == loads.call_count
+
+
+def test_config_snapshot(tmp_dir, mocker):
+    path = copy_fixtures(tmp_dir)
+    snapshots = os.path.join(tmp_dir, 'snapshots')
+
+    config = ParseCache(snapshots).config(path)
+    assert 1 == len(os.listdir(snapshots))
+
+    loads = mocker.spy(toml, 'loads')
+
+    assert config == ParseCache(snapshots).config(path)
+    assert not loads.called
+
+    with open(path, 'a') as f:
+        f.write('\n')
+
+    assert config == ParseCache(snapshots).config(path)
+    assert 1 == loads.call_count
+
+
+def test_config_snapshot_failures_are_ignored(tmp_dir, mocker):
+    path = copy_fixtures(tmp_dir)
+
+    # The snapshot directory cannot be created under a file
+    snapshots = os.path.join(path, 'snapshots')
+
+    assert 'pypoet' == ParseCache(snapshots).config(path)['package']['name']
+
+    snapshots = os.path.join(tmp_dir, 'snapshots')
+    os.makedirs(snapshots)
+    mocker.patch('os.rename', side_effect=OSError)
+
+    assert 'pypoet' == ParseCache(snapshots).config(path)['package']['name']
+
+    # The temporary file is removed
+    assert [] == os.listdir(snapshots)
+
+
+def test_poet_caches_the_lock(tmp_dir):
+    poet = Poet(copy_fixtures(tmp_dir))
+
+    lock = poet.lock
+
+    assert isinstance(lock, Lock)
+    assert lock is poet.lock
+
+    poet.parse_cache.invalidate(poet.lock_file)
+
+    assert lock is not poet.lock
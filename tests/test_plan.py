@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+from poet.package import PipDependency
+from poet.plan import Action, diff
+
+
+def test_diff():
+    current_deps = [
+        PipDependency('pendulum', '1.2.0', dependencies=['pytzdata']),
+        PipDependency('pytzdata', '2017.2'),
+        PipDependency('requests', '2.13.0', dependencies=['idna']),
+        PipDependency('idna', '2.5'),
+        PipDependency('six', '1.10.0'),
+    ]
+    deps = [
+        PipDependency('pendulum', '1.3.0', dependencies=['pytzdata', 'python-dateutil']),
+        PipDependency('python-dateutil', '2.6.0', dependencies=['six']),
+        PipDependency('pytzdata', '2017.2'),
+        PipDependency('six', '1.9.0'),
+    ]
+
+    plan = diff(deps, current_deps)
+
+    assert [
+        ('downgrade', 'six'),
+        ('install', 'python-dateutil'),
+        ('update', 'pendulum'),
+        ('remove', 'requests'),
+        ('remove', 'idna'),
+    ] == [(a.kind, a.name) for a in plan]
+    assert [('install', 1), ('update', 1), ('downgrade', 1), ('remove', 2)] == plan.summary()
+
+    # Actions are still comparable to tuples
+    assert ('update', current_deps[0], deps[0]) == plan.actions[2]
+
+    assert [
+        {'action': 'downgrade', 'name': 'six', 'from': '1.10.0', 'to': '1.9.0'},
+        {'action': 'install', 'name': 'python-dateutil', 'from': None, 'to': '2.6.0'},
+        {'action': 'update', 'name': 'pendulum', 'from': '1.2.0', 'to': '1.3.0'},
+        {'action': 'remove', 'name': 'requests', 'from': '2.13.0', 'to': None},
+        {'action': 'remove', 'name': 'idna', 'from': '2.5', 'to': None},
+    ] == plan.as_dict()['actions']
+
+
+def test_diff_without_removals():
+    plan = diff(
+        [PipDependency('pendulum', '1.2.0')],
+        [PipDependency('pendulum', '1.2.0'), PipDependency('six', '1.10.0')],
+        delete=False
+    )
+
+    assert 0 == len(plan)
+
+
+def test_diff_breaks_cycles():
+    deps = [
+        PipDependency('foo', '1.0.0', dependencies=['bar']),
+        PipDependency('bar', '1.0.0', dependencies=['foo']),
+        PipDependency('baz', '1.0.0', dependencies=['bar']),
+    ]
+
+    plan = diff(deps, [])
+
+    assert ['foo', 'bar', 'baz'] == [a.name for a in plan]
+    assert all(a.kind == Action.INSTALL for a in plan)
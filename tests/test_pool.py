@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+import threading
+
+from poet.pool import Pool
+
+
+def test_run_respects_dependencies():
+    done = []
+    lock = threading.Lock()
+
+    def task(name):
+        def run():
+            with lock:
+                done.append(name)
+
+            return name
+
+        return run
+
+    tasks = {
+        'pendulum': (['pytzdata', 'python-dateutil'], task('pendulum')),
+        'pytzdata': ([], task('pytzdata')),
+        'python-dateutil': (['six'], task('python-dateutil')),
+        'six': ([], task('six')),
+        'requests': (['unknown'], task('requests')),
+    }
+
+    failures, skipped = Pool(4).run(tasks)
+
+    assert [] == failures
+    assert [] == skipped
+    assert 5 == len(done)
+    assert done.index('six') < done.index('python-dateutil')
+    assert done.index('python-dateutil') < done.index('pendulum')
+    assert done.index('pytzdata') < done.index('pendulum')
+
+
+def test_run_handles_cycles():
+    done = []
+
+    tasks = {
+        'foo': (['bar'], lambda: done.append('foo')),
+        'bar': (['foo'], lambda: done.append('bar')),
+    }
+
+    failures, skipped = Pool(2).run(tasks)
+
+    assert [] == failures
+    assert ['bar', 'foo'] == done
+
+
+def test_run_fails_fast():
+    reported = []
+
+    def fail():
+        raise Exception('Error while installing [six]')
+
+    tasks = {
+        'six': ([], fail),
+        'python-dateutil': (['six'], lambda: None),
+        'pendulum': (['python-dateutil'], lambda: None),
+    }
+
+    failures, skipped = Pool(2).run(
+        tasks,
+        callback=lambda name, result, error: reported.append((name, error))
+    )
+
+    assert 1 == len(failures)
+    assert 'six' == failures[0][0]
+    assert 'Error while installing [six]' == str(failures[0][1])
+    assert ['pendulum', 'python-dateutil'] == skipped
+    assert [('six', failures[0][1])] == reported
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+import io
+import os
+
+from poet.poet import Poet
+from poet.readme_cache import ReadmeCache
+
+
+def make_readme(directory, content):
+    path = os.path.join(directory, 'README.md')
+    with io.open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+    return path
+
+
+def test_convert_is_cached(tmp_dir, mocker):
+    cache = ReadmeCache(os.path.join(tmp_dir, 'cache'))
+    readme = make_readme(tmp_dir, u'# Poet')
+    converter = mocker.Mock(return_value=u'Poet\n====\n')
+
+    assert u'Poet\n====\n' == cache.convert(readme, converter)
+    assert u'Poet\n====\n' == cache.convert(readme, converter)
+    converter.assert_called_once_with(readme, 'rst')
+
+    # Changing the README invalidates the cached conversion
+    make_readme(tmp_dir, u'# Poet 2')
+    converter.return_value = u'Poet 2\n======\n'
+
+    assert u'Poet 2\n======\n' == cache.convert(readme, converter)
+    assert 2 == converter.call_count
+    assert 2 == len(os.listdir(cache.path))
+
+
+def test_readme_is_loaded_lazily(tmp_dir, mocker):
+    fixture = os.path.join(os.path.dirname(__file__), 'fixtures', 'poetry.toml')
+    with io.open(fixture, encoding='utf-8') as f:
+        config = f.read().replace("'README.rst'", "'README.md'")
+
+    path = os.path.join(tmp_dir, 'poetry.toml')
+    with io.open(path, 'w', encoding='utf-8') as f:
+        f.write(config)
+
+    make_readme(tmp_dir, u'# Poet')
+
+    pypandoc = mocker.patch('poet.poet.pypandoc')
+    pypandoc.convert_file.return_value = u'Poet\n====\n'
+
+    poet = Poet(path, readme_cache=ReadmeCache(os.path.join(tmp_dir, 'cache')))
+
+    assert 'pypoet' == poet.name
+    assert not pypandoc.convert_file.called
+
+    assert u'Poet\n====\n' == poet.readme
+    assert u'Poet\n====\n' == poet.readme
+    assert 1 == pypandoc.convert_file.call_count
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+import os
+import pytest
+import toml
+
+from poet import lock_file
+from poet.utils.helpers import template
+
+
+PACKAGES = [
+    {
+        'name': 'pendulum',
+        'version': '1.2.0',
+        'category': 'main',
+        'optional': False,
+        'checksum': [
+            'sha256:a97e3ed9557ac0c5c3742f21fa4d852d7a050dd9b1b517e993aebef2dd2eea52',
+            'sha256:641140a05f959b37a177866e263f6f53a53b711fae6355336ee832ec1a59da8a'
+        ],
+        'python': ['*'],
+        'dependencies': ['python-dateutil', 'pytzdata']
+    },
+    {
+        'name': 'python-dateutil',
+        'version': '2.6.0',
+        'category': 'main',
+        'optional': False,
+        'checksum': [],
+        'python': ['~2.7', '^3.5'],
+        'dependencies': []
+    },
+    {
+        'name': 'pytzdata',
+        'version': {'git': 'https://github.com/sdispater/pytzdata.git', 'rev': 'abcdef'},
+        'category': 'dev',
+        'optional': True,
+        'python': [],
+        'dependencies': []
+    }
+]
+
+
+@pytest.mark.parametrize('packages, features, fingerprint', [
+    ([], {}, None),
+    (PACKAGES, {}, None),
+    (PACKAGES, {'timezones': ['pytzdata', 'pendulum'], 'dates': ['pendulum']}, None),
+    (PACKAGES, {}, 'sha256:0123456789abcdef'),
+])
+def test_dumps_matches_template(packages, features, fingerprint, tmp_dir):
+    expected = template('poetry.lock').render(
+        name='pypoet', version='0.1.2',
+        packages=packages, features=features,
+        fingerprint=fingerprint
+    )
+    content = lock_file.dumps(
+        'pypoet', '0.1.2', packages, features, fingerprint=fingerprint
+    )
+
+    assert expected == content
+    assert toml.loads(expected) == lock_file.loads(content)
+
+    path = os.path.join(tmp_dir, 'poetry.lock')
+    with open(path, 'w') as f:
+        lock_file.dump(
+            f, 'pypoet', '0.1.2', packages, features, fingerprint=fingerprint
+        )
+
+    with open(path) as f:
+        assert content == f.read()
+
+
+def test_dumps_missing_attributes():
+    packages = [{
+        'name': 'pendulum',
+        'version': '1.3.0',
+        'category': 'main',
+        'optional': False
+    }]
+    expected = template('poetry.lock').render(
+        name='pypoet', version='0.1.2',
+        packages=packages, features={},
+        fingerprint=None
+    )
+    content = lock_file.dumps('pypoet', '0.1.2', packages)
+
+    assert expected == content
+    assert {
+        'name': 'pendulum',
+        'version': '1.3.0',
+        'category': 'main',
+        'optional': False,
+        'checksum': [],
+        'python': [],
+        'dependencies': []
+    } == lock_file.loads(content)['package'][0]
+
+
+def test_loads():
+    content = lock_file.dumps('pypoet', '0.1.2', PACKAGES, {'dates': ['pendulum']})
+    lock = lock_file.loads(content)
+
+    assert {'name': 'pypoet', 'version': '0.1.2'} == lock['root']
+    assert {'dates': ['pendulum']} == lock['features']
+    assert 3 == len(lock['package'])
+    assert PACKAGES[1] == lock['package'][1]
+    assert PACKAGES[2]['version'] == lock['package'][2]['version']
+    assert lock['package'][2]['optional'] is True
+
+
+def test_loads_falls_back_to_toml():
+    path = os.path.join(os.path.dirname(__file__), 'fixtures', 'poetry.lock')
+    with open(path) as f:
+        content = f.read()
+
+    assert toml.loads(content) == lock_file.loads(content)
+
+    content = lock_file.dumps('pypoet', '0.1.2', PACKAGES) + 'foo = 1\n'
+    assert toml.loads(content) == lock_file.loads(content)
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+import os
+import pytest
+
+from semantic_version import Spec, Version
+from poet.version_index import VersionIndex
+from poet.version_index_cache import VersionIndexCache
+
+
+RELEASES = [
+    '{}.{}.{}'.format(major, minor, patch)
+    for major in range(4)
+    for minor in range(12)
+    for patch in range(6)
+] + [
+    '0.0.3', '1.0', '2', '1.2.3b1', '1.2.3rc1', '2.0.0a1', '2.0.0.dev1',
+    '3.0.0-beta.2', 'not-a-version', '1.2.3.4'
+]
+
+
+def brute_force(spec):
+    coerced = []
+    for release in RELEASES:
+        try:
+            coerced.append((Version.coerce(release), release))
+        except ValueError:
+            continue
+
+    return [r for v, r in sorted(coerced, key=lambda c: c[0]) if spec.match(v)]
+
+
+@pytest.mark.parametrize('constraint', [
+    '*', '^1.2', '^1', '^0.2', '^0.0.3', '~1.2', '~1.2.3', '~=1.2', '~=1.2.3',
+    '==1.2', '==1.2.3', '!=1.2.3', '>1.2', '>=1.2.3', '<2', '<2.0.0', '<=1.2',
+    '>=1.2.3,<2.0.0', '>=1.2.3-rc1,<1.3', '<2.0.0-beta', '>3.0.0-alpha',
+    '>=1.5,<1.2',
+])
+def test_filter_and_select(constraint):
+    spec = Spec(constraint)
+    index = VersionIndex(RELEASES)
+    expected = brute_force(spec)
+
+    assert expected == index.filter(spec)
+    assert (expected[-1] if expected else None) == index.select(spec)
+
+
+def test_select_only_matches_versions_within_bounds(mocker):
+    spec = Spec('^1.2')
+    match = mocker.patch.object(spec, 'match', wraps=spec.match)
+    index = VersionIndex(RELEASES)
+
+    expected = brute_force(spec)
+    match.reset_mock()
+
+    assert expected[-1] == index.select(spec)
+    assert 10 > match.call_count
+
+    match.reset_mock()
+
+    assert expected == index.filter(spec)
+    assert len(RELEASES) / 3 > match.call_count
+
+
+def test_without_spec():
+    index = VersionIndex(['1.0.0', 'foo', '0.9.0', '1.0.0b1'])
+
+    assert ['0.9.0', '1.0.0b1', '1.0.0'] == index.filter()
+    assert ['0.9.0', '1.0.0b1', '1.0.0'] == index.releases
+    assert '1.0.0' == index.select()
+    assert 3 == len(index)
+    assert VersionIndex([]).select() is None
+
+
+def test_cache(tmp_dir, mocker):
+    cache = VersionIndexCache(tmp_dir)
+    index = cache.get('Pendulum', RELEASES)
+
+    assert index is cache.get('pendulum', list(reversed(RELEASES)))
+    assert ['pendulum.json'] == os.listdir(tmp_dir)
+
+    # Loaded from disk by another cache, without parsing versions
+    coerce = mocker.spy(Version, 'coerce')
+    loaded = VersionIndexCache(tmp_dir).get('pendulum', RELEASES)
+
+    assert loaded is not index
+    assert not coerce.called
+    assert index.releases == loaded.releases
+
+    spec = Spec('^1.2')
+    assert index.filter(spec) == loaded.filter(spec)
+    assert index.select(spec, stable=True) == loaded.select(spec, stable=True)
+    assert coerce.call_count < len(RELEASES) / 3
+
+    # Built again when the releases change
+    assert '4.0.0' == VersionIndexCache(tmp_dir).get('pendulum', RELEASES + ['4.0.0']).select()
+
+
+def test_select_stable():
+    index = VersionIndex(RELEASES)
+
+    assert '1.11.5' == index.select(Spec('^1.2'), stable=True)
+    assert '3.11.5' == index.select(stable=True)
+    assert index.select(Spec('==2.0.0-alpha.1'), stable=True) is None
+    assert ['1.2.3', '1.2.3.4', '1.2.4', '1.2.5'] == index.filter(Spec('>=1.2.3,<1.3'), stable=True)
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from semantic_version import Spec
+from poet.utils.lru_cache import LRUCache
 from poet.version_parser import VersionParser
 
 
@@ -14,3 +15,49 @@ def test_parse_constraints():
 def test_parse_stability():
     assert 'stable' == VersionParser.parse_stability('1.2.3')
     assert 'dev' == VersionParser.parse_stability('1.2.3b1')
+
+
+def test_parsed_constraints_are_bounded(mocker):
+    VersionParser.clear_cache()
+    mocker.patch.object(VersionParser, '_constraints', LRUCache(2))
+    parser = VersionParser()
+
+    caret = parser.parse_constraints('^1.2')
+    tilde = parser.parse_constraints('~1.2.3')
+
+    assert caret is parser.parse_constraints('^1.2')
+
+    # "~1.2.3" is the least recently used constraint
+    parser.parse_constraints('==1.0.0')
+
+    assert caret is parser.parse_constraints('^1.2')
+    assert tilde is not parser.parse_constraints('~1.2.3')
+    assert Spec('~1.2.3') == tilde
+    assert {'hits': 2, 'misses': 4, 'size': 2, 'maxsize': 2} == VersionParser.cache_stats()
+
+
+def test_cache_stats():
+    VersionParser.clear_cache()
+    parser = VersionParser()
+
+    parser.parse_constraints('^1.2')
+    parser.parse_constraints('^1.2')
+    parser.parse_constraints('>=1.2,<2')
+
+    assert {'hits': 1, 'misses': 2, 'size': 2, 'maxsize': 2048} == VersionParser.cache_stats()
+
+
+def test_lru_cache():
+    cache = LRUCache(2)
+
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert 1 == cache.get('a')
+
+    # "b" is the least recently used entry
+    cache.set('c', 3)
+
+    assert 'b' not in cache
+    assert cache.get('b') is None
+    assert 3 == cache.get('c')
+    assert {'hits': 2, 'misses': 1, 'size': 2, 'maxsize': 2} == cache.stats()
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+
+from poet.version_index import VersionIndex
+from poet.version_selector import VersionSelector
+
+
+class Repository(object):
+
+    def __init__(self, releases):
+        self._releases = releases
+        self.lookups = 0
+
+    def version_index(self, name):
+        self.lookups += 1
+
+        return VersionIndex(self._releases.get(name, []))
+
+
+def test_find_best_candidate():
+    repository = Repository({
+        'pendulum': ['1.2.0', '1.3.0', '2.0.0b1', '1.3.1'],
+        'pytzdata': ['2017.2', '2018.1a1']
+    })
+    selector = VersionSelector(repository)
+
+    package = selector.find_best_candidate('pendulum')
+    assert 'pendulum' == package.name
+    assert '1.3.1' == package.pretty_version
+
+    assert '2.0.0b1' == selector.find_best_candidate('pendulum', preferred_stability='dev').pretty_version
+    assert '1.3.0' == selector.find_best_candidate('pendulum', '~1.3.0,<1.3.1').pretty_version
+    assert '2.0.0b1' == selector.find_best_candidate('pendulum', '>=2.0.0-a').pretty_version
+    assert '2018.1a1' == selector.find_best_candidate('pytzdata', '>2017.2').pretty_version
+    assert selector.find_best_candidate('pendulum', '^3.0') is False
+    assert selector.find_best_candidate('missing') is False
+
+    # Indexes are kept across calls
+    assert 3 == repository.lookups
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+import os
+import time
+
+from poet.wheel_cache import WheelCache
+
+
+def make_archive(directory, name, content):
+    path = os.path.join(directory, name)
+    with open(path, 'wb') as f:
+        f.write(content)
+
+    return path
+
+
+def test_add_and_get(tmp_dir):
+    cache = WheelCache(os.path.join(tmp_dir, 'cache'))
+    archive = make_archive(tmp_dir, 'pendulum-1.2.0-py3-none-any.whl', b'pendulum')
+
+    checksum = cache.add(archive)
+
+    assert 'sha256:{}'.format(WheelCache.hash(archive)) == checksum
+
+    path = cache.get(checksum)
+    assert 'pendulum-1.2.0-py3-none-any.whl' == os.path.basename(path)
+    assert path != archive
+
+    assert cache.get('sha256:unknown') is None
+    assert cache.get('md5:unknown') is None
+    assert path == cache.find(['sha256:unknown', checksum])
+
+
+def test_prune_removes_least_recently_used(tmp_dir):
+    cache = WheelCache(os.path.join(tmp_dir, 'cache'), max_size=100)
+
+    first = cache.add(make_archive(tmp_dir, 'first.whl', b'a' * 40))
+    second = cache.add(make_archive(tmp_dir, 'second.whl', b'b' * 40))
+
+    # Making sure the first archive is the most recently used
+    past = time.time() - 10
+    os.utime(os.path.dirname(cache.get(second)), (past, past))
+    cache.get(first)
+
+    third = cache.add(make_archive(tmp_dir, 'third.whl', b'c' * 40))
+
+    # Adding archives does not prune the cache
+    assert 120 == cache.size()
+
+    removed = cache.prune()
+
+    assert [second] == [e[0] for e in removed]
+    assert cache.get(first) is not None
+    assert cache.get(second) is None
+    assert cache.get(third) is not None
+    assert 80 == cache.size()
+
+
+def test_prune_keeps_given_checksums(tmp_dir):
+    cache = WheelCache(os.path.join(tmp_dir, 'cache'), max_size=50)
+
+    first = cache.add(make_archive(tmp_dir, 'first.whl', b'a' * 40))
+    second = cache.add(make_archive(tmp_dir, 'second.whl', b'b' * 40))
+
+    past = time.time() - 10
+    os.utime(os.path.dirname(cache.get(first)), (past, past))
+    os.utime(os.path.dirname(cache.get(second)), (past + 1, past + 1))
+
+    removed = cache.prune(keep=set([first]))
+
+    assert [second] == [e[0] for e in removed]
+    assert cache.get(first) is not None
+
+
+def test_clear(tmp_dir):
+    cache = WheelCache(os.path.join(tmp_dir, 'cache'))
+    cache.add(make_archive(tmp_dir, 'first.whl', b'a'))
+
+    removed = cache.clear()
+
+    assert 1 == len(removed)
+    assert [] == cache.entries()
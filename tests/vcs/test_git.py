@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+import os
+import pytest
+import subprocess
+import threading
+
+from poet.vcs import Git
+
+
+def test_resolve_branches_and_tags(git_repo):
+    first = git_repo.commit('first')
+    git_repo.git('tag', '-a', '-m', 'Version 0.1', '0.1')
+    git_repo.git('tag', 'light')
+    git_repo.git('branch', 'stable')
+    second = git_repo.commit('second')
+
+    git = Git()
+    url = 'git+' + git_repo.url
+
+    assert second == git.resolve(url, 'HEAD')
+    assert second == git.resolve(url, git_repo.git('symbolic-ref', '--short', 'HEAD'))
+    assert first == git.resolve(url, 'stable')
+    assert first == git.resolve(url, '0.1')
+    assert first == git.resolve(url, 'light')
+
+
+def test_resolve_commits(git_repo):
+    first = git_repo.commit('first')
+    git_repo.commit('second')
+
+    git = Git()
+
+    assert first == git.resolve(git_repo.url, first)
+    assert first == git.resolve(git_repo.url, first[:7])
+
+
+def test_resolve_unknown_revision(git_repo):
+    git_repo.commit('first')
+
+    with pytest.raises(subprocess.CalledProcessError):
+        Git().resolve(git_repo.url, 'unknown')
+
+
+def test_resolve_does_not_change_directory(git_repo):
+    first = git_repo.commit('first')
+    git_repo.commit('second')
+
+    cwd = os.getcwd()
+    git = Git()
+    results = []
+
+    def resolve():
+        results.append(git.resolve(git_repo.url, first[:7]))
+
+    threads = [threading.Thread(target=resolve) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert [first] * 4 == results
+    assert cwd == os.getcwd()
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from poet.vcs import GitConfig
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    GitConfig.clear()
+
+    yield
+
+    GitConfig.clear()
+
+
+def test_get_reads_requested_keys_once(git_repo, mocker):
+    git_repo.git('config', 'user.name', 'Sébastien Eustace')
+
+    call = mocker.spy(GitConfig, '_read')
+    config = GitConfig(environ={}, cwd=git_repo.path)
+
+    assert u'Sébastien Eustace' == config.get('user.name')
+    assert 'foo' == config.get('poet.unknown', 'foo')
+    assert 'poet.unknown' not in config
+
+    with pytest.raises(KeyError):
+        config['poet.unknown']
+
+    # Values are cached per process
+    assert u'Sébastien Eustace' == GitConfig(environ={}, cwd=git_repo.path)['user.name']
+    assert 2 == call.call_count
+
+
+def test_get_does_not_call_git_for_supplied_values(mocker):
+    call = mocker.patch('poet.vcs.git_config.call')
+    config = GitConfig(
+        overrides={'user.name': 'Poet', 'user.email': None},
+        environ={'GIT_AUTHOR_EMAIL': 'poet@example.com'}
+    )
+
+    assert 'Poet' == config.get('user.name')
+    assert 'poet@example.com' == config.get('user.email')
+    assert not call.called
+
+
+def test_email_is_only_a_fallback(git_repo):
+    git_repo.git('config', 'user.email', 'poet@example.com')
+
+    environ = {'EMAIL': 'fallback@example.com'}
+    config = GitConfig(environ=environ, cwd=git_repo.path)
+
+    assert 'poet@example.com' == config.get('user.email')
+
+    environ['GIT_AUTHOR_EMAIL'] = 'author@example.com'
+    assert 'author@example.com' == config.get('user.email')
+
+
+def test_email_fallback(mocker):
+    mocker.patch('poet.vcs.git_config.call', side_effect=OSError)
+    config = GitConfig(environ={'EMAIL': 'fallback@example.com'})
+
+    assert 'fallback@example.com' == config.get('user.email')
+    assert config.get('user.name') is None
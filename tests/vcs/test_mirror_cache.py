@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+import os
+import pytest
+import threading
+import time
+
+from poet.vcs import Git, MirrorCache
+from poet.vcs.mirror_cache import LockError
+
+
+def test_mirror(tmp_dir, git_repo):
+    first = git_repo.commit('first')
+
+    cache = MirrorCache(tmp_dir)
+    mirror = cache.mirror('git+' + git_repo.url)
+
+    assert os.path.dirname(mirror) == tmp_dir
+    assert [mirror] == [e[0] for e in cache.entries()]
+
+    git = Git(mirrors=cache)
+    assert first == git.resolve(git_repo.url, 'HEAD')
+
+    # Mirrors are only fetched once per cache
+    git_repo.commit('second')
+    assert mirror == cache.mirror(git_repo.url)
+    assert first == git.resolve(git_repo.url, 'HEAD')
+
+
+def test_mirror_fetches_new_objects(tmp_dir, git_repo):
+    git_repo.commit('first')
+    MirrorCache(tmp_dir).mirror(git_repo.url)
+
+    second = git_repo.commit('second')
+    git_repo.git('tag', '0.2')
+
+    git = Git(mirrors=MirrorCache(tmp_dir))
+
+    assert second == git.resolve(git_repo.url, 'HEAD')
+    assert second == git.resolve(git_repo.url, '0.2')
+    assert second == git.resolve(git_repo.url, second[:7])
+
+
+def test_mirror_concurrently(tmp_dir, git_repo):
+    git_repo.commit('first')
+
+    cache = MirrorCache(tmp_dir)
+    mirrors = []
+
+    def mirror():
+        mirrors.append(MirrorCache(tmp_dir).mirror(git_repo.url))
+
+    threads = [threading.Thread(target=mirror) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert 4 == len(mirrors)
+    assert 1 == len(set(mirrors))
+    assert 1 == len(cache.entries())
+    assert [mirrors[0]] == [
+        os.path.join(tmp_dir, f) for f in os.listdir(tmp_dir)
+    ]
+
+
+def test_mirror_lock(tmp_dir):
+    cache = MirrorCache(tmp_dir)
+    directory = os.path.join(tmp_dir, 'foo.git')
+
+    with cache._lock(directory):
+        with pytest.raises(LockError):
+            with cache._lock(directory, timeout=0):
+                pass
+
+    with cache._lock(directory, timeout=0):
+        pass
+
+
+def test_mirror_lock_taken_over(tmp_dir):
+    cache = MirrorCache(tmp_dir)
+    directory = os.path.join(tmp_dir, 'foo.git')
+    lock_file = directory + '.lock'
+
+    with cache._lock(directory):
+        # Still held after the time to wait for it
+        past = time.time() - MirrorCache.LOCK_TIMEOUT - 10
+        os.utime(lock_file, (past, past))
+
+        with pytest.raises(LockError):
+            with cache._lock(directory, timeout=0):
+                pass
+
+        # Considered abandoned and taken over by another process
+        past = time.time() - MirrorCache.STALE_LOCK_AGE - 10
+        os.utime(lock_file, (past, past))
+
+        with cache._lock(directory, timeout=0):
+            with open(lock_file, 'rb') as f:
+                token = f.read()
+
+        # Locked again by another process
+        with open(lock_file, 'wb') as f:
+            f.write(token)
+
+    # The lock of the other process is kept
+    with open(lock_file, 'rb') as f:
+        assert token == f.read()
+
+
+def test_evict(tmp_dir, git_repo):
+    git_repo.commit('first')
+
+    cache = MirrorCache(tmp_dir, max_age=3600)
+    mirror = cache.mirror(git_repo.url)
+
+    assert [] == cache.evict()
+
+    os.utime(mirror, (0, 0))
+
+    with cache._lock(mirror):
+        # Mirrors in use are kept
+        assert [] == cache.evict()
+
+    assert [(mirror, 0)] == cache.evict()
+    assert not os.path.exists(mirror)
+    assert [] == cache.entries()
+
+
+def test_mirror_evicts_old_mirrors(tmp_dir, git_repo):
+    git_repo.commit('first')
+
+    old = MirrorCache(tmp_dir).mirror(git_repo.url)
+    os.utime(old, (0, 0))
+
+    mirror = MirrorCache(tmp_dir).mirror(git_repo.url + '/')
+
+    assert [mirror] == [e[0] for e in MirrorCache(tmp_dir).entries()]